@@ -0,0 +1,586 @@
+import os
+import time
+import random
+import asyncio
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from consistency_test import (
+    db_config, ASYNC_BATCH_SIZE, ASYNC_LINGER, ASYNC_APPLY_DELAY, NEWER_VERSION_CONDITION,
+    ConsistencyBenchmark, ensure_projection_version, coalesce_latest, new_async_metrics,
+    record_batch_metrics, print_async_metrics,
+)
+from benchmark import drivers
+from benchmark.stats import summarize
+
+# ==========================================
+# asyncio 버전 ConsistencyBenchmark
+# ==========================================
+# ConsistencyBenchmark 는 동기 pymysql + self.cursor 하나라, 한 프로세스에서 동시 클라이언트 수천 개를 흉내낼 수 없습니다.
+# 여기서는 전략 A/B/C 와 check_consistency 를 코루틴으로 옮기고 커넥션 풀을 공유하는 "스캐너" 태스크 수천 개로 부하를 겁니다.
+#
+#   mysql  : aiomysql 커넥션 풀
+#   sqlite : 서버 없이 돌려보는 대체 경로. sqlite3 커넥션 풀 + asyncio.to_thread
+#            (SLEEP() 은 파이썬 함수로 등록해 MySQL 과 같은 SQL 로 부하 주입)
+#
+#   python async_consistency.py --backend sqlite --scanners 1000 --pool-size 20 --duration 10
+#   python async_consistency.py --backend mysql --scanners 2000 --pool-size 50 --compare-threads 100
+
+STRATEGIES = {
+    'sync': 'Strategy A: 동기 트랜잭션',
+    'trigger': 'Strategy B: DB 트리거',
+    'async': 'Strategy C: 비동기 큐 (Async)',
+}
+STATUSES = ['집화완료', '터미널입고', '배송출발', '배송완료', '수취확인']
+
+DEFAULT_SCANNERS = 1000      # 동시 스캐너(코루틴) 수
+DEFAULT_POOL_SIZE = 20       # 공유 커넥션 수
+DEFAULT_DURATION = 10.0      # 전략별 실행 시간(초)
+DEFAULT_THINK_TIME = 0.5     # 스캐너가 다음 스캔까지 쉬는 시간(초)
+LOAD_DELAY = 0.05            # 🔥[부하 주입] consistency_test 와 같은 DB 지연(초)
+DEFAULT_SQLITE_PATH = os.path.join(os.path.dirname(os.path.abspath(drivers.__file__)), 'consistency_async.sqlite3')
+DEFAULT_SQLITE_SHIPMENTS = 5000
+
+INSERT_UPDATE_SQL = "INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, %s)"
+
+# 전략 A: 더 새로운 버전일 때만 반영 + 부하 주입 (두 DB 공통 SQL)
+SYNC_UPDATE_SQL = """
+    UPDATE shipments
+    SET current_status = %s, last_updated_at = %s, last_update_id = %s
+    WHERE shipment_id = %s
+      AND (last_update_id IS NULL OR (%s, %s) > (last_updated_at, last_update_id))
+      AND SLEEP(%s) = 0
+"""
+
+TRIGGER_SQL = {
+    'mysql': f"""
+        CREATE TRIGGER after_shipment_update
+        AFTER INSERT ON shipment_updates
+        FOR EACH ROW
+        BEGIN
+            UPDATE shipments
+            SET current_status = NEW.status_code, last_updated_at = NEW.timestamp, last_update_id = NEW.update_id
+            WHERE shipment_id = NEW.shipment_id
+              AND (last_update_id IS NULL OR (NEW.timestamp, NEW.update_id) > (last_updated_at, last_update_id));
+            DO SLEEP({LOAD_DELAY});
+        END
+    """,
+    'sqlite': f"""
+        CREATE TRIGGER after_shipment_update
+        AFTER INSERT ON shipment_updates
+        FOR EACH ROW
+        BEGIN
+            UPDATE shipments
+            SET current_status = NEW.status_code, last_updated_at = NEW.timestamp, last_update_id = NEW.update_id
+            WHERE shipment_id = NEW.shipment_id
+              AND (last_update_id IS NULL OR (NEW.timestamp, NEW.update_id) > (last_updated_at, last_update_id));
+            SELECT SLEEP({LOAD_DELAY});
+        END
+    """,
+}
+
+SQLITE_BACKFILL_VERSION = """
+    UPDATE shipments
+    SET current_status = v.status_code, last_updated_at = v.timestamp, last_update_id = v.update_id
+    FROM (
+        SELECT shipment_id, status_code, timestamp, update_id
+        FROM (
+            SELECT shipment_id, status_code, timestamp, update_id,
+                   ROW_NUMBER() OVER (PARTITION BY shipment_id ORDER BY timestamp DESC, update_id DESC) AS rn
+            FROM shipment_updates
+        )
+        WHERE rn = 1
+    ) AS v
+    WHERE v.shipment_id = shipments.shipment_id
+"""
+
+def status_batch_sql(dialect, latest):
+    """화물별 (상태, 버전)을 조건부 UPDATE 1문장으로 (consistency_test.apply_status_batch 의 dialect 별 버전)"""
+    rows = " UNION ALL ".join(
+        ["SELECT %s AS shipment_id, %s AS status_code, %s AS timestamp, %s AS update_id"] * len(latest)
+    )
+    params = [value for s_id, (status, (ts, update_id)) in latest.items() for value in (s_id, status, ts, update_id)]
+    if dialect == 'mysql':
+        sql = f"""
+            UPDATE shipments s
+            JOIN ({rows}) v ON v.shipment_id = s.shipment_id
+            SET s.current_status = v.status_code, s.last_updated_at = v.timestamp, s.last_update_id = v.update_id
+            WHERE {NEWER_VERSION_CONDITION}
+        """
+    else:
+        sql = f"""
+            UPDATE shipments AS s
+            SET current_status = v.status_code, last_updated_at = v.timestamp, last_update_id = v.update_id
+            FROM ({rows}) AS v
+            WHERE v.shipment_id = s.shipment_id AND {NEWER_VERSION_CONDITION}
+        """
+    return sql, params
+
+class QueryResult:
+    def __init__(self, rows, lastrowid, rowcount):
+        self.rows = rows
+        self.lastrowid = lastrowid
+        self.rowcount = rowcount
+
+# ---------------------------------------------------------
+# 커넥션 풀 (aiomysql / sqlite3 + to_thread)
+# ---------------------------------------------------------
+class AioMySQLPool:
+    dialect = 'mysql'
+
+    def __init__(self, size):
+        self.size = size
+        self.pool = None
+
+    async def open(self):
+        import aiomysql
+        import pymysql
+        # 버전 컬럼 준비는 잠깐 쓰고 닫는 동기 커넥션으로 한 번만
+        conn = pymysql.connect(**db_config)
+        try:
+            with conn.cursor() as cursor:
+                ensure_projection_version(cursor)
+        finally:
+            conn.close()
+        self.pool = await aiomysql.create_pool(minsize=1, maxsize=self.size, **db_config)
+
+    def session(self):
+        return _AioMySQLSession(self.pool)
+
+    async def close(self):
+        self.pool.close()
+        await self.pool.wait_closed()
+
+class _AioMySQLSession:
+    def __init__(self, pool):
+        self.pool = pool
+        self.conn = None
+
+    async def __aenter__(self):
+        self.conn = await self.pool.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.pool.release(self.conn)
+
+    async def execute(self, sql, params=None):
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, params)
+            rows = await cur.fetchall() if cur.description else ()
+            return QueryResult(rows, cur.lastrowid, cur.rowcount)
+
+    async def begin(self):
+        await self.conn.begin()
+
+    async def commit(self):
+        await self.conn.commit()
+
+    async def rollback(self):
+        await self.conn.rollback()
+
+def _sqlite_sleep(seconds):
+    time.sleep(seconds)
+    return 0
+
+class AsyncSQLitePool:
+    """오프라인 실행용 대체 풀: sqlite3 커넥션 size 개를 돌려쓰고, 쿼리는 asyncio.to_thread 로 실행"""
+    dialect = 'sqlite'
+
+    def __init__(self, size, path=DEFAULT_SQLITE_PATH, shipments=DEFAULT_SQLITE_SHIPMENTS):
+        self.size = size
+        self.path = path
+        self.shipments = shipments
+        self.idle = None
+        self.write_lock = None    # SQLite 는 쓰기 1개만 가능 -> busy 재시도 경쟁 대신 이벤트 루프에서 순서대로 대기
+        self.conns = []
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.create_function("SLEEP", 1, _sqlite_sleep)
+        return conn
+
+    def _prepare(self):
+        drivers.SQLiteDriver(self.path, self.shipments).prepare()
+        conn = self._connect()
+        try:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(shipments)")]
+            if 'last_update_id' not in columns:
+                conn.execute("ALTER TABLE shipments ADD COLUMN last_update_id INTEGER")
+                conn.execute(SQLITE_BACKFILL_VERSION)
+                print("✅ [Setup] shipments.last_update_id (프로젝션 버전) 컬럼 추가 및 채움 완료")
+        finally:
+            conn.close()
+
+    async def open(self):
+        await asyncio.to_thread(self._prepare)
+        # to_thread 스레드 수 = 커넥션 수 (기본 executor 는 CPU 수에 묶여 풀을 다 못 씀)
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=self.size))
+        self.idle = asyncio.Queue()
+        self.write_lock = asyncio.Lock()
+        for _ in range(self.size):
+            conn = self._connect()
+            self.conns.append(conn)
+            self.idle.put_nowait(conn)
+
+    def session(self):
+        return _SQLiteSession(self)
+
+    async def close(self):
+        for conn in self.conns:
+            conn.close()
+
+class _SQLiteSession:
+    def __init__(self, pool):
+        self.pool = pool
+        self.conn = None
+        self.in_transaction = False
+
+    async def __aenter__(self):
+        self.conn = await self.pool.idle.get()
+        return self
+
+    async def __aexit__(self, *exc):
+        if self.in_transaction:
+            await self.rollback()
+        self.pool.idle.put_nowait(self.conn)
+
+    def _execute(self, sql, params):
+        cur = self.conn.execute(sql.replace('%s', '?'), params or ())
+        return QueryResult(cur.fetchall(), cur.lastrowid, cur.rowcount)
+
+    async def execute(self, sql, params=None):
+        if self.in_transaction or sql.lstrip().upper().startswith('SELECT'):
+            return await asyncio.to_thread(self._execute, sql, params)
+        async with self.pool.write_lock:      # 트랜잭션 밖의 단일 쓰기 (autocommit)
+            return await asyncio.to_thread(self._execute, sql, params)
+
+    async def begin(self):
+        await self.pool.write_lock.acquire()
+        self.in_transaction = True
+        try:
+            await self.execute("BEGIN IMMEDIATE")
+        except Exception:
+            self._release()
+            raise
+
+    def _release(self):
+        # begin 실패 후 호출자가 rollback 해도 두 번 풀지 않도록
+        if not self.in_transaction:
+            return
+        self.in_transaction = False
+        self.pool.write_lock.release()
+
+    async def commit(self):
+        try:
+            await self.execute("COMMIT")
+        finally:
+            self._release()
+
+    async def rollback(self):
+        try:
+            if self.conn.in_transaction:
+                await self.execute("ROLLBACK")
+        finally:
+            self._release()
+
+# ---------------------------------------------------------
+# 전략 (코루틴)
+# ---------------------------------------------------------
+class AsyncConsistencyBenchmark:
+    def __init__(self, pool, batch_size=ASYNC_BATCH_SIZE, linger=ASYNC_LINGER):
+        self.pool = pool
+        self.dialect = pool.dialect
+        self.batch_size = batch_size
+        self.linger = linger
+        self.shipment_ids = []
+        self.msg_queue = None
+        self.worker_task = None
+        self.async_metrics = new_async_metrics()
+        self.errors = 0
+
+    async def setup(self, limit=100):
+        await self.pool.open()
+        async with self.pool.session() as db:
+            result = await db.execute("SELECT shipment_id FROM shipments LIMIT %s", (limit,))
+        self.shipment_ids = [row[0] for row in result.rows]
+        self.msg_queue = asyncio.Queue()
+        self.worker_task = asyncio.create_task(self._async_worker())
+
+    def _get_random_target(self):
+        return random.choice(self.shipment_ids), random.choice(STATUSES)
+
+    async def _insert_update(self, db, s_id, status, notes):
+        ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')     # 두 DB 모두 같은 문자열 형식으로 비교
+        result = await db.execute(INSERT_UPDATE_SQL, (s_id, status, notes, ts))
+        return ts, result.lastrowid
+
+    async def strategy_sync_transaction(self):
+        s_id, status = self._get_random_target()
+        start_time = time.perf_counter()
+        async with self.pool.session() as db:
+            try:
+                await db.begin()
+                ts, update_id = await self._insert_update(db, s_id, status, "Async Sync Update")
+                await db.execute(SYNC_UPDATE_SQL, (status, ts, update_id, s_id, ts, update_id, LOAD_DELAY))
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+        return time.perf_counter() - start_time, s_id, status
+
+    async def setup_trigger(self):
+        async with self.pool.session() as db:
+            await db.execute("DROP TRIGGER IF EXISTS after_shipment_update")
+            await db.execute(TRIGGER_SQL[self.dialect])
+        print("✅ [Setup] DB 트리거 (with Latency) 생성 완료")
+
+    async def teardown_trigger(self):
+        async with self.pool.session() as db:
+            await db.execute("DROP TRIGGER IF EXISTS after_shipment_update")
+        print("🧹 [Cleanup] DB 트리거 삭제 완료")
+
+    async def strategy_db_trigger(self):
+        s_id, status = self._get_random_target()
+        start_time = time.perf_counter()
+        async with self.pool.session() as db:
+            await self._insert_update(db, s_id, status, "Async Trigger Update")
+        return time.perf_counter() - start_time, s_id, status
+
+    async def strategy_async_queue(self):
+        s_id, status = self._get_random_target()
+        start_time = time.perf_counter()
+        async with self.pool.session() as db:
+            version = await self._insert_update(db, s_id, status, "Async Queue Update")
+        self.msg_queue.put_nowait((s_id, status, time.perf_counter(), version))
+        return time.perf_counter() - start_time, s_id, status
+
+    async def _drain_batch(self):
+        batch = [await self.msg_queue.get()]
+        deadline = time.perf_counter() + self.linger
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining > 0:
+                    batch.append(await asyncio.wait_for(self.msg_queue.get(), remaining))
+                else:
+                    batch.append(self.msg_queue.get_nowait())
+            except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                break
+        return batch
+
+    async def _async_worker(self):
+        while True:
+            batch = await self._drain_batch()
+            self.async_metrics['queue_depth'].append(len(batch) + self.msg_queue.qsize())
+            latest = coalesce_latest(batch)
+            sql, params = status_batch_sql(self.dialect, latest)
+            try:
+                async with self.pool.session() as db:
+                    try:
+                        await db.begin()
+                        # 🔥[부하 주입] 반영 트랜잭션 1회당 지연
+                        await db.execute("SELECT SLEEP(%s)", (ASYNC_APPLY_DELAY,))
+                        result = await db.execute(sql, params)
+                        await db.commit()
+                    except Exception:
+                        await db.rollback()
+                        raise
+                record_batch_metrics(self.async_metrics, batch, latest, result.rowcount)
+            except Exception as e:
+                print(f"Worker Error: {e}")
+            finally:
+                for _ in batch:
+                    self.msg_queue.task_done()
+
+    async def check_consistency(self, s_id, expected_status):
+        async with self.pool.session() as db:
+            result = await db.execute("SELECT current_status FROM shipments WHERE shipment_id = %s", (s_id,))
+        return result.rows[0][0] == expected_status
+
+    async def run_scanners(self, strategy_name, strategy_func, scanners, duration, think_time,
+                           setup_func=None, teardown_func=None):
+        """스캐너 scanners 개가 duration 초 동안 '쓰기 -> 즉시 조회'를 반복"""
+        print(f"\n🚀 [Async: {strategy_name}] 스캐너 {scanners}개 / 풀 {self.pool.size}개 / {duration}초...")
+        if setup_func: await setup_func()
+
+        loop = asyncio.get_running_loop()
+        latencies, loop_lag = [], []
+        counts = {'events': 0, 'stale': 0}
+        deadline = loop.time() + duration
+        errors_before = self.errors
+
+        async def scanner():
+            await asyncio.sleep(random.random() * think_time)     # 시작 시점 분산
+            while loop.time() < deadline:
+                try:
+                    latency, s_id, expected = await strategy_func()
+                except Exception as e:
+                    self.errors += 1
+                    print(f"Error: {e}")
+                else:
+                    latencies.append(int(latency * 1e9))
+                    counts['events'] += 1
+                    if not await self.check_consistency(s_id, expected):
+                        counts['stale'] += 1
+                if think_time:
+                    await asyncio.sleep(think_time)
+
+        async def watch_loop():
+            # 이벤트 루프가 얼마나 밀리는지: 10ms sleep 이 실제로 얼마나 늦게 깨어나는가
+            while loop.time() < deadline:
+                t0 = loop.time()
+                await asyncio.sleep(0.01)
+                loop_lag.append(int((loop.time() - t0 - 0.01) * 1e9))
+
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(watch_loop(), *(scanner() for _ in range(scanners)))
+        finally:
+            if teardown_func: await teardown_func()
+        elapsed = time.perf_counter() - started
+
+        return {
+            'mode': 'asyncio',
+            'strategy': strategy_name,
+            'clients': scanners,
+            'events': counts['events'],
+            'elapsed': elapsed,
+            'stale': counts['stale'],
+            'errors': self.errors - errors_before,
+            'latency': summarize(latencies),
+            'loop_lag': summarize(loop_lag),
+        }
+
+    async def close(self):
+        if self.worker_task:
+            await self.msg_queue.join()
+            self.worker_task.cancel()
+        await self.pool.close()
+
+# ---------------------------------------------------------
+# 비교 기준: 스레드 + 동기 ConsistencyBenchmark (MySQL)
+# ---------------------------------------------------------
+THREAD_METHODS = {
+    'sync': 'strategy_sync_transaction',
+    'trigger': 'strategy_db_trigger',
+    'async': 'strategy_async_queue',
+}
+
+def run_threads(name, threads, duration, think_time):
+    """스레드마다 전용 커넥션(ConsistencyBenchmark)으로 같은 '쓰기 -> 즉시 조회' 루프"""
+    main = ConsistencyBenchmark()
+    if name == 'trigger':
+        main.setup_trigger()
+    benches = [ConsistencyBenchmark(msg_queue=main.msg_queue, start_worker=False, shipment_ids=main.shipment_ids)
+               for _ in range(threads)]
+    lock = threading.Lock()
+    latencies, counts = [], {'events': 0, 'stale': 0, 'errors': 0}
+    deadline = time.perf_counter() + duration
+
+    def loop(bench):
+        strategy_func = getattr(bench, THREAD_METHODS[name])
+        time.sleep(random.random() * think_time)
+        while time.perf_counter() < deadline:
+            try:
+                latency, s_id, expected = strategy_func()
+            except Exception:
+                with lock:
+                    counts['errors'] += 1
+            else:
+                stale = not bench.check_consistency(s_id, expected)
+                with lock:
+                    latencies.append(int(latency * 1e9))
+                    counts['events'] += 1
+                    counts['stale'] += stale
+            if think_time:
+                time.sleep(think_time)
+
+    workers = [threading.Thread(target=loop, args=(bench,)) for bench in benches]
+    started = time.perf_counter()
+    try:
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+    finally:
+        elapsed = time.perf_counter() - started
+        if name == 'trigger':
+            main.teardown_trigger()
+        main.msg_queue.join()
+        for bench in benches:
+            bench.close()
+        main.close()
+    return {
+        'mode': 'threads',
+        'strategy': STRATEGIES[name],
+        'clients': threads,
+        'events': counts['events'],
+        'elapsed': elapsed,
+        'stale': counts['stale'],
+        'errors': counts['errors'],
+        'latency': summarize(latencies),
+        'loop_lag': {'n': 0},
+    }
+
+def print_results(results):
+    print(f"\n📊 동시 클라이언트 비교 (지연 단위 ms)")
+    print(f"{'mode':<8} {'strategy':<28} {'clients':>8} {'events/s':>9} {'p50':>8} {'p99':>8} "
+          f"{'직후 불일치':>10} {'errors':>7} {'loop lag p99':>13}")
+    for r in results:
+        lat = r['latency']
+        if not lat['n']:
+            print(f"{r['mode']:<8} {r['strategy']:<28} {r['clients']:>8} {'-':>9}")
+            continue
+        stale = r['stale'] / r['events'] if r['events'] else 0
+        lag = f"{r['loop_lag']['p99_ms']:.1f}" if r['loop_lag']['n'] else '-'
+        print(f"{r['mode']:<8} {r['strategy']:<28} {r['clients']:>8} {r['events'] / r['elapsed']:>9.1f} "
+              f"{lat['p50_ms']:>8.1f} {lat['p99_ms']:>8.1f} {stale:>10.1%} {r['errors']:>7} {lag:>13}")
+
+async def run_async(args, names):
+    pool = AioMySQLPool(args.pool_size) if args.backend == 'mysql' else \
+        AsyncSQLitePool(args.pool_size, args.sqlite_path, args.sqlite_shipments)
+    bench = AsyncConsistencyBenchmark(pool)
+    await bench.setup()
+    results = []
+    try:
+        for name in names:
+            kwargs = {}
+            if name == 'trigger':
+                kwargs = {'setup_func': bench.setup_trigger, 'teardown_func': bench.teardown_trigger}
+            strategy_func = getattr(bench, THREAD_METHODS[name])
+            results.append(await bench.run_scanners(STRATEGIES[name], strategy_func, args.scanners,
+                                                    args.duration, args.think_time, **kwargs))
+            if name == 'async':
+                print("⏳ 비동기 잔여 작업 처리 대기 중...")
+                await bench.msg_queue.join()
+                print_async_metrics(bench.async_metrics, f"asyncio 워커, batch_size={bench.batch_size}")
+    finally:
+        await bench.close()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="asyncio 동시 스캐너로 전략 A/B/C 비교 (aiomysql / SQLite 대체)")
+    parser.add_argument("--backend", choices=('mysql', 'sqlite'), default='mysql')
+    parser.add_argument("--strategy", nargs='+', choices=list(STRATEGIES), default=list(STRATEGIES))
+    parser.add_argument("--scanners", type=int, default=DEFAULT_SCANNERS, help="동시 스캐너(코루틴) 수")
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE, help="공유 커넥션 수")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="전략별 실행 시간(초)")
+    parser.add_argument("--think-time", type=float, default=DEFAULT_THINK_TIME, help="스캔 간격(초)")
+    parser.add_argument("--compare-threads", type=int, metavar='N',
+                        help="같은 전략을 스레드 N개 + 동기 ConsistencyBenchmark 로도 실행해 비교 (mysql)")
+    parser.add_argument("--sqlite-path", default=DEFAULT_SQLITE_PATH)
+    parser.add_argument("--sqlite-shipments", type=int, default=DEFAULT_SQLITE_SHIPMENTS)
+    args = parser.parse_args()
+    if args.compare_threads and args.backend != 'mysql':
+        parser.error("--compare-threads 는 동기 ConsistencyBenchmark(pymysql) 를 쓰므로 --backend mysql 에서만 가능합니다.")
+
+    results = asyncio.run(run_async(args, args.strategy))
+    if args.compare_threads:
+        for name in args.strategy:
+            print(f"\n🧵 [Threads: {STRATEGIES[name]}] 스레드 {args.compare_threads}개 / {args.duration}초...")
+            results.append(run_threads(name, args.compare_threads, args.duration, args.think_time))
+    print_results(results)
@@ -0,0 +1,81 @@
+import numpy as np
+
+# ==========================================
+# NumPy 배치 합성 엔진
+# ==========================================
+# 화물 1건마다 random.choice / random.sample / fake.date_time_between 를 부르는 대신
+# 배치 전체의 ID, 창고 쌍, 상품 수, 수량, 상태, 누적 타임스탬프를 배열로 한 번에 만듭니다.
+# 상태 이력은 status_model.StatusModel.sample_batch 가 담당합니다.
+# Faker는 회사명/주소 같은 저카디널리티 텍스트에만 쓰고, 미리 풀(pool)로 만들어 둡니다.
+
+MIN_ITEMS, MAX_ITEMS = 1, 5           # 화물당 상품 종류 수
+MIN_QTY, MAX_QTY = 1, 100             # 상품 수량
+
+def build_text_pools(fake, companies=50, warehouses=50, products=100):
+    """Faker 호출은 여기서 한 번만 (회사명, 창고명/주소, 상품명 풀)"""
+    return {
+        'companies': [(fake.company(),) for _ in range(companies)],
+        'warehouses': [(f"{fake.city()} 센터 {i}", fake.address()) for i in range(warehouses)],
+        'products': [(f"Logis 상품 {i}",) for i in range(products)],
+    }
+
+def make_rng(seed, worker_idx):
+    """(seed, worker_idx) 조합으로 독립적인 난수 스트림 생성"""
+    return np.random.default_rng([seed, worker_idx])
+
+def _sample_distinct(rng, pool, counts, k_max):
+    """
+    행마다 pool에서 중복 없이 counts[i]개를 뽑습니다. (random.sample 의 배치 버전)
+    무작위 키의 argpartition 상위 k_max개를 뽑은 뒤 counts 만큼만 남깁니다.
+    """
+    n = len(counts)
+    k_max = min(k_max, len(pool))
+    keys = rng.random((n, len(pool)))
+    picks = np.argpartition(keys, k_max - 1, axis=1)[:, :k_max]
+    mask = np.arange(k_max) < counts[:, None]
+    return pool[picks[mask]]
+
+def _group_cumsum(values, counts):
+    """counts 단위 그룹별 누적합 (그룹이 바뀌면 0부터 다시 시작)"""
+    total = np.cumsum(values)
+    group_end = np.cumsum(counts)
+    group_base = np.repeat(total[group_end - counts] - values[group_end - counts], counts)
+    return total - group_base
+
+def synthesize_batch(rng, first_id, n, base_ids, window, status_model, note="시스템 자동 업데이트"):
+    """
+    shipment_id [first_id, first_id + n) 구간의 배치를 배열로 합성합니다.
+    반환값: 테이블명 -> 컬럼 배열 튜플 (SHIPMENT/ITEM/UPDATE_COLUMNS 순서)
+    """
+    company_ids, warehouse_ids, product_ids = (np.asarray(ids) for ids in base_ids)
+    window_start, window_seconds = window
+    statuses = np.asarray(status_model.statuses, dtype=object)
+
+    # 1. 화물: ID, 고객사, 출발/도착 창고(서로 다름), 생성 시각
+    shipment_ids = np.arange(first_id, first_id + n, dtype=np.int64)
+    companies = rng.choice(company_ids, n)
+    w = len(warehouse_ids)
+    origin_idx = rng.integers(0, w, n)
+    dest_idx = (origin_idx + rng.integers(1, w, n)) % w     # 출발지와 겹치지 않게 한 칸 이상 이동
+    start = np.datetime64(window_start, 's')
+    created_at = start + rng.integers(0, window_seconds + 1, n).astype('timedelta64[s]')
+
+    # 2. 상품: 화물별 중복 없는 상품 + 수량
+    item_counts = rng.integers(MIN_ITEMS, MAX_ITEMS + 1, n)
+    item_shipments = np.repeat(shipment_ids, item_counts)
+    item_products = _sample_distinct(rng, product_ids, item_counts, MAX_ITEMS)
+    quantities = rng.integers(MIN_QTY, MAX_QTY + 1, len(item_shipments))
+
+    # 3. 이력: 상태 전이 모델로 건수/상태/체류 시간 생성 후 생성 시각 기준 누적 타임스탬프
+    history_counts, status_idx, gap_seconds = status_model.sample_batch(rng, n)
+    update_shipments = np.repeat(shipment_ids, history_counts)
+    update_statuses = statuses[status_idx]
+    offsets = _group_cumsum(gap_seconds, history_counts).astype('timedelta64[s]')
+    timestamps = np.repeat(created_at, history_counts) + offsets
+    notes = np.full(len(status_idx), note, dtype=object)
+
+    return {
+        'shipments': (shipment_ids, companies, warehouse_ids[origin_idx], warehouse_ids[dest_idx], created_at),
+        'shipment_items': (item_shipments, item_products, quantities),
+        'shipment_updates': (update_shipments, update_statuses, notes, timestamps),
+    }
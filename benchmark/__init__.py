@@ -0,0 +1,11 @@
+"""
+Logis-Flow 읽기 성능 벤치마크 패키지
+
+    python -m benchmark --backend sqlite --scenario all
+    python -m benchmark --backend mysql  --scenario normalized_no_index denormalized
+
+- drivers   : pymysql / psycopg2 / sqlite3(서버 없이 실행) 드라이버 추상화
+- scenarios : 이름 붙은 쿼리 시나리오 레지스트리 (정규화/인덱스/비정규화)
+- monitor   : DB 서버 프로세스 자원 모니터
+- runner    : 시나리오 실행 + 비교 리포트
+"""
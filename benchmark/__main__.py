@@ -0,0 +1,66 @@
+import argparse
+import sys
+
+from benchmark import drivers, results as results_io, runner, scenarios
+
+def build_driver(args):
+    if args.backend == 'sqlite':
+        return drivers.get_driver('sqlite', path=args.sqlite_path, shipments=args.sqlite_shipments)
+    return drivers.get_driver(args.backend)
+
+def main():
+    parser = argparse.ArgumentParser(description="정규화 / 인덱스 / 비정규화 조회 성능 벤치마크")
+    parser.add_argument("--backend", choices=list(drivers.DRIVERS), default='mysql',
+                        help="DB 백엔드 (sqlite: 서버 없이 로컬 파일로 실행)")
+    parser.add_argument("--scenario", nargs='+', default=['all'],
+                        help=f"실행할 시나리오 (all / {' / '.join(scenarios.SCENARIOS)})")
+    parser.add_argument("--limit", type=int, default=runner.DEFAULT_LIMIT, help="조회 행 수 (LIMIT)")
+    parser.add_argument("--offset", type=int, default=0, help="건너뛸 행 수 (OFFSET)")
+    parser.add_argument("--warmup", type=int, default=runner.DEFAULT_WARMUP, help="측정 전 워밍업 실행 횟수")
+    parser.add_argument("--iterations", type=int, default=runner.DEFAULT_ITERATIONS, help="측정 반복 횟수")
+    parser.add_argument("--cooldown", type=float, default=runner.DEFAULT_COOLDOWN, help="시나리오 사이 대기(초)")
+    parser.add_argument("--pool-size", type=int, default=0,
+                        help="커넥션 풀 크기 (0: 쿼리마다 새 커넥션 = connect 비용 포함, 기존 방식)")
+    parser.add_argument("--explain", action='store_true',
+                        help="실행 계획 수집 (PG EXPLAIN ANALYZE / MySQL EXPLAIN ANALYZE FORMAT=JSON / SQLite QUERY PLAN)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--label", help="결과에 남길 이름 (예: 스키마 버전 v2-index)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON (회귀 발견 시 종료 코드 1)")
+    parser.add_argument("--threshold", type=float, default=results_io.DEFAULT_THRESHOLD,
+                        help="회귀 판정 기준 p50 변화율 (기본 0.10 = 10%%)")
+    parser.add_argument("--sqlite-path", default=drivers.DEFAULT_SQLITE_PATH, help="SQLite 데이터셋 파일")
+    parser.add_argument("--sqlite-shipments", type=int, default=drivers.DEFAULT_SQLITE_SHIPMENTS,
+                        help="SQLite 데이터셋이 없을 때 생성할 화물 수")
+    parser.add_argument("--list", action='store_true', help="등록된 시나리오 목록 출력")
+    args = parser.parse_args()
+
+    if args.list:
+        for s in scenarios.SCENARIOS.values():
+            print(f"{s.name:<22} {s.title}  [{', '.join(s.sql)}]")
+        return
+
+    try:
+        selected = scenarios.get_scenarios(args.scenario)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.iterations < 1:
+        parser.error("--iterations 는 1 이상이어야 합니다.")
+
+    driver = build_driver(args)
+    print(f"🔌 백엔드: {driver.describe()}")
+    results = runner.run_scenarios(driver, selected, limit=args.limit, warmup=args.warmup,
+                                   iterations=args.iterations, cooldown=args.cooldown, explain=args.explain,
+                                   offset=args.offset, pool_size=args.pool_size)
+    runner.print_report(results)
+
+    if args.output:
+        results_io.write_results(args.output, results, driver, label=args.label)
+    if args.baseline:
+        baseline = results_io.load_results(args.baseline)
+        rows = results_io.compare(baseline, results, threshold=args.threshold)
+        results_io.print_comparison(rows, baseline.get('label') or args.baseline)
+        if any(r['verdict'] == 'regression' for r in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import os
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+
+import batch_synth
+import bulk_sink
+from status_model import StatusModel
+
+# ==========================================
+# SQLite 대체 데이터셋
+# ==========================================
+# MySQL/PostgreSQL 서버 없이도 시나리오를 돌려볼 수 있도록
+# generator_12_05.py 와 같은 합성 엔진(batch_synth + status_model)으로 SQLite 파일을 만듭니다.
+# 비정규화 컬럼(current_status, last_updated_at)까지 채워둡니다.
+#
+# 규모별 스윕(benchmark.sweep)에서는 MySQL/PostgreSQL 도 generator_12_05.generate_bulk_data 로
+# 테이블을 비우고 다시 채웁니다. (--allow-truncate 필요)
+
+SQLITE_SCHEMA = """
+CREATE TABLE companies (
+    company_id INTEGER PRIMARY KEY,
+    company_name VARCHAR(100) NOT NULL
+);
+CREATE TABLE warehouses (
+    warehouse_id INTEGER PRIMARY KEY,
+    warehouse_name VARCHAR(100) NOT NULL,
+    address VARCHAR(255)
+);
+CREATE TABLE products (
+    product_id INTEGER PRIMARY KEY,
+    product_name VARCHAR(100) NOT NULL
+);
+CREATE TABLE shipments (
+    shipment_id INTEGER PRIMARY KEY,
+    company_id INT REFERENCES companies(company_id),
+    origin_warehouse_id INT REFERENCES warehouses(warehouse_id),
+    destination_warehouse_id INT REFERENCES warehouses(warehouse_id),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    current_status VARCHAR(50) DEFAULT '접수대기',
+    last_updated_at TIMESTAMP
+);
+CREATE TABLE shipment_items (
+    shipment_id INT REFERENCES shipments(shipment_id),
+    product_id INT REFERENCES products(product_id),
+    quantity INT NOT NULL,
+    PRIMARY KEY (shipment_id, product_id)
+);
+CREATE TABLE shipment_updates (
+    update_id INTEGER PRIMARY KEY,
+    shipment_id INT REFERENCES shipments(shipment_id),
+    status_code VARCHAR(50) NOT NULL,
+    notes VARCHAR(255),
+    timestamp DATETIME NOT NULL
+);
+CREATE INDEX idx_shipment_updates_shipment_id_timestamp
+ON shipment_updates(shipment_id, timestamp);
+"""
+
+# 비정규화 컬럼 채우기 (README의 Update Join 과 같은 결과)
+SQLITE_DENORMALIZE = """
+UPDATE shipments SET
+    current_status = (SELECT u.status_code FROM shipment_updates u
+                      WHERE u.shipment_id = shipments.shipment_id
+                      ORDER BY u.timestamp DESC LIMIT 1),
+    last_updated_at = (SELECT MAX(u.timestamp) FROM shipment_updates u
+                       WHERE u.shipment_id = shipments.shipment_id)
+"""
+
+# 서버 DB 비정규화 컬럼 채우기 (README 2025_12_06 / 2025_12_17 Update Join)
+DENORMALIZE_SQL = {
+    'mysql': """
+        UPDATE shipments s
+        JOIN (
+            SELECT t1.shipment_id, t1.status_code, t1.timestamp
+            FROM shipment_updates t1
+            JOIN (
+                SELECT shipment_id, MAX(timestamp) as max_ts
+                FROM shipment_updates
+                GROUP BY shipment_id
+            ) t2 ON t1.shipment_id = t2.shipment_id AND t1.timestamp = t2.max_ts
+        ) latest_log ON s.shipment_id = latest_log.shipment_id
+        SET
+            s.current_status = latest_log.status_code,
+            s.last_updated_at = latest_log.timestamp
+    """,
+    'postgres': """
+        UPDATE shipments s
+        SET
+            current_status = latest_log.status_code,
+            last_updated_at = latest_log.timestamp
+        FROM (
+            SELECT t1.shipment_id, t1.status_code, t1.timestamp
+            FROM shipment_updates t1
+            JOIN (
+                SELECT shipment_id, MAX(timestamp) AS max_ts
+                FROM shipment_updates
+                GROUP BY shipment_id
+            ) t2
+              ON t1.shipment_id = t2.shipment_id
+             AND t1.timestamp = t2.max_ts
+        ) latest_log
+        WHERE s.shipment_id = latest_log.shipment_id
+    """,
+}
+
+# 화물 관련 테이블 비우기 (FK 순서: 이력 -> 상품 -> 화물). 기초 데이터(고객사/창고/상품)는 유지
+TRUNCATE_SQL = {
+    'mysql': [
+        "SET FOREIGN_KEY_CHECKS = 0",
+        "TRUNCATE TABLE shipment_updates",
+        "TRUNCATE TABLE shipment_items",
+        "TRUNCATE TABLE shipments",
+        "SET FOREIGN_KEY_CHECKS = 1",
+    ],
+    'postgres': [
+        "TRUNCATE TABLE shipment_updates, shipment_items, shipments RESTART IDENTITY",
+    ],
+}
+
+# 서버별 기본 적재 방식 (bulk_sink)
+DEFAULT_SERVER_SINK = {'mysql': 'executemany', 'postgres': 'copy'}
+
+BASE_COUNTS = {'companies': 50, 'warehouses': 50, 'products': 100}
+WINDOW = (datetime(2025, 1, 1), 365 * 24 * 3600)
+BATCH_SIZE = 5000
+
+def fanout_model(updates_per_shipment=None):
+    """
+    화물당 이력 수를 고정한 상태 모델.
+    None 이면 기본 모델(대부분 10건 안팎 + long tail), 숫자 k 면 모든 화물이 정확히 k건
+    (long tail 경로를 전체에 적용: 종료 상태에서 재시도하며 k건까지 진행)
+    """
+    if updates_per_shipment is None:
+        return StatusModel()
+    k = int(updates_per_shipment)
+    return StatusModel(long_tail_share=1.0, long_tail_range=(k, k), in_transit_share=0.0)
+
+def _placeholders(n):
+    return ", ".join(["?"] * n)
+
+def _sqlite_columns(arrays):
+    """datetime64 컬럼은 'YYYY-MM-DD HH:MM:SS' 문자열로 (sqlite3 기본 datetime 어댑터는 deprecated)"""
+    converted = []
+    for arr in arrays:
+        arr = np.asarray(arr)
+        if arr.dtype.kind == 'M':
+            arr = np.char.replace(np.datetime_as_string(arr, unit='s'), 'T', ' ')
+        converted.append(arr)
+    return converted
+
+def build_sqlite_dataset(path, shipments, seed=1205, status_model=None, batch_size=BATCH_SIZE):
+    """화물 shipments건 규모의 SQLite 데이터셋을 path에 새로 만듭니다."""
+    if os.path.exists(path):
+        os.remove(path)
+    status_model = status_model or StatusModel()
+
+    conn = sqlite3.connect(path)
+    conn.executescript(SQLITE_SCHEMA)
+
+    # 1. 기초 데이터 (Faker 없이 고정 이름)
+    company_ids = list(range(1, BASE_COUNTS['companies'] + 1))
+    warehouse_ids = list(range(1, BASE_COUNTS['warehouses'] + 1))
+    product_ids = list(range(1, BASE_COUNTS['products'] + 1))
+    conn.executemany("INSERT INTO companies VALUES (?, ?)", [(i, f"Logis 고객사 {i}") for i in company_ids])
+    conn.executemany("INSERT INTO warehouses VALUES (?, ?, ?)", [(i, f"센터 {i}", f"주소 {i}") for i in warehouse_ids])
+    conn.executemany("INSERT INTO products VALUES (?, ?)", [(i, f"Logis 상품 {i}") for i in product_ids])
+
+    # 2. 화물/상품/이력: 생성기와 같은 배치 합성
+    rng = batch_synth.make_rng(seed, 0)
+    base_ids = (company_ids, warehouse_ids, product_ids)
+    columns = {
+        'shipments': ('shipment_id', 'company_id', 'origin_warehouse_id', 'destination_warehouse_id', 'created_at'),
+        'shipment_items': ('shipment_id', 'product_id', 'quantity'),
+        'shipment_updates': ('shipment_id', 'status_code', 'notes', 'timestamp'),
+    }
+    for start in range(0, shipments, batch_size):
+        n = min(batch_size, shipments - start)
+        batch = batch_synth.synthesize_batch(rng, start + 1, n, base_ids, WINDOW, status_model)
+        for table, cols in columns.items():
+            sql = f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({_placeholders(len(cols))})"
+            conn.executemany(sql, bulk_sink.columns_to_rows(_sqlite_columns(batch[table])))
+
+    conn.execute(SQLITE_DENORMALIZE)
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+def count_rows(driver):
+    """(화물 수, 이력 수)"""
+    conn = driver.connect()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM shipments")
+        shipments = cursor.fetchone()[0]
+        cursor.execute("SELECT COUNT(*) FROM shipment_updates")
+        updates = cursor.fetchone()[0]
+        cursor.close()
+    finally:
+        conn.close()
+    return shipments, updates
+
+def rebuild_server_dataset(driver, shipments, seed=1205, status_model=None, sink_name=None, workers=1):
+    """
+    MySQL/PostgreSQL 화물 테이블을 비우고 generator_12_05 로 shipments건을 다시 생성합니다. (기존 데이터 삭제!)
+    생성 단계는 generator_12_05.py 의 접속 정보(db_config / pg_db_config)를 사용합니다.
+    기초 데이터(회사/창고/상품)는 이미 있으면 재사용하고, 생성이 실패하면 예외를 올려 실패한 데이터셋을 측정하지 않습니다.
+    """
+    import generator_12_05
+
+    conn = driver.connect()
+    try:
+        cursor = conn.cursor()
+        for sql in TRUNCATE_SQL[driver.dialect]:
+            cursor.execute(sql)
+        conn.commit()
+    finally:
+        conn.close()
+
+    sink_name = sink_name or DEFAULT_SERVER_SINK[driver.dialect]
+    generator_12_05.generate_bulk_data(shipments, workers, seed, sink_name, status_model=status_model, seed_base=False)
+
+    conn = driver.connect()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(DENORMALIZE_SQL[driver.dialect])
+        analyze = "ANALYZE {}" if driver.dialect == 'postgres' else "ANALYZE TABLE {}"
+        for table in ('shipments', 'shipment_updates'):
+            cursor.execute(analyze.format(table))
+        conn.commit()
+    finally:
+        conn.close()
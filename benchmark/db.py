@@ -0,0 +1,321 @@
+import re
+import time
+import queue
+import random
+import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from benchmark import drivers
+from benchmark.stats import summarize
+
+# ==========================================
+# 공용 DB 접근 계층 (커넥션 풀 + prepared statement)
+# ==========================================
+# 벤치마크 / ConsistencyBenchmark / 생성기가 같이 쓰는 커넥션 관리.
+#   - ConnectionPool : 크기 제한이 있는 풀. 커넥션을 닫지 않고 돌려받아 재사용 (connect 비용은 처음 한 번)
+#   - Session        : 커넥션 1개 + 재사용 커서 1개 + 이 커넥션에 준비해 둔 prepared statement
+#
+# prepared statement 는 커넥션(세션) 단위라 Session 이 이름별로 한 번만 준비합니다.
+#   mysql    : SQL PREPARE / EXECUTE ... USING @변수 (pymysql 은 바이너리 프로토콜이 없어 SET + EXECUTE 왕복 2회)
+#   postgres : PREPARE name AS ... / EXECUTE name (...) (왕복 1회)
+#   sqlite   : sqlite3 가 커넥션별로 컴파일된 문장을 SQL 문자열 기준으로 캐시 -> 같은 문자열을 그대로 재사용
+# 왕복이 늘어나는 MySQL 처럼 항상 이득은 아니므로, 호출당 비용은 python -m benchmark.db 로 직접 비교합니다.
+#
+#   python -m benchmark.db --backend sqlite --calls 2000
+#   python -m benchmark.db --backend mysql --statements read_status insert_update
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_ACQUIRE_TIMEOUT = 30.0   # 풀이 가득 찼을 때 빈 커넥션을 기다리는 한도(초)
+DEFAULT_CALLS = 2000
+DEFAULT_WARMUP = 100
+
+# 상태 이벤트 경로의 자주 쓰는 문장 (파라미터는 모두 %s, dialect 별 자리표시자로 자동 변환)
+STATEMENTS = {
+    # 이력 적재 -> 새 update_id (PostgreSQL 은 lastrowid 가 없어 RETURNING)
+    'insert_update': {
+        'default': "INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, %s)",
+        'postgres': "INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, %s) "
+                    "RETURNING update_id",
+    },
+    # 더 새로운 (timestamp, update_id) 일 때만 상태 반영
+    'project_status': """
+        UPDATE shipments
+        SET current_status = %s, last_updated_at = %s, last_update_id = %s
+        WHERE shipment_id = %s
+          AND (last_update_id IS NULL OR (%s, %s) > (last_updated_at, last_update_id))
+    """,
+    'read_status': "SELECT current_status FROM shipments WHERE shipment_id = %s",
+    # 생성기(faker_to_mysql.py): 화물 ID 확보를 위해 1건씩 INSERT
+    'insert_shipment': {
+        'default': "INSERT INTO shipments (company_id, origin_warehouse_id, destination_warehouse_id, created_at) "
+                   "VALUES (%s, %s, %s, %s)",
+        'postgres': "INSERT INTO shipments (company_id, origin_warehouse_id, destination_warehouse_id, created_at) "
+                    "VALUES (%s, %s, %s, %s) RETURNING shipment_id",
+    },
+}
+
+def statement_sql(name, dialect):
+    sql = STATEMENTS[name]
+    if isinstance(sql, dict):
+        sql = sql.get(dialect, sql['default'])
+    return sql
+
+def to_dialect(sql, dialect):
+    """%s 자리표시자 -> dialect 자리표시자 (드라이버 파라미터 바인딩용)"""
+    return sql.replace('%s', '?') if dialect == 'sqlite' else sql
+
+def _numbered(sql):
+    """%s -> $1, $2, ... (PostgreSQL PREPARE 용)"""
+    counter = iter(range(1, sql.count('%s') + 1))
+    return re.sub(r'%s', lambda _: f"${next(counter)}", sql)
+
+class Session:
+    """커넥션 1개 + 재사용 커서 + prepared statement 캐시"""
+    def __init__(self, conn, dialect, prepared=True):
+        self.conn = conn
+        self.dialect = dialect
+        self.use_prepared = prepared
+        self.cursor = conn.cursor()
+        self.prepared = {}        # 이름 -> 실행할 SQL (이 커넥션에서 준비 완료된 문장)
+
+    def prepare(self, name, sql=None):
+        """name 문장을 이 커넥션에 한 번만 준비. sql 을 주면 STATEMENTS 대신 사용"""
+        if name in self.prepared:
+            return
+        sql = sql or statement_sql(name, self.dialect)
+        if self.dialect == 'mysql':
+            self.cursor.execute(f"PREPARE {name} FROM %s", (sql.replace('%s', '?'),))
+        elif self.dialect == 'postgres':
+            self.cursor.execute(f"PREPARE {name} AS {_numbered(sql)}")
+        self.prepared[name] = to_dialect(sql, self.dialect)
+
+    def execute(self, name, params=(), sql=None):
+        """이름 붙은 문장 실행 (use_prepared=False 면 같은 SQL 을 텍스트로 실행). 커서 반환"""
+        if not self.use_prepared:
+            return self.query(sql or statement_sql(name, self.dialect), params)
+        self.prepare(name, sql)
+        if self.dialect == 'mysql':
+            if params:
+                names = [f"@{name}_{i}" for i in range(len(params))]
+                self.cursor.execute("SET " + ", ".join(f"{var} = %s" for var in names), params)
+                self.cursor.execute(f"EXECUTE {name} USING {', '.join(names)}")
+            else:
+                self.cursor.execute(f"EXECUTE {name}")
+        elif self.dialect == 'postgres':
+            args = f" ({', '.join(['%s'] * len(params))})" if params else ''
+            self.cursor.execute(f"EXECUTE {name}{args}", params)
+        else:
+            self.cursor.execute(self.prepared[name], params)
+        return self.cursor
+
+    def query(self, sql, params=None):
+        """일회성 / 가변 SQL 을 재사용 커서로 실행 (%s 자리표시자). 커서 반환"""
+        self.cursor.execute(to_dialect(sql, self.dialect), params or ())
+        return self.cursor
+
+    def insert(self, name, params, sql=None):
+        """INSERT 문장 실행 후 새 행 id 반환"""
+        cursor = self.execute(name, params, sql)
+        return cursor.fetchone()[0] if self.dialect == 'postgres' else cursor.lastrowid
+
+    def close(self):
+        try:
+            self.cursor.close()
+        finally:
+            self.conn.close()
+
+class ConnectionPool:
+    """
+    크기 제한 커넥션 풀. 최대 size 개까지 필요할 때 만들고, 다 쓰인 상태에서 acquire 하면 반납될 때까지 기다립니다.
+    최근 반납된 커넥션부터 다시 내줍니다 (LIFO, 오래 쉰 커넥션은 그대로 쉬게).
+    """
+    def __init__(self, driver, size=DEFAULT_POOL_SIZE, timeout=DEFAULT_ACQUIRE_TIMEOUT, prepared=True):
+        self.driver = driver
+        self.size = size
+        self.timeout = timeout
+        self.prepared = prepared
+        self.idle = queue.LifoQueue()
+        self.slots = threading.BoundedSemaphore(size)
+        self.lock = threading.Lock()
+        self.sessions = []
+        self.waits = 0            # 풀이 가득 차서 기다린 횟수
+        self.wait_seconds = 0.0
+
+    def acquire(self):
+        if not self.slots.acquire(blocking=False):
+            t0 = time.perf_counter()
+            if not self.slots.acquire(timeout=self.timeout):
+                raise TimeoutError(f"커넥션 풀({self.size}개)이 {self.timeout}초 동안 모두 사용 중입니다. 풀 크기를 늘려주세요.")
+            with self.lock:
+                self.waits += 1
+                self.wait_seconds += time.perf_counter() - t0
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            session = Session(self.driver.connect(), self.driver.dialect, self.prepared)
+        except Exception:
+            self.slots.release()
+            raise
+        with self.lock:
+            self.sessions.append(session)
+        return session
+
+    def release(self, session):
+        self.idle.put(session)
+        self.slots.release()
+
+    @contextmanager
+    def session(self):
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def close(self):
+        """반납된 커넥션을 모두 닫음"""
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def stats(self):
+        return {'size': self.size, 'connections': len(self.sessions), 'waits': self.waits,
+                'wait_seconds': self.wait_seconds}
+
+# ==========================================
+# 호출당 비용 측정 (connect-per-call vs 풀 + 텍스트 SQL vs 풀 + prepared)
+# ==========================================
+MODES = ('connect', 'pooled', 'prepared')
+MODE_TITLES = {
+    'connect': "호출마다 새 커넥션",
+    'pooled': "풀 + 재사용 커서 (텍스트 SQL)",
+    'prepared': "풀 + prepared statement",
+}
+OVERHEAD_STATEMENTS = ('read_status', 'insert_update', 'project_status')
+STATUSES = ['집화완료', '터미널입고', '배송출발', '배송완료', '수취확인']
+
+def ensure_version_column(driver):
+    """project_status 가 쓰는 shipments.last_update_id 가 SQLite 데이터셋에 없으면 추가 (MySQL/PG 는 consistency_test / trigger_styles 가 추가)"""
+    if driver.dialect != 'sqlite':
+        return
+    conn = driver.connect()
+    try:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(shipments)")]
+        if 'last_update_id' not in columns:
+            conn.execute("ALTER TABLE shipments ADD COLUMN last_update_id INTEGER")
+            conn.commit()
+    finally:
+        conn.close()
+
+def _params(name, shipment_ids, rng):
+    s_id = rng.choice(shipment_ids)
+    if name == 'read_status':
+        return (s_id,)
+    ts = datetime.now().replace(microsecond=0)
+    status = rng.choice(STATUSES)
+    if name == 'insert_update':
+        return (s_id, status, "DB Overhead Bench", ts)
+    update_id = rng.randrange(1, 1 << 30)
+    return (status, ts, update_id, s_id, ts, update_id)
+
+def _drain(cursor):
+    # 결과 행이 있는 문장만 받음 (psycopg2 는 RETURNING 없는 UPDATE 에 fetchall 하면 ProgrammingError)
+    if cursor.description is not None:
+        cursor.fetchall()
+
+def measure_overhead(driver, name, mode, shipment_ids, calls=DEFAULT_CALLS, warmup=DEFAULT_WARMUP, seed=1205):
+    """
+    문장 name 을 mode 방식으로 calls 회 실행해 호출 1회 지연(ns) 요약 반환.
+    모든 방식이 호출마다 (측정 구간 밖에서) 롤백하므로 트랜잭션 크기가 같고 데이터는 바뀌지 않습니다.
+    """
+    rng = random.Random(seed)
+    sql = statement_sql(name, driver.dialect)
+    samples = []
+
+    if mode == 'connect':
+        # 기존 runner.run_query 방식: 매번 connect -> 실행 -> 닫기
+        for i in range(warmup + calls):
+            params = _params(name, shipment_ids, rng)
+            t0 = time.perf_counter_ns()
+            conn = driver.connect()
+            cursor = conn.cursor()
+            cursor.execute(to_dialect(sql, driver.dialect), params)
+            _drain(cursor)
+            t1 = time.perf_counter_ns()
+            conn.rollback()
+            conn.close()
+            if i >= warmup:
+                samples.append(t1 - t0)
+        return summarize(samples)
+
+    pool = ConnectionPool(driver, size=1, prepared=(mode == 'prepared'))
+    try:
+        for i in range(warmup + calls):
+            params = _params(name, shipment_ids, rng)
+            t0 = time.perf_counter_ns()
+            with pool.session() as session:
+                _drain(session.execute(name, params))
+                t1 = time.perf_counter_ns()
+                session.conn.rollback()
+            if i >= warmup:
+                samples.append(t1 - t0)
+    finally:
+        pool.close()
+    return summarize(samples)
+
+def print_overhead(results, calls):
+    print(f"\n📊 호출 1회 비용 (호출 {calls}회, 단위 µs)")
+    print(f"{'statement':<16} {'mode':<30} {'p50':>9} {'p99':>9} {'mean':>9} {'calls/s':>9} {'vs connect':>11}")
+    for name, by_mode in results.items():
+        base = by_mode.get('connect')
+        for mode, s in by_mode.items():
+            ratio = f"{base['p50_ms'] / s['p50_ms']:.1f}x" if base and s['p50_ms'] > 0 else '-'
+            print(f"{name:<16} {MODE_TITLES[mode]:<30} {s['p50_ms'] * 1000:>9.1f} {s['p99_ms'] * 1000:>9.1f} "
+                  f"{s['mean_ms'] * 1000:>9.1f} {1000 / s['mean_ms']:>9.0f} {ratio:>11}")
+
+def main():
+    parser = argparse.ArgumentParser(description="커넥션 풀 / prepared statement 호출당 비용 비교")
+    parser.add_argument("--backend", choices=list(drivers.DRIVERS), default='mysql')
+    parser.add_argument("--statements", nargs='+', choices=OVERHEAD_STATEMENTS, default=list(OVERHEAD_STATEMENTS))
+    parser.add_argument("--modes", nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS, help="문장 x 방식마다 측정할 호출 수")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="측정 전 버리는 호출 수")
+    parser.add_argument("--shipments", type=int, default=1000, help="파라미터로 쓸 화물 ID 수")
+    parser.add_argument("--sqlite-path", default=drivers.DEFAULT_SQLITE_PATH)
+    args = parser.parse_args()
+    if args.calls < 1:
+        parser.error("--calls 는 1 이상이어야 합니다.")
+
+    if args.backend == 'sqlite':
+        driver = drivers.get_driver('sqlite', path=args.sqlite_path)
+    else:
+        driver = drivers.get_driver(args.backend)
+    driver.prepare()
+    if 'project_status' in args.statements:
+        ensure_version_column(driver)
+    print(f"🔌 백엔드: {driver.describe()}")
+
+    conn = driver.connect()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(to_dialect("SELECT shipment_id FROM shipments LIMIT %s", driver.dialect), (args.shipments,))
+        shipment_ids = [row[0] for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+    results = {}
+    for name in args.statements:
+        results[name] = {}
+        for mode in args.modes:
+            print(f"🚦 {name} / {MODE_TITLES[mode]} ...")
+            results[name][mode] = measure_overhead(driver, name, mode, shipment_ids, args.calls, args.warmup)
+    print_overhead(results, args.calls)
+
+if __name__ == "__main__":
+    main()
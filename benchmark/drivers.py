@@ -0,0 +1,184 @@
+import os
+import json
+import sqlite3
+import threading
+
+# ==========================================
+# [설정] DB 접속 정보 (비밀번호 꼭 확인!)
+# ==========================================
+mysql_config = {
+    'host': 'localhost',
+    'user': 'root',
+    'password': '',  # ★ 여기에 비밀번호 입력 ★
+    'db': 'shipment',
+    'charset': 'utf8mb4'
+}
+
+pg_config = {
+    'host': 'localhost',
+    'user': 'postgres',      # 기본 계정 (필요 시 수정)
+    'password': '',  # ★ 비밀번호 입력 ★
+    'dbname': 'shipment',    # MySQL의 'db' 키 대신 'dbname'을 사용합니다.
+}
+
+DEFAULT_SQLITE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'shipment_bench.sqlite3')
+DEFAULT_SQLITE_SHIPMENTS = 20000
+
+# ==========================================
+# 드라이버 추상화
+# ==========================================
+class Driver:
+    """
+    벤치마크가 DB마다 다르게 처리해야 하는 부분만 모아둔 클래스.
+    - dialect      : 시나리오 SQL 선택 키 ('mysql' / 'postgres' / 'sqlite')
+    - process_name : 자원 모니터가 찾을 서버 프로세스 이름 (None 이면 현재 프로세스)
+    - placeholder  : 파라미터 자리표시자 (%s / ?)
+    """
+    name = None
+    dialect = None
+    process_name = None
+    placeholder = '%s'
+
+    def connect(self):
+        raise NotImplementedError
+
+    def stream_cursor(self, conn):
+        """
+        결과를 한 번에 받지 않고 흘려받는 커서.
+        execute + 첫 행까지(서버 실행)와 나머지 행 수신(전송)을 나눠서 재기 위해 사용합니다.
+        """
+        return conn.cursor()
+
+    def backend_pid(self, conn):
+        """
+        이 커넥션의 쿼리를 실제로 실행하는 OS 프로세스/스레드 id (모니터가 /proc 에서 읽음).
+        알 수 없으면 None
+        """
+        return None
+
+    def explain(self, conn, sql):
+        """실행 계획 수집 -> (형식, 원본 계획). 형식은 plans.extract_accesses 가 해석"""
+        raise NotImplementedError
+
+    def prepare(self):
+        """벤치마크 전에 필요한 준비 (SQLite 데이터셋 생성 등)"""
+
+    def describe(self):
+        return self.name
+
+class MySQLDriver(Driver):
+    name = 'mysql'
+    dialect = 'mysql'
+    process_name = 'mysqld'
+
+    def __init__(self, config=None):
+        self.config = dict(config or mysql_config)
+
+    def connect(self):
+        import pymysql
+        return pymysql.connect(**self.config)
+
+    def stream_cursor(self, conn):
+        import pymysql.cursors
+        return conn.cursor(pymysql.cursors.SSCursor)   # unbuffered
+
+    def backend_pid(self, conn):
+        # MySQL 은 커넥션당 스레드이므로 CONNECTION_ID() 에 대응하는 OS 스레드 id 를 찾습니다. (MySQL 8 performance_schema)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT THREAD_OS_ID FROM performance_schema.threads WHERE PROCESSLIST_ID = CONNECTION_ID()")
+                row = cursor.fetchone()
+        except Exception:
+            return None
+        return row[0] if row else None
+
+    def explain(self, conn, sql):
+        # 8.3+ 는 EXPLAIN ANALYZE FORMAT=JSON (explain_json_format_version=2), 그 전 버전은 실행 없이 EXPLAIN FORMAT=JSON
+        import pymysql
+        with conn.cursor() as cursor:
+            try:
+                cursor.execute("SET SESSION explain_json_format_version = 2")
+                cursor.execute("EXPLAIN ANALYZE FORMAT=JSON " + sql)
+                fmt = 'mysql-json-analyze'
+            except pymysql.err.DatabaseError:     # 8.3 미만: NotSupportedError / 알 수 없는 변수 등
+                cursor.execute("EXPLAIN FORMAT=JSON " + sql)
+                fmt = 'mysql-json'
+            plan = json.loads(cursor.fetchone()[0])
+        return fmt, plan
+
+    def describe(self):
+        return f"mysql://{self.config['host']}/{self.config['db']}"
+
+class PostgresDriver(Driver):
+    name = 'postgres'
+    dialect = 'postgres'
+    process_name = 'postgres'
+
+    def __init__(self, config=None):
+        self.config = dict(config or pg_config)
+
+    def connect(self):
+        import psycopg2
+        return psycopg2.connect(**self.config)
+
+    def stream_cursor(self, conn):
+        return conn.cursor(name='benchmark_stream')     # 서버 측 커서 (DECLARE ... / FETCH)
+
+    def backend_pid(self, conn):
+        return conn.get_backend_pid()                   # SELECT pg_backend_pid() 와 동일
+
+    def explain(self, conn, sql):
+        with conn.cursor() as cursor:
+            cursor.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql)
+            plan = cursor.fetchone()[0]
+        conn.rollback()
+        return 'postgres-json-analyze', plan
+
+    def describe(self):
+        return f"postgres://{self.config['host']}/{self.config['dbname']}"
+
+class SQLiteDriver(Driver):
+    """서버 없이 돌려보기 위한 대체 드라이버. 파일이 없으면 더미 데이터셋을 만듭니다."""
+    name = 'sqlite'
+    dialect = 'sqlite'
+    process_name = None      # 임베디드 엔진이라 현재 파이썬 프로세스가 곧 DB
+    placeholder = '?'
+
+    def __init__(self, path=DEFAULT_SQLITE_PATH, shipments=DEFAULT_SQLITE_SHIPMENTS, seed=1205):
+        self.path = path
+        self.shipments = shipments
+        self.seed = seed
+
+    def connect(self):
+        return sqlite3.connect(self.path, check_same_thread=False)
+
+    # sqlite3 커서는 원래 한 행씩 step 하므로 기본 stream_cursor 그대로 사용
+
+    def backend_pid(self, conn):
+        return threading.get_native_id()    # 쿼리는 호출한 스레드에서 실행됨
+
+    def explain(self, conn, sql):
+        # SQLite 는 ANALYZE 계획이 없으므로 EXPLAIN QUERY PLAN (id, parent, notused, detail)
+        rows = conn.execute("EXPLAIN QUERY PLAN " + sql).fetchall()
+        return 'sqlite-eqp', [list(row) for row in rows]
+
+    def prepare(self):
+        if os.path.exists(self.path):
+            return
+        from benchmark import datasets
+        print(f"📦 SQLite 데이터셋 생성 중: {self.path} (화물 {self.shipments:,}건)")
+        datasets.build_sqlite_dataset(self.path, self.shipments, seed=self.seed)
+
+    def describe(self):
+        return f"sqlite:///{self.path}"
+
+DRIVERS = {
+    'mysql': MySQLDriver,
+    'postgres': PostgresDriver,
+    'sqlite': SQLiteDriver,
+}
+
+def get_driver(name, **kwargs):
+    if name not in DRIVERS:
+        raise ValueError(f"알 수 없는 백엔드: {name} (선택: {', '.join(DRIVERS)})")
+    return DRIVERS[name](**kwargs)
@@ -0,0 +1,260 @@
+import json
+import queue
+import random
+import argparse
+import threading
+import time
+from datetime import datetime
+
+from benchmark import drivers, scenarios
+from benchmark.monitor import ResourceMonitor
+from benchmark.stats import summarize
+
+# ==========================================
+# 동시 부하 생성기 (읽기 경로)
+# ==========================================
+# 운영에서는 배송 조회 페이지 독자 수백 명이 동시에 읽으므로,
+# 1커넥션 1쿼리 측정만으로는 정규화/비정규화의 포화 지점을 알 수 없습니다.
+#
+#   closed loop : 워커 N개가 각자 커넥션으로 "응답 받으면 바로 다음 요청" (동시성 N 고정)
+#   open loop   : 목표 QPS로 요청이 도착하고(스케줄러) 워커 풀이 처리.
+#                 지연 시간은 "예정 도착 시각"부터 재므로 대기열 적체가 그대로 드러납니다. (coordinated omission 방지)
+#
+#   python -m benchmark.load --backend mysql --scenario normalized_index denormalized --concurrency 1 4 16 64
+#   python -m benchmark.load --backend postgres --mode open --qps 100 200 400 800 --workers 64
+
+DEFAULT_CONCURRENCY = (1, 2, 4, 8, 16)
+DEFAULT_QPS = (50, 100, 200, 400)
+DEFAULT_DURATION = 10.0        # 단계별 측정 시간 (초)
+DEFAULT_WARMUP_SECONDS = 2.0   # 단계마다 측정 전 버리는 구간
+DEFAULT_LIMIT = 50             # 조회 페이지 한 번에 보는 행 수 정도
+SATURATION_GAIN = 1.05         # 동시성을 늘려도 처리량 증가가 5% 미만이면 포화
+SATURATION_QPS_RATIO = 0.95    # open loop: 달성 QPS가 목표의 95% 미만이면 포화
+ERROR_BACKOFF_BASE = 0.01      # 연속 실패 시 재시도 대기 (초, 실패할 때마다 2배)
+ERROR_BACKOFF_MAX = 1.0
+
+class LoadStep:
+    """부하 단계 1개 (동시성 또는 목표 QPS 하나) 실행"""
+    def __init__(self, driver, sql, workers, duration, warmup, think_time=0.0,
+                 qps=None, arrival='poisson'):
+        self.driver = driver
+        self.sql = sql
+        self.workers = workers
+        self.duration = duration
+        self.warmup = warmup
+        self.think_time = think_time
+        self.qps = qps
+        self.arrival = arrival
+        self.stop = threading.Event()
+        self.lock = threading.Lock()
+        self.latencies = []     # 측정 구간에 끝난 요청의 지연 시간(ns)
+        self.errors = 0
+        self.backlog = queue.Queue()
+
+    def _record(self, done_ns, latency_ns):
+        if self.measure_start <= done_ns <= self.measure_end:
+            with self.lock:
+                self.latencies.append(latency_ns)
+
+    def _fail(self, conn, failures):
+        # 실패한 트랜잭션을 정리해야 다음 요청이 이어짐 (PostgreSQL 은 롤백 전까지 aborted 상태)
+        with self.lock:
+            self.errors += 1
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        # 접속 거부 / 락 대기 타임아웃처럼 계속 실패하면 바로 재시도하지 않고 지수 백오프 (종료 신호가 오면 즉시 깨어남)
+        self.stop.wait(min(ERROR_BACKOFF_BASE * 2 ** (failures - 1), ERROR_BACKOFF_MAX))
+
+    def _query(self, cursor):
+        cursor.execute(self.sql)
+        cursor.fetchall()
+
+    def _closed_worker(self, conn):
+        cursor = conn.cursor()
+        failures = 0
+        while not self.stop.is_set():
+            t0 = time.perf_counter_ns()
+            try:
+                self._query(cursor)
+            except Exception:
+                failures += 1
+                self._fail(conn, failures)
+                continue
+            failures = 0
+            t1 = time.perf_counter_ns()
+            self._record(t1, t1 - t0)
+            if self.think_time:
+                time.sleep(self.think_time)
+
+    def _open_worker(self, conn):
+        # 측정이 끝나면 남은 대기열은 처리하지 않고 바로 종료 (적체는 run 에서 종료 시점 qsize 로 기록)
+        cursor = conn.cursor()
+        failures = 0
+        while not self.stop.is_set():
+            try:
+                scheduled = self.backlog.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            try:
+                self._query(cursor)
+            except Exception:
+                failures += 1
+                self._fail(conn, failures)
+                continue
+            failures = 0
+            t1 = time.perf_counter_ns()
+            self._record(t1, t1 - scheduled)
+
+    def _schedule(self):
+        """목표 QPS로 예정 도착 시각을 대기열에 넣음 (poisson: 지수 분포 간격 / uniform: 고정 간격)"""
+        rng = random.Random(self.qps)
+        next_at = time.perf_counter_ns()
+        interval_ns = 1e9 / self.qps
+        while not self.stop.is_set():
+            now = time.perf_counter_ns()
+            if now < next_at:
+                time.sleep(min((next_at - now) / 1e9, 0.01))
+                continue
+            self.backlog.put(int(next_at))
+            gap = rng.expovariate(1.0) * interval_ns if self.arrival == 'poisson' else interval_ns
+            next_at += gap
+
+    def run(self):
+        conns = [self.driver.connect() for _ in range(self.workers)]   # 워커 전용 커넥션 (연결 시간은 측정 제외)
+        target = self._open_worker if self.qps else self._closed_worker
+        threads = [threading.Thread(target=target, args=(conn,), daemon=True) for conn in conns]
+        if self.qps:
+            threads.append(threading.Thread(target=self._schedule, daemon=True))
+
+        monitor = ResourceMonitor(target_name=self.driver.process_name, verbose=False)
+        start = time.perf_counter_ns()
+        self.measure_start = start + int(self.warmup * 1e9)
+        self.measure_end = self.measure_start + int(self.duration * 1e9)
+        for t in threads:
+            t.start()
+
+        time.sleep(self.warmup)
+        monitor.start()
+        time.sleep(self.duration)
+        server = monitor.stop()
+        self.stop.set()
+        backlog = self.backlog.qsize() if self.qps else 0    # 측정 종료 시점에 처리되지 못하고 쌓인 요청 수
+        for t in threads:
+            t.join()
+        for conn in conns:
+            conn.close()
+
+        latency = summarize(self.latencies)
+        result = {
+            'workers': self.workers,
+            'target_qps': self.qps,
+            'completed': len(self.latencies),
+            'throughput_qps': len(self.latencies) / self.duration,
+            'errors': self.errors,
+            'backlog': backlog,
+            'latency': latency,
+            'server': server,
+        }
+        return result
+
+def find_saturation(steps, mode):
+    """포화 직전 단계 반환 (없으면 None)"""
+    for prev, cur in zip(steps, steps[1:]):
+        if mode == 'open':
+            if cur['throughput_qps'] < cur['target_qps'] * SATURATION_QPS_RATIO:
+                return prev
+        elif cur['throughput_qps'] < prev['throughput_qps'] * SATURATION_GAIN:
+            return prev
+    if mode == 'open' and steps and steps[0]['throughput_qps'] < steps[0]['target_qps'] * SATURATION_QPS_RATIO:
+        return steps[0]
+    return None
+
+def print_steps(scenario, steps, mode):
+    print(f"\n📊 [{scenario.title}] {mode} loop 램프 결과 (지연 단위 ms)")
+    head = 'target QPS' if mode == 'open' else 'workers'
+    print(f"{head:>10} {'처리량 QPS':>11} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7} {'backlog':>8} {'서버 CPU%':>10}")
+    for s in steps:
+        lat = s['latency']
+        key = s['target_qps'] if mode == 'open' else s['workers']
+        cpu = s['server'].get('cpu_util_pct')
+        cpu = f"{cpu:.1f}" if cpu is not None else '-'
+        if lat['n']:
+            print(f"{key:>10} {s['throughput_qps']:>11.1f} {lat['p50_ms']:>9.2f} {lat['p95_ms']:>9.2f} "
+                  f"{lat['p99_ms']:>9.2f} {s['errors']:>7} {s['backlog']:>8} {cpu:>10}")
+        else:
+            print(f"{key:>10} {0:>11.1f} {'-':>9} {'-':>9} {'-':>9} {s['errors']:>7} {s['backlog']:>8} {cpu:>10}")
+    knee = find_saturation(steps, mode)
+    if knee:
+        key = f"목표 {knee['target_qps']} QPS" if mode == 'open' else f"동시성 {knee['workers']}"
+        print(f"🧱 포화 지점: {key} 부근 (처리량 {knee['throughput_qps']:.1f} QPS)")
+    else:
+        print("🧱 포화 지점: 측정 범위 안에서는 포화되지 않음")
+
+def run_ramp(driver, scenario, args):
+    sql = scenario.render(driver.dialect, args.limit)
+    levels = args.qps if args.mode == 'open' else args.concurrency
+    steps = []
+    for level in levels:
+        if args.mode == 'open':
+            print(f"🚦 [{scenario.name}] 목표 {level} QPS (워커 {args.workers}) ...")
+            step = LoadStep(driver, sql, args.workers, args.duration, args.warmup_seconds,
+                            qps=level, arrival=args.arrival)
+        else:
+            print(f"🚦 [{scenario.name}] 동시성 {level} ...")
+            step = LoadStep(driver, sql, level, args.duration, args.warmup_seconds, think_time=args.think_time)
+        steps.append(step.run())
+    print_steps(scenario, steps, args.mode)
+    return steps
+
+def main():
+    parser = argparse.ArgumentParser(description="조회 쿼리 동시 부하 생성기 (closed / open loop)")
+    parser.add_argument("--backend", choices=list(drivers.DRIVERS), default='mysql')
+    parser.add_argument("--scenario", nargs='+', default=['normalized_index', 'denormalized'],
+                        help=f"부하를 줄 시나리오 (all / {' / '.join(scenarios.SCENARIOS)})")
+    parser.add_argument("--mode", choices=('closed', 'open'), default='closed')
+    parser.add_argument("--concurrency", type=int, nargs='+', default=list(DEFAULT_CONCURRENCY),
+                        help="closed loop 동시성 램프 (워커 수 목록)")
+    parser.add_argument("--qps", type=float, nargs='+', default=list(DEFAULT_QPS), help="open loop 목표 QPS 램프")
+    parser.add_argument("--workers", type=int, default=32, help="open loop 워커(커넥션) 수")
+    parser.add_argument("--arrival", choices=('poisson', 'uniform'), default='poisson', help="open loop 도착 간격 분포")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="단계별 측정 시간(초)")
+    parser.add_argument("--warmup-seconds", type=float, default=DEFAULT_WARMUP_SECONDS, help="단계별 워밍업 시간(초)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="closed loop 요청 사이 대기(초)")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="조회 행 수 (LIMIT)")
+    parser.add_argument("--sqlite-path", default=drivers.DEFAULT_SQLITE_PATH)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    try:
+        selected = scenarios.get_scenarios(args.scenario)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.backend == 'sqlite':
+        driver = drivers.get_driver('sqlite', path=args.sqlite_path)
+    else:
+        driver = drivers.get_driver(args.backend)
+    driver.prepare()
+    print(f"🔌 백엔드: {driver.describe()} / 모드: {args.mode} loop")
+
+    results = {}
+    for scenario in selected:
+        results[scenario.name] = run_ramp(driver, scenario, args)
+
+    if args.output:
+        document = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'backend': driver.name,
+            'mode': args.mode,
+            'limit': args.limit,
+            'duration': args.duration,
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+import os
+import time
+import threading
+
+# ==========================================
+# /proc 기반 자원 모니터
+# ==========================================
+# 기존 모니터는 이름이 맞는 프로세스 중 RSS가 가장 큰 1개만 cpu_percent로 샘플링했기 때문에
+# PostgreSQL의 커넥션별 backend 프로세스(실제로 쿼리를 실행하는 프로세스)를 놓쳤고,
+# 0% 샘플을 버린 평균이라 값이 부풀려졌습니다.
+#
+# 여기서는 서버 프로세스 트리 전체(+ 명시적으로 등록한 backend PID / MySQL 스레드)를
+# /proc 에서 직접 읽고, 측정 구간의 "누적 카운터 차이(delta)"를 보고합니다.
+#   - CPU 시간 (프로세스: user/sys 틱, /proc/<pid>/stat / backend: ns 단위 실행·대기 시간, /proc/<pid>/schedstat)
+#   - RSS (/proc/<pid>/stat)
+#   - IO 바이트 (/proc/<pid>/io, 권한이 없으면 None)
+#   - 컨텍스트 스위치 (/proc/<pid>/status)
+
+PROC = '/proc'
+CLK_TCK = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+DEFAULT_INTERVAL = 0.02      # 샘플링 주기 (초). 짧게 살다 죽는 backend 를 놓치지 않도록 촘촘하게
+DEFAULT_RESCAN = 0.5         # 프로세스 트리 재탐색 주기 (초)
+
+COUNTER_FIELDS = ('utime', 'stime', 'run_ns', 'runq_wait_ns', 'read_bytes', 'write_bytes', 'rchar', 'wchar',
+                  'voluntary_ctxt_switches', 'nonvoluntary_ctxt_switches')
+
+def proc_available():
+    return os.path.isdir(os.path.join(PROC, 'self'))
+
+def _read(path):
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return None
+
+def _parse_stat(text):
+    # comm 에 공백/괄호가 있을 수 있으므로 마지막 ')' 기준으로 자릅니다.
+    head, _, rest = text.rpartition(')')
+    fields = rest.split()
+    return {
+        'comm': head.partition('(')[2],
+        'ppid': int(fields[1]),
+        'utime': int(fields[11]),
+        'stime': int(fields[12]),
+        'starttime': int(fields[19]),
+        'rss': int(fields[21]) * PAGE_SIZE,
+    }
+
+def read_counters(pid, precise=False):
+    """
+    pid(또는 스레드 tid)의 누적 카운터. 프로세스가 없으면 None
+    precise=True 면 ns 단위 schedstat 도 읽습니다. 틱(보통 10ms) 단위 utime/stime 은 짧은 쿼리에서 0으로 뭉개지지만,
+    schedstat 은 해당 태스크(메인 스레드) 하나만 집계하므로 단일 스레드(backend 프로세스/스레드)에만 씁니다.
+    """
+    stat = _read(f"{PROC}/{pid}/stat")
+    if stat is None:
+        return None
+    counters = _parse_stat(stat)
+
+    schedstat = _read(f"{PROC}/{pid}/schedstat") if precise else None
+    if schedstat:
+        run_ns, wait_ns, _ = schedstat.split()
+        counters['run_ns'] = int(run_ns)
+        counters['runq_wait_ns'] = int(wait_ns)
+
+    status = _read(f"{PROC}/{pid}/status") or ''
+    for line in status.splitlines():
+        key, _, value = line.partition(':')
+        if key in ('voluntary_ctxt_switches', 'nonvoluntary_ctxt_switches'):
+            counters[key] = int(value)
+
+    io = _read(f"{PROC}/{pid}/io")          # 다른 유저(postgres/mysql) 프로세스는 root 가 아니면 읽을 수 없음
+    if io:
+        for line in io.splitlines():
+            key, _, value = line.partition(':')
+            if key in ('read_bytes', 'write_bytes', 'rchar', 'wchar'):
+                counters[key] = int(value)
+    return counters
+
+def counters_delta(before, after):
+    """두 스냅샷의 차이 (읽을 수 없었던 항목은 None)"""
+    delta = {}
+    for key in COUNTER_FIELDS:
+        if before is None or after is None or key not in before or key not in after:
+            delta[key] = None
+        else:
+            delta[key] = after[key] - before[key]
+    return delta
+
+def summarize_delta(delta, wall_seconds=None):
+    """delta(틱 단위 CPU) -> 보고용 dict (ms / bytes / 횟수)"""
+    user = delta.get('utime')
+    sys_ = delta.get('stime')
+    run_ns = delta.get('run_ns')
+    wait_ns = delta.get('runq_wait_ns')
+    if run_ns is not None:
+        cpu_ms = run_ns / 1e6
+    elif user is not None and sys_ is not None:
+        cpu_ms = (user + sys_) * 1000 / CLK_TCK
+    else:
+        cpu_ms = None
+    report = {
+        'cpu_user_ms': user * 1000 / CLK_TCK if user is not None else None,
+        'cpu_sys_ms': sys_ * 1000 / CLK_TCK if sys_ is not None else None,
+        'cpu_ms': cpu_ms,
+        'runq_wait_ms': wait_ns / 1e6 if wait_ns is not None else None,
+        'read_bytes': delta.get('read_bytes'),
+        'write_bytes': delta.get('write_bytes'),
+        'rchar': delta.get('rchar'),
+        'wchar': delta.get('wchar'),
+        'ctx_voluntary': delta.get('voluntary_ctxt_switches'),
+        'ctx_involuntary': delta.get('nonvoluntary_ctxt_switches'),
+    }
+    if wall_seconds and cpu_ms is not None:
+        report['cpu_util_pct'] = cpu_ms / (wall_seconds * 1000) * 100
+    return report
+
+def _uptime_ticks():
+    with open(f"{PROC}/uptime") as f:
+        return int(float(f.read().split()[0]) * CLK_TCK)
+
+def _scan_processes():
+    """pid -> (comm, ppid) 전체 목록"""
+    table = {}
+    for name in os.listdir(PROC):
+        if not name.isdigit():
+            continue
+        stat = _read(f"{PROC}/{name}/stat")
+        if stat is None:
+            continue
+        parsed = _parse_stat(stat)
+        table[int(name)] = (parsed['comm'], parsed['ppid'])
+    return table
+
+def find_process_tree(target_name):
+    """이름이 target_name 을 포함하는 프로세스와 그 자손 전체의 pid 집합"""
+    table = _scan_processes()
+    target = target_name.lower()
+    roots = {pid for pid, (comm, _) in table.items() if target in comm.lower()}
+    children = {}
+    for pid, (_, ppid) in table.items():
+        children.setdefault(ppid, []).append(pid)
+    tree, stack = set(), list(roots)
+    while stack:
+        pid = stack.pop()
+        if pid in tree:
+            continue
+        tree.add(pid)
+        stack.extend(children.get(pid, ()))
+    return tree
+
+class ResourceMonitor:
+    """
+    서버 프로세스 트리의 자원 사용량을 측정 구간(start ~ stop) 동안의 delta로 보고합니다.
+    - target_name 이 주어지면 이름이 일치하는 프로세스와 그 자식 전체 (postgres: postmaster + backend들)
+    - target_name 이 None 이면 현재 프로세스 (SQLite처럼 임베디드 엔진)
+    - watch(pid) 로 backend PID / MySQL 스레드 OS id 를 명시적으로 추가할 수 있습니다.
+
+    구간 중 종료된 프로세스(커넥션을 닫은 backend)는 마지막 샘플 값까지만 집계되므로
+    interval 이 짧을수록 정확합니다. 구간 중 새로 생긴 프로세스는 생성 시점부터 전부 집계합니다.
+    """
+    def __init__(self, target_name=None, interval=DEFAULT_INTERVAL, rescan=DEFAULT_RESCAN, verbose=True):
+        self.target_name = target_name
+        self.interval = interval
+        self.rescan = rescan
+        self.verbose = verbose
+        self.available = proc_available()
+        self.monitoring = False
+        self.thread = None
+        self._lock = threading.Lock()
+        self._reset()
+
+        if not self.available and verbose:
+            print("⚠️ 경고: /proc 을 찾을 수 없습니다. (Linux 전용) 자원 측정을 건너뜁니다.")
+
+    def _reset(self):
+        self.first = {}          # pid -> 구간 시작 시점(또는 처음 본 시점) 카운터
+        self.last = {}           # pid -> 마지막 샘플 카운터
+        self.rss_peak = 0
+        self.samples = 0
+        self.pids = set()
+        self.watched = set()
+
+    def _discover(self):
+        if self.target_name is None:
+            return {os.getpid()}
+        return find_process_tree(self.target_name)
+
+    def watch(self, pid):
+        """트리 밖의 pid/tid 를 추가로 추적 (예: pg_backend_pid(), MySQL THREAD_OS_ID)"""
+        if pid is None or not self.monitoring:
+            return
+        with self._lock:
+            self.watched.add(pid)
+            self._sample_pid(pid)
+
+    def _sample_pid(self, pid):
+        # 트리 프로세스는 스레드 전체(종료된 스레드 포함)가 합산되는 stat 틱, backend 는 ns 단위 schedstat
+        counters = read_counters(pid, precise=pid in self.watched)
+        if counters is None:
+            return None
+        if pid not in self.first:
+            # 구간 시작 이후에 생긴 프로세스는 0부터 집계
+            if counters['starttime'] >= self.start_ticks:
+                self.first[pid] = {key: 0 for key in COUNTER_FIELDS if key in counters}
+            else:
+                self.first[pid] = counters
+        self.last[pid] = counters
+        return counters
+
+    def _sample(self):
+        with self._lock:
+            rss = 0
+            for pid in self.pids | self.watched:
+                counters = self._sample_pid(pid)
+                if counters is not None and pid in self.pids:
+                    rss += counters['rss']
+            self.rss_peak = max(self.rss_peak, rss)
+            self.samples += 1
+
+    def start(self):
+        self._reset()
+        if not self.available:
+            return
+        self.monitoring = True
+        self.start_ticks = _uptime_ticks()
+        self.start_time = time.perf_counter()
+        self.pids = self._discover()
+        if self.verbose:
+            label = self.target_name or f"현재 프로세스 {os.getpid()}"
+            if self.pids:
+                print(f"✅ 타겟 확정: {label} (프로세스 {len(self.pids)}개)")
+            else:
+                print(f"⚠️ 경고: '{label}' 프로세스를 찾을 수 없습니다. (같은 호스트의 서버만 측정 가능)")
+        self._sample()
+
+        def monitor_loop():
+            next_rescan = time.perf_counter() + self.rescan
+            while self.monitoring:
+                time.sleep(self.interval)
+                if time.perf_counter() >= next_rescan:
+                    discovered = self._discover()
+                    with self._lock:
+                        self.pids |= discovered
+                    next_rescan = time.perf_counter() + self.rescan
+                self._sample()
+
+        self.thread = threading.Thread(target=monitor_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """측정 구간 전체의 delta 리포트 반환"""
+        if not self.available:
+            return {'available': False}
+        self.monitoring = False
+        self.thread.join()
+        self._sample()
+        wall = time.perf_counter() - self.start_time
+
+        tree = [pid for pid in self.last if pid in self.pids]
+        report = summarize_delta(self._total(tree), wall)
+        report.update({
+            'available': True,
+            'wall_ms': wall * 1000,
+            'processes': len(tree),
+            'samples': self.samples,
+            'rss_peak_mb': self.rss_peak / (1024 * 1024),
+        })
+        # backend(커넥션 전용 프로세스/스레드)는 트리 합계와 별도로 보고 (MySQL 스레드는 트리 합계에 이미 포함)
+        backends = [pid for pid in self.last if pid in self.watched]
+        if backends:
+            report['backend'] = summarize_delta(self._total(backends), wall)
+            report['backend']['pids'] = len(backends)
+        return report
+
+    def _total(self, pids):
+        total = {key: 0 for key in COUNTER_FIELDS}
+        for pid in pids:
+            for key, value in counters_delta(self.first[pid], self.last[pid]).items():
+                if total[key] is None or value is None:
+                    total[key] = None
+                else:
+                    total[key] += value
+        return total
@@ -0,0 +1,163 @@
+import re
+
+# ==========================================
+# 실행 계획(EXPLAIN) 수집 / 비교
+# ==========================================
+# 소요 시간만으로는 "인덱스를 못 타서 느려졌다"는 것을 증명할 수 없으므로
+# 시나리오마다 실행 계획을 함께 저장하고, 테이블별 접근 방식(access)만 뽑아 비교합니다.
+#   - seq_scan        : 풀 테이블 스캔 (PG Seq Scan / MySQL ALL / SQLite SCAN)
+#   - index_full_scan : 인덱스 전체 스캔 (MySQL index / SQLite SCAN ... USING INDEX)
+#   - index_scan      : 인덱스 탐색 (PG Index Scan / MySQL ref·eq_ref·range / SQLite SEARCH)
+#   - bitmap_scan     : PG Bitmap Heap Scan
+
+SEQ_SCAN = 'seq_scan'
+INDEX_FULL_SCAN = 'index_full_scan'
+INDEX_SCAN = 'index_scan'
+BITMAP_SCAN = 'bitmap_scan'
+
+# 접근 방식의 비용 순위 (클수록 나쁨). 알 수 없는 노드 유형은 비교에서 제외
+ACCESS_RANK = {INDEX_SCAN: 0, BITMAP_SCAN: 1, INDEX_FULL_SCAN: 2, SEQ_SCAN: 3}
+
+PG_NODE_ACCESS = {
+    'Seq Scan': SEQ_SCAN,
+    'Parallel Seq Scan': SEQ_SCAN,
+    'Index Scan': INDEX_SCAN,
+    'Index Only Scan': INDEX_SCAN,
+    'Bitmap Heap Scan': BITMAP_SCAN,
+}
+
+RE_SQLITE_ACCESS = re.compile(
+    r'^(SCAN|SEARCH) (?:TABLE )?(\w+)(?: AS (\w+))?'
+    r'(?: USING (?:COVERING )?INDEX (\w+)| USING (INTEGER PRIMARY KEY))?'
+)
+RE_TABLE_ALIAS = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(?!(?:WHERE|ON|JOIN|LIMIT|ORDER|GROUP|LEFT|INNER)\b)(\w+))?', re.I)
+
+def capture_plan(driver, sql):
+    """새 커넥션으로 실행 계획을 수집합니다. (ANALYZE 는 쿼리를 실제로 한 번 더 실행함)"""
+    conn = driver.connect()
+    try:
+        fmt, raw = driver.explain(conn, sql)
+    finally:
+        conn.close()
+    aliases = table_aliases(sql)
+    accesses = extract_accesses(fmt, raw, aliases)
+    return {'format': fmt, 'raw': raw, 'accesses': accesses}
+
+def table_aliases(sql):
+    """FROM/JOIN 절의 별칭 -> 테이블명 (MySQL/SQLite 계획은 별칭으로 표시되므로)"""
+    aliases = {}
+    for table, alias in RE_TABLE_ALIAS.findall(sql):
+        aliases[table] = table
+        if alias:
+            aliases[alias] = table
+    return aliases
+
+def _access(table, access, index=None):
+    return {'table': table, 'access': access, 'index': index}
+
+def _walk(node):
+    """dict/list 가 섞인 JSON 계획의 모든 dict 노드를 순회"""
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _walk(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk(value)
+
+def _postgres_accesses(raw):
+    accesses = []
+    for node in _walk(raw):
+        table = node.get('Relation Name')
+        if table and 'Node Type' in node:
+            node_type = node['Node Type']
+            access = PG_NODE_ACCESS.get(node_type, INDEX_SCAN if node_type.startswith('Index') else node_type)
+            accesses.append(_access(table, access, node.get('Index Name')))
+    return accesses
+
+def _mysql_accesses(raw):
+    accesses = []
+    for node in _walk(raw):
+        table = node.get('table_name')
+        if not table:
+            continue
+        access_type = node.get('access_type')
+        index = node.get('key') or node.get('index_name')
+        if access_type in ('ALL', 'table'):            # v1: ALL / v2(EXPLAIN ANALYZE JSON): table
+            access = SEQ_SCAN
+        elif access_type == 'index' and node.get('index_access_type', 'index_scan') == 'index_scan':
+            access = INDEX_FULL_SCAN
+        elif access_type is None:
+            continue
+        else:
+            access = INDEX_SCAN
+        accesses.append(_access(table, access, index))
+    return accesses
+
+def _sqlite_accesses(raw):
+    accesses = []
+    for _id, _parent, _unused, detail in raw:
+        m = RE_SQLITE_ACCESS.match(detail)
+        if not m:
+            continue
+        op, table, _alias, index, ipk = m.groups()
+        if op == 'SEARCH':
+            accesses.append(_access(table, INDEX_SCAN, index or ('PRIMARY' if ipk else None)))
+        elif index:
+            accesses.append(_access(table, INDEX_FULL_SCAN, index))
+        else:
+            accesses.append(_access(table, SEQ_SCAN))
+    return accesses
+
+def extract_accesses(fmt, raw, aliases=None):
+    """형식별 원본 계획 -> [{'table', 'access', 'index'}] (중복 제거, 등장 순서 유지)"""
+    if fmt.startswith('postgres'):
+        accesses = _postgres_accesses(raw)
+    elif fmt.startswith('mysql'):
+        accesses = _mysql_accesses(raw)
+    elif fmt.startswith('sqlite'):
+        accesses = _sqlite_accesses(raw)
+    else:
+        raise ValueError(f"알 수 없는 계획 형식: {fmt}")
+    aliases = aliases or {}
+    unique, seen = [], set()
+    for a in accesses:
+        a['table'] = aliases.get(a['table'], a['table'])
+        key = (a['table'], a['access'], a['index'])
+        if key not in seen:
+            seen.add(key)
+            unique.append(a)
+    return unique
+
+def format_accesses(accesses):
+    parts = []
+    for a in accesses:
+        parts.append(f"{a['table']}:{a['access']}" + (f"({a['index']})" if a['index'] else ''))
+    return ', '.join(parts) or '-'
+
+def _by_table(accesses):
+    tables = {}
+    for a in accesses:
+        tables.setdefault(a['table'], set()).add((a['access'], a['index']))
+    return tables
+
+def diff_plans(before, after):
+    """
+    테이블별 접근 방식이 바뀐 곳을 찾습니다.
+    가장 나쁜 접근 방식의 순위가 올라간 테이블(예: index_scan -> seq_scan)은 degraded=True
+    """
+    old, new = _by_table(before), _by_table(after)
+    changes = []
+    for table in sorted(set(old) | set(new)):
+        o, n = old.get(table, set()), new.get(table, set())
+        if o == n:
+            continue
+        worst_old = max((ACCESS_RANK.get(a, -1) for a, _ in o), default=-1)
+        worst_new = max((ACCESS_RANK.get(a, -1) for a, _ in n), default=-1)
+        changes.append({
+            'table': table,
+            'before': sorted(f"{a}({i})" if i else a for a, i in o),
+            'after': sorted(f"{a}({i})" if i else a for a, i in n),
+            'degraded': bool(o) and worst_new > worst_old,
+        })
+    return changes
@@ -0,0 +1,85 @@
+import json
+import platform
+from datetime import datetime
+
+from benchmark.plans import diff_plans
+
+# ==========================================
+# 결과 JSON 저장 / 기준(baseline) 비교
+# ==========================================
+# 스키마 버전(정규화 → 인덱스 → 비정규화 등)마다 결과를 JSON으로 남겨두고,
+# 다음 실행에서 --baseline 으로 넘기면 회귀 여부를 자동으로 판정합니다.
+
+DEFAULT_THRESHOLD = 0.10     # p50이 10% 이상 느려지고 신뢰구간이 겹치지 않으면 회귀
+
+def write_results(path, results, driver, label=None):
+    document = {
+        'label': label,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'backend': driver.name,
+        'target': driver.describe(),
+        'host': platform.node(),
+        'python': platform.python_version(),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+    print(f"💾 결과 저장: {path}")
+
+def load_results(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _key(result):
+    return result['backend'], result['scenario'], result.get('limit'), result.get('offset', 0)
+
+def compare(baseline, results, threshold=DEFAULT_THRESHOLD, phase='total'):
+    """
+    (backend, scenario, limit, offset) 가 같은 결과끼리 p50과 95% 신뢰구간을 비교합니다.
+    - regression  : p50이 threshold 이상 느려지고, 현재 CI 하한 > 기준 CI 상한
+    - improvement : p50이 threshold 이상 빨라지고, 현재 CI 상한 < 기준 CI 하한
+    - same        : 그 외 (편차 범위 안)
+    양쪽 모두 실행 계획이 있으면 테이블별 접근 방식 변화(plan_changes)도 함께 기록합니다.
+    """
+    base_index = {_key(r): r for r in baseline['results']}
+    rows = []
+    for r in results:
+        base = base_index.get(_key(r))
+        if base is None:
+            continue
+        old, new = base['phases'][phase], r['phases'][phase]
+        ratio = new['p50_ms'] / old['p50_ms'] if old['p50_ms'] > 0 else float('inf')
+        if ratio >= 1 + threshold and new['ci95_ms'][0] > old['ci95_ms'][1]:
+            verdict = 'regression'
+        elif ratio <= 1 - threshold and new['ci95_ms'][1] < old['ci95_ms'][0]:
+            verdict = 'improvement'
+        else:
+            verdict = 'same'
+        plan_changes = None
+        if base.get('plan') and r.get('plan'):
+            plan_changes = diff_plans(base['plan']['accesses'], r['plan']['accesses'])
+        rows.append({
+            'backend': r['backend'],
+            'scenario': r['scenario'],
+            'baseline_p50_ms': old['p50_ms'],
+            'p50_ms': new['p50_ms'],
+            'ratio': ratio,
+            'verdict': verdict,
+            'plan_changes': plan_changes,
+        })
+    return rows
+
+def print_comparison(rows, baseline_label=None):
+    icons = {'regression': '🔴', 'improvement': '🟢', 'same': '⚪'}
+    print(f"\n🔍 [기준 비교] baseline: {baseline_label or '-'}")
+    if not rows:
+        print("   비교할 수 있는 (backend, scenario, limit, offset) 조합이 없습니다.")
+        return
+    print(f"{'backend':<10} {'scenario':<22} {'기준 p50':>12} {'현재 p50':>12} {'비율':>8}  판정")
+    for r in rows:
+        print(f"{r['backend']:<10} {r['scenario']:<22} {r['baseline_p50_ms']:>12.2f} {r['p50_ms']:>12.2f} "
+              f"{r['ratio']:>7.2f}x  {icons[r['verdict']]} {r['verdict']}")
+        for change in r.get('plan_changes') or ():
+            flag = "⚠️ 계획 악화" if change['degraded'] else "ℹ️ 계획 변경"
+            print(f"{'':<34}{flag} [{change['table']}] {', '.join(change['before']) or '-'} -> "
+                  f"{', '.join(change['after']) or '-'}")
@@ -0,0 +1,170 @@
+import time
+
+from benchmark import monitor as procmon
+from benchmark import plans
+from benchmark.db import ConnectionPool
+from benchmark.monitor import ResourceMonitor
+from benchmark.stats import summarize
+
+DEFAULT_LIMIT = 1000
+DEFAULT_WARMUP = 2           # 버퍼 풀/캐시 데우기용 (측정 제외)
+DEFAULT_ITERATIONS = 10      # 측정 반복 횟수
+DEFAULT_COOLDOWN = 0.0       # 시나리오 사이 대기 (초). 워밍업으로 대체되어 기본은 0
+
+PHASES = ('connect', 'execute', 'fetch', 'total')
+
+def measure_once(driver, sql, monitor=None, pool=None):
+    """
+    새 커넥션(pool 을 주면 풀에서 빌린 커넥션)으로 1회 실행하고 구간별 시간(ns)과 backend 자원 delta를 반환합니다.
+    - connect : 커넥션 수립 (풀 사용 시 풀에서 빌리는 시간)
+    - execute : execute + 첫 행 수신 (서버 실행 시간 근사)
+    - fetch   : 나머지 행 수신 (전송/파싱 시간)
+    backend delta 는 이 커넥션 전용 프로세스/스레드의 execute ~ fetch 구간 /proc 카운터 차이입니다.
+    """
+    t0 = time.perf_counter_ns()
+    session = pool.acquire() if pool is not None else None
+    conn = session.conn if session is not None else driver.connect()
+    t1 = time.perf_counter_ns()
+
+    pid = driver.backend_pid(conn)
+    if monitor is not None:
+        monitor.watch(pid)
+    before = procmon.read_counters(pid, precise=True) if pid is not None else None
+
+    t2 = time.perf_counter_ns()
+    cursor = driver.stream_cursor(conn)
+    cursor.execute(sql)
+    first = cursor.fetchone()
+    t3 = time.perf_counter_ns()
+    rest = cursor.fetchall()
+    t4 = time.perf_counter_ns()
+
+    after = procmon.read_counters(pid, precise=True) if before is not None else None
+    cursor.close()
+    if session is not None:
+        conn.rollback()     # 읽기 스냅샷을 끝내고 반납 (다음 측정이 이전 트랜잭션을 이어 쓰지 않도록)
+        pool.release(session)
+    else:
+        conn.close()
+
+    rows = len(rest) + (first is not None)
+    timings = {'connect': t1 - t0, 'execute': t3 - t2, 'fetch': t4 - t3, 'total': (t1 - t0) + (t4 - t2)}
+    backend = procmon.counters_delta(before, after) if after is not None else None
+    return rows, timings, backend
+
+def _mean_backend(deltas):
+    """iteration 별 backend delta -> 쿼리 1회 평균 (측정 못 했으면 None)"""
+    deltas = [d for d in deltas if d is not None]
+    if not deltas:
+        return None
+    mean = {}
+    for key in procmon.COUNTER_FIELDS:
+        values = [d[key] for d in deltas]
+        mean[key] = None if None in values else sum(values) / len(values)
+    report = procmon.summarize_delta(mean)
+    report['queries'] = len(deltas)
+    return report
+
+def run_query(driver, scenario, limit=DEFAULT_LIMIT, warmup=DEFAULT_WARMUP,
+              iterations=DEFAULT_ITERATIONS, interval=procmon.DEFAULT_INTERVAL, explain=False, offset=0, pool=None):
+    """
+    시나리오 1개를 워밍업 후 iterations 회 측정하고 결과 dict 반환.
+    explain=True 면 측정이 끝난 뒤 실행 계획을 따로 수집합니다. (EXPLAIN ANALYZE 가 측정값에 섞이지 않도록)
+    pool 을 주면 매번 새 커넥션 대신 풀의 커넥션을 재사용합니다. (connect 구간 = 풀에서 빌리는 시간)
+    """
+    sql = scenario.render(driver.dialect, limit, offset)
+
+    window = f"LIMIT {limit}" + (f" OFFSET {offset}" if offset else '')
+    connection = f"풀 {pool.size}개" if pool is not None else "쿼리마다 새 커넥션"
+    print(f"\n🚀 [{scenario.title}] 실행... ({driver.name}, {window}, {connection}, "
+          f"워밍업 {warmup}회 + 측정 {iterations}회)")
+    for _ in range(warmup):
+        measure_once(driver, sql, pool=pool)
+
+    samples = {phase: [] for phase in PHASES}
+    backend_deltas = []
+    monitor = ResourceMonitor(target_name=driver.process_name, interval=interval, verbose=False)
+    monitor.start()
+    rows = 0
+    for _ in range(iterations):
+        rows, timings, backend = measure_once(driver, sql, monitor, pool)
+        for phase, ns in timings.items():
+            samples[phase].append(ns)
+        backend_deltas.append(backend)
+    server = monitor.stop()
+    per_query = _mean_backend(backend_deltas)
+    plan = plans.capture_plan(driver, sql) if explain else None
+
+    phases = {phase: summarize(values) for phase, values in samples.items()}
+    total = phases['total']
+    print("-" * 50)
+    print(f"⏱️  p50 / p95 / p99 : {total['p50_ms']:.2f} / {total['p95_ms']:.2f} / {total['p99_ms']:.2f} ms")
+    print(f"📈  평균 ± 표준편차 : {total['mean_ms']:.2f} ± {total['stddev_ms']:.2f} ms "
+          f"(95% CI {total['ci95_ms'][0]:.2f} ~ {total['ci95_ms'][1]:.2f})")
+    print(f"🔌  connect / execute / fetch (p50): {phases['connect']['p50_ms']:.2f} / "
+          f"{phases['execute']['p50_ms']:.2f} / {phases['fetch']['p50_ms']:.2f} ms")
+    if per_query:
+        print(f"🧵  backend 1회당 : CPU {_fmt(per_query['cpu_ms'], 'ms')}, read {_fmt(per_query['read_bytes'], 'B')}, "
+              f"ctx switch {_fmt(per_query['ctx_voluntary'])}/{_fmt(per_query['ctx_involuntary'])}")
+    if server.get('available'):
+        print(f"🔥  서버 트리 전체 : CPU {_fmt(server['cpu_ms'], 'ms')} ({_fmt(server.get('cpu_util_pct'), '%')}), "
+              f"프로세스 {server['processes']}개, 최대 RSS {server['rss_peak_mb']:.1f} MB, "
+              f"IO read/write {_fmt(server['read_bytes'], 'B')}/{_fmt(server['write_bytes'], 'B')}")
+    if plan:
+        print(f"📋  실행 계획 ({plan['format']}): {plans.format_accesses(plan['accesses'])}")
+    print("-" * 50)
+
+    return {
+        'backend': driver.name,
+        'scenario': scenario.name,
+        'title': scenario.title,
+        'limit': limit,
+        'offset': offset,
+        'pooled': pool is not None,
+        'rows': rows,
+        'warmup': warmup,
+        'iterations': iterations,
+        'phases': phases,
+        'samples_ns': samples,
+        'backend_per_query': per_query,
+        'server': server,
+        'plan': plan,
+    }
+
+def _fmt(value, unit=''):
+    if value is None:
+        return '-'
+    return f"{value:,.1f}{unit}" if isinstance(value, float) else f"{value:,}{unit}"
+
+def run_scenarios(driver, scenarios, limit=DEFAULT_LIMIT, warmup=DEFAULT_WARMUP,
+                  iterations=DEFAULT_ITERATIONS, cooldown=DEFAULT_COOLDOWN, explain=False, offset=0, pool_size=0):
+    """pool_size > 0 이면 시나리오 전체가 커넥션 풀 하나를 공유 (0 = 쿼리마다 새 커넥션)"""
+    driver.prepare()
+    pool = ConnectionPool(driver, size=pool_size) if pool_size else None
+    results = []
+    try:
+        for i, scenario in enumerate(scenarios):
+            if i and cooldown:
+                time.sleep(cooldown)
+            results.append(run_query(driver, scenario, limit, warmup, iterations, explain=explain, offset=offset,
+                                     pool=pool))
+    finally:
+        if pool is not None:
+            pool.close()
+    return results
+
+def print_report(results):
+    """시나리오별 비교표 (배율은 p50 기준, 가장 느린 시나리오 대비)"""
+    if not results:
+        return
+    slowest = max(r['phases']['total']['p50_ms'] for r in results)
+    print("\n📊 [비교 리포트] (단위 ms, total = connect + execute + fetch)")
+    print(f"{'backend':<10} {'scenario':<22} {'rows':>7} {'p50':>10} {'p95':>10} {'p99':>10} "
+          f"{'stddev':>9} {'95% CI':>21} {'배율':>8} {'CPU ms/회':>10}")
+    for r in results:
+        t = r['phases']['total']
+        speedup = slowest / t['p50_ms'] if t['p50_ms'] > 0 else float('inf')
+        ci = f"{t['ci95_ms'][0]:.2f}~{t['ci95_ms'][1]:.2f}"
+        cpu = _fmt((r['backend_per_query'] or {}).get('cpu_ms'))
+        print(f"{r['backend']:<10} {r['scenario']:<22} {r['rows']:>7,} {t['p50_ms']:>10.2f} {t['p95_ms']:>10.2f} "
+              f"{t['p99_ms']:>10.2f} {t['stddev_ms']:>9.2f} {ci:>21} {speedup:>7.1f}x {cpu:>10}")
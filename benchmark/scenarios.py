@@ -0,0 +1,95 @@
+# ==========================================
+# 쿼리 시나리오 레지스트리
+# ==========================================
+# 시나리오 = 이름 + 설명 + DB(dialect)별 SQL.
+# SQL의 {limit} / {offset} 자리는 실행 시 --limit / --offset 값으로 채워집니다.
+# 새 시나리오는 register(Scenario(...)) 한 줄로 추가합니다.
+
+class Scenario:
+    def __init__(self, name, title, sql):
+        self.name = name
+        self.title = title
+        self.sql = sql        # dialect -> SQL 템플릿
+
+    def render(self, dialect, limit, offset=0):
+        if dialect not in self.sql:
+            raise ValueError(f"[{self.name}] {dialect} 용 SQL이 없습니다.")
+        return self.sql[dialect].format(limit=limit, offset=offset)
+
+SCENARIOS = {}
+
+def register(scenario):
+    SCENARIOS[scenario.name] = scenario
+    return scenario
+
+def get_scenarios(names):
+    """이름 목록 -> 시나리오 목록 ('all' 이면 등록 순서대로 전부)"""
+    if not names or 'all' in names:
+        return list(SCENARIOS.values())
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"알 수 없는 시나리오: {', '.join(unknown)} (선택: {', '.join(SCENARIOS)})")
+    return [SCENARIOS[n] for n in names]
+
+# 1. 정규화 (인덱스 회피): 컬럼에 연산/캐스팅을 걸어 인덱스를 못 타게 함 → 풀 스캔
+register(Scenario(
+    'normalized_no_index',
+    "정규화 (인덱스 회피)",
+    {
+        'mysql': """
+            SELECT SQL_NO_CACHE s.shipment_id,
+                (SELECT status_code FROM shipment_updates u
+                 WHERE (u.shipment_id + 0) = s.shipment_id
+                 ORDER BY timestamp DESC LIMIT 1)
+            FROM shipments s LIMIT {limit} OFFSET {offset}
+        """,
+        'postgres': """
+            SELECT s.shipment_id,
+                (SELECT status_code FROM shipment_updates u
+                 WHERE (u.shipment_id::text || '') = s.shipment_id::text
+                 ORDER BY timestamp DESC LIMIT 1)
+            FROM shipments s LIMIT {limit} OFFSET {offset}
+        """,
+        # SQLite는 단항 + 연산자가 인덱스 사용을 막는 관용 표현
+        'sqlite': """
+            SELECT s.shipment_id,
+                (SELECT status_code FROM shipment_updates u
+                 WHERE +u.shipment_id = s.shipment_id
+                 ORDER BY timestamp DESC LIMIT 1)
+            FROM shipments s LIMIT {limit} OFFSET {offset}
+        """,
+    },
+))
+
+# 2. 정규화 + 인덱스: (shipment_id, timestamp) 복합 인덱스 사용
+_NORMALIZED_INDEX = """
+    SELECT s.shipment_id,
+        (SELECT status_code FROM shipment_updates u
+         WHERE u.shipment_id = s.shipment_id
+         ORDER BY timestamp DESC LIMIT 1)
+    FROM shipments s LIMIT {limit} OFFSET {offset}
+"""
+register(Scenario(
+    'normalized_index',
+    "정규화 + 인덱스 사용",
+    {
+        'mysql': _NORMALIZED_INDEX.replace("SELECT s.shipment_id", "SELECT SQL_NO_CACHE s.shipment_id", 1),
+        'postgres': _NORMALIZED_INDEX,
+        'sqlite': _NORMALIZED_INDEX,
+    },
+))
+
+# 3. 비정규화: shipments.current_status 컬럼 직접 조회 (README의 ALTER TABLE 선행 필요)
+_DENORMALIZED = """
+    SELECT s.shipment_id, s.current_status
+    FROM shipments s LIMIT {limit} OFFSET {offset}
+"""
+register(Scenario(
+    'denormalized',
+    "비정규화 (컬럼 직접 조회)",
+    {
+        'mysql': _DENORMALIZED.replace("SELECT s.shipment_id", "SELECT SQL_NO_CACHE s.shipment_id", 1),
+        'postgres': _DENORMALIZED,
+        'sqlite': _DENORMALIZED,
+    },
+))
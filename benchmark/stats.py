@@ -0,0 +1,48 @@
+import math
+
+# ==========================================
+# 반복 측정 통계
+# ==========================================
+# 1회 측정으로는 운영 환경의 편차를 알 수 없으므로 여러 번 측정한 샘플(ns)을 요약합니다.
+# scipy 없이 쓰기 위해 95% 신뢰구간용 t 분포 임계값을 표로 둡니다.
+
+# 자유도 -> t(0.975). 30 초과는 정규분포 근사(1.96)
+_T_975 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+    10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110,
+    18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060,
+    26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+}
+
+def t_critical(df):
+    return _T_975.get(df, 1.96)
+
+def percentile(sorted_values, q):
+    """선형 보간 백분위수 (numpy.percentile 기본값과 동일). q: 0~100"""
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * q / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+def summarize(samples_ns):
+    """ns 샘플 목록 -> ms 단위 요약 (평균, 표준편차, 백분위수, 평균의 95% 신뢰구간)"""
+    values = sorted(v / 1e6 for v in samples_ns)
+    n = len(values)
+    if not n:
+        return {'n': 0}
+    mean = sum(values) / n
+    stddev = math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1)) if n > 1 else 0.0
+    half = t_critical(n - 1) * stddev / math.sqrt(n) if n > 1 else 0.0
+    return {
+        'n': n,
+        'mean_ms': mean,
+        'stddev_ms': stddev,
+        'min_ms': values[0],
+        'max_ms': values[-1],
+        'p50_ms': percentile(values, 50),
+        'p95_ms': percentile(values, 95),
+        'p99_ms': percentile(values, 99),
+        'ci95_ms': [mean - half, mean + half],
+    }
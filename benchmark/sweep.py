@@ -0,0 +1,202 @@
+import os
+import csv
+import json
+import math
+import argparse
+import tempfile
+from datetime import datetime
+
+from benchmark import datasets, drivers, runner, scenarios
+
+# ==========================================
+# 데이터 규모별 스윕 벤치마크
+# ==========================================
+# README 수치는 65만 건 데이터셋 1개 + LIMIT 500/1000 한 번의 결과뿐이라
+# shipment_updates 가 커질 때 / 화물당 이력 수가 늘어날 때 최신 상태 서브쿼리와
+# current_status 컬럼이 어떻게 늘어나는지 알 수 없습니다.
+#
+#   python -m benchmark.sweep --backend sqlite --sizes 1000 10000 100000 --fanout model 10 40
+#   python -m benchmark.sweep --backend mysql --sizes 10000 100000 1000000 --allow-truncate
+#
+# 규모(화물 수) x 화물당 이력 수(fanout) 조합마다 데이터셋을 생성기로 새로 만들고,
+# 시나리오 x LIMIT/OFFSET 구간을 측정해 스케일링 표와 차트용 CSV/JSON 을 남깁니다.
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_FANOUTS = ('model',)
+DEFAULT_WINDOWS = ('1000:0',)
+DEFAULT_ITERATIONS = 5
+DEFAULT_WARMUP = 1
+
+def parse_window(text):
+    """'LIMIT[:OFFSET]' -> (limit, offset)"""
+    limit, _, offset = text.partition(':')
+    return int(limit), int(offset or 0)
+
+def parse_fanout(text):
+    """'model' -> None (기본 상태 모델), 숫자 -> 화물당 고정 이력 수"""
+    return None if text == 'model' else int(text)
+
+def prepare_dataset(args, size, fanout):
+    """규모/fanout 조합의 데이터셋을 준비하고 드라이버 반환"""
+    model = datasets.fanout_model(fanout)
+    label = fanout if fanout is not None else 'model'
+    if args.backend == 'sqlite':
+        path = os.path.join(args.workdir, f"sweep_{size}_{label}_{args.seed}.sqlite3")
+        if args.rebuild or not os.path.exists(path):
+            print(f"\n📦 SQLite 데이터셋 생성: 화물 {size:,}건 / 이력 {label} -> {path}")
+            datasets.build_sqlite_dataset(path, size, seed=args.seed, status_model=model)
+        return drivers.get_driver('sqlite', path=path, shipments=size, seed=args.seed)
+
+    driver = drivers.get_driver(args.backend)
+    print(f"\n📦 {args.backend} 데이터셋 재생성: 화물 {size:,}건 / 이력 {label}")
+    datasets.rebuild_server_dataset(driver, size, seed=args.seed, status_model=model,
+                                    sink_name=args.sink, workers=args.workers)
+    return driver
+
+def scaling_exponent(points):
+    """(이력 수, p50) 점들의 로그-로그 기울기. 1.0이면 선형, 0이면 규모와 무관"""
+    points = [(x, y) for x, y in points if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(x) for x, _ in points]
+    ys = [math.log(y) for _, y in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    var = sum((x - mx) ** 2 for x in xs)
+    if var == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var
+
+def run_sweep(args, selected, sizes, fanouts, windows):
+    rows = []
+    over_budget = set()      # (scenario, fanout, window): 이미 시간 예산을 넘긴 조합은 더 큰 규모에서 건너뜀
+    for fanout in fanouts:
+        for size in sizes:
+            driver = prepare_dataset(args, size, fanout)
+            shipments, updates = datasets.count_rows(driver)
+            for limit, offset in windows:
+                for scenario in selected:
+                    key = (scenario.name, fanout, limit, offset)
+                    row = {
+                        'backend': driver.name,
+                        'shipments': shipments,
+                        'updates': updates,
+                        'updates_per_shipment': updates / shipments if shipments else 0,
+                        'fanout': fanout if fanout is not None else 'model',
+                        'limit': limit,
+                        'offset': offset,
+                        'scenario': scenario.name,
+                    }
+                    if key in over_budget or offset >= shipments:
+                        row['skipped'] = True
+                        rows.append(row)
+                        continue
+                    result = runner.run_query(driver, scenario, limit, args.warmup, args.iterations, offset=offset)
+                    total = result['phases']['total']
+                    row.update({
+                        'skipped': False,
+                        'rows': result['rows'],
+                        'p50_ms': total['p50_ms'],
+                        'p95_ms': total['p95_ms'],
+                        'p99_ms': total['p99_ms'],
+                        'mean_ms': total['mean_ms'],
+                        'stddev_ms': total['stddev_ms'],
+                        'backend_cpu_ms': (result['backend_per_query'] or {}).get('cpu_ms'),
+                    })
+                    rows.append(row)
+                    if args.time_budget and total['p50_ms'] / 1000 > args.time_budget:
+                        print(f"⏭️  [{scenario.name}] p50 {total['p50_ms'] / 1000:.1f}초 > 예산 {args.time_budget}초 "
+                              f"→ 더 큰 규모에서는 건너뜁니다.")
+                        over_budget.add(key)
+    return rows
+
+def print_scaling_table(rows, selected):
+    """(fanout, 구간)별로 규모 x 시나리오 p50 표 + 로그-로그 기울기"""
+    names = [s.name for s in selected]
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['fanout'], row['limit'], row['offset']), []).append(row)
+
+    for (fanout, limit, offset), group in groups.items():
+        print(f"\n📊 [스케일링] 이력/화물={fanout}, LIMIT {limit} OFFSET {offset} (p50 ms)")
+        print(f"{'shipments':>12} {'updates':>12} {'upd/ship':>9} " + " ".join(f"{n:>22}" for n in names))
+        by_size = {}
+        for row in group:
+            by_size.setdefault((row['shipments'], row['updates'], row['updates_per_shipment']), {})[row['scenario']] = row
+        for (shipments, updates, per), cells in sorted(by_size.items()):
+            values = []
+            for n in names:
+                cell = cells.get(n)
+                values.append(f"{'skip':>22}" if not cell or cell['skipped'] else f"{cell['p50_ms']:>22.2f}")
+            print(f"{shipments:>12,} {updates:>12,} {per:>9.1f} " + " ".join(values))
+
+        slopes = []
+        for n in names:
+            points = [(r['updates'], r['p50_ms']) for r in group if r['scenario'] == n and not r['skipped']]
+            slope = scaling_exponent(points)
+            slopes.append(f"{'-':>22}" if slope is None else f"{slope:>22.2f}")
+        print(f"{'기울기(log-log)':>35} " + " ".join(slopes))
+
+def write_chart_data(rows, csv_path=None, json_path=None, meta=None):
+    if csv_path:
+        fields = ['backend', 'fanout', 'shipments', 'updates', 'updates_per_shipment', 'limit', 'offset',
+                  'scenario', 'skipped', 'rows', 'p50_ms', 'p95_ms', 'p99_ms', 'mean_ms', 'stddev_ms', 'backend_cpu_ms']
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"💾 차트 데이터(CSV): {csv_path}")
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({**(meta or {}), 'rows': rows}, f, ensure_ascii=False, indent=2)
+        print(f"💾 스윕 결과(JSON): {json_path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터 규모별 정규화 / 인덱스 / 비정규화 조회 스케일링 벤치마크")
+    parser.add_argument("--backend", choices=list(drivers.DRIVERS), default='sqlite')
+    parser.add_argument("--scenario", nargs='+', default=['all'],
+                        help=f"실행할 시나리오 (all / {' / '.join(scenarios.SCENARIOS)})")
+    parser.add_argument("--sizes", type=int, nargs='+', default=list(DEFAULT_SIZES), help="데이터셋 화물 수 목록")
+    parser.add_argument("--fanout", nargs='+', default=list(DEFAULT_FANOUTS),
+                        help="화물당 이력 수 목록 (model: 기본 상태 전이 모델, 숫자: 고정 건수)")
+    parser.add_argument("--windows", nargs='+', default=list(DEFAULT_WINDOWS),
+                        help="측정 구간 LIMIT[:OFFSET] 목록 (예: 500 1000:0 1000:50000)")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="p50이 이 시간(초)을 넘은 시나리오는 더 큰 규모에서 건너뜀")
+    parser.add_argument("--seed", type=int, default=1205)
+    parser.add_argument("--workdir", default=tempfile.gettempdir(), help="SQLite 데이터셋 저장 디렉터리")
+    parser.add_argument("--rebuild", action='store_true', help="SQLite 데이터셋이 있어도 다시 생성")
+    parser.add_argument("--sink", default=None, help="서버 DB 적재 방식 (기본: mysql executemany / postgres copy)")
+    parser.add_argument("--workers", type=int, default=1, help="서버 DB 생성 프로세스 수")
+    parser.add_argument("--allow-truncate", action='store_true',
+                        help="mysql/postgres 스윕 시 화물/상품/이력 테이블을 비우고 다시 생성하는 것에 동의")
+    parser.add_argument("--csv", help="차트용 CSV 저장 경로")
+    parser.add_argument("--output", help="스윕 결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    try:
+        selected = scenarios.get_scenarios(args.scenario)
+        fanouts = [parse_fanout(f) for f in args.fanout]
+        windows = [parse_window(w) for w in args.windows]
+    except ValueError as e:
+        parser.error(str(e))
+    if args.backend != 'sqlite' and not args.allow_truncate:
+        parser.error("mysql/postgres 스윕은 기존 화물 데이터를 지우므로 --allow-truncate 가 필요합니다.")
+
+    sizes = sorted(set(args.sizes))
+    rows = run_sweep(args, selected, sizes, fanouts, windows)
+    print_scaling_table(rows, selected)
+    meta = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'backend': args.backend,
+        'sizes': sizes,
+        'fanouts': args.fanout,
+        'windows': args.windows,
+        'iterations': args.iterations,
+        'seed': args.seed,
+    }
+    write_chart_data(rows, args.csv, args.output, meta)
+
+if __name__ == "__main__":
+    main()
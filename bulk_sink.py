@@ -0,0 +1,249 @@
+import os
+import time
+import tempfile
+
+# ==========================================
+# 생성기 공용 적재(Sink) 계층
+# ==========================================
+# - executemany : 기존 INSERT ... VALUES 방식 (fallback, 모든 드라이버 지원)
+# - load_data   : MySQL  LOAD DATA LOCAL INFILE (pymysql, local_infile=True 필요)
+# - copy        : PostgreSQL COPY ... FROM STDIN (psycopg2)
+#
+# 생성기는 write_rows()로 테이블별 행을 쌓고 flush()로 한 번에 적재합니다.
+# flush()는 테이블을 처음 쓰인 순서대로 적재하므로
+# shipments -> shipment_items -> shipment_updates 순서(외래 키)가 그대로 유지됩니다.
+
+SINK_CHOICES = ('executemany', 'load_data', 'copy')
+DEFAULT_SINK = 'executemany'
+
+# 이 크기를 넘으면 메모리 버퍼가 임시 파일로 넘어갑니다 (COPY 전용)
+SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
+def dialect_of(sink_name):
+    """sink 이름으로 대상 DB 종류 판단"""
+    return 'postgres' if sink_name == 'copy' else 'mysql'
+
+def connect(sink_name, mysql_config, pg_config=None):
+    """sink에 맞는 드라이버로 접속 (psycopg2는 COPY를 쓸 때만 import)"""
+    if dialect_of(sink_name) == 'postgres':
+        import psycopg2
+        if pg_config is None:
+            raise ValueError("COPY sink에는 PostgreSQL 접속 정보(pg_config)가 필요합니다.")
+        return psycopg2.connect(**pg_config)
+
+    import pymysql
+    config = dict(mysql_config)
+    if sink_name == 'load_data':
+        config['local_infile'] = True
+    return pymysql.connect(**config)
+
+def _escape_field(value):
+    """MySQL LOAD DATA / PostgreSQL COPY(text) 공통 이스케이프 규칙"""
+    if value is None:
+        return '\\N'
+    text = str(value)
+    if '\\' in text or '\t' in text or '\n' in text or '\r' in text:
+        text = (text.replace('\\', '\\\\')
+                    .replace('\t', '\\t')
+                    .replace('\n', '\\n')
+                    .replace('\r', '\\r'))
+    return text
+
+def encode_rows(rows):
+    """행 목록을 탭 구분(TSV) 텍스트로 변환"""
+    return ''.join('\t'.join(_escape_field(v) for v in row) + '\n' for row in rows)
+
+def _column_to_text(arr):
+    """NumPy 컬럼 배열 1개를 이스케이프된 문자열 리스트로 변환"""
+    import numpy as np
+    arr = np.asarray(arr)
+    if arr.dtype.kind == 'M':
+        return np.char.replace(np.datetime_as_string(arr, unit='s'), 'T', ' ').tolist()
+    if arr.dtype.kind in 'iub':
+        return arr.astype(np.int64).astype(str).tolist()
+    if arr.dtype.kind == 'f':
+        return arr.astype(str).tolist()
+    # 문자열/객체 컬럼은 값 종류가 적으므로 고유값만 한 번씩 이스케이프
+    cache = {}
+    return [cache[v] if v in cache else cache.setdefault(v, _escape_field(v)) for v in arr.tolist()]
+
+def encode_columns(arrays):
+    """컬럼 배열 묶음을 TSV 텍스트로 변환 (batch_synth 출력용)"""
+    columns = [_column_to_text(arr) for arr in arrays]
+    if not columns or not columns[0]:
+        return ''
+    return '\n'.join('\t'.join(row) for row in zip(*columns)) + '\n'
+
+def columns_to_rows(arrays):
+    """컬럼 배열 묶음을 행 튜플 리스트로 변환 (datetime64 -> datetime)"""
+    import numpy as np
+    return list(zip(*(np.asarray(arr).tolist() for arr in arrays)))
+
+class BaseSink:
+    def __init__(self, conn):
+        self.conn = conn
+        self.cursor = conn.cursor()
+        self.pending = {}   # table -> (columns, 버퍼)
+        self.stats = {}     # table -> [적재 행 수, 적재 소요 시간(초)]
+
+    def _buffer_for(self, table, columns):
+        if table not in self.pending:
+            self.pending[table] = (tuple(columns), self._new_buffer())
+        columns_, buffer = self.pending[table]
+        if tuple(columns) != columns_:
+            raise ValueError(f"{table}: 같은 flush 안에서 컬럼 구성이 달라졌습니다.")
+        return buffer
+
+    def write_rows(self, table, columns, rows):
+        if not rows:
+            return
+        self._append(self._buffer_for(table, columns), rows)
+
+    def write_columns(self, table, columns, arrays):
+        """행 대신 컬럼 배열(NumPy)을 받는 버전. 기본 구현은 행으로 풀어서 적재"""
+        self.write_rows(table, columns, columns_to_rows(arrays))
+
+    def flush(self):
+        """버퍼에 쌓인 테이블을 순서대로 적재 (커밋은 호출한 쪽에서)"""
+        pending, self.pending = self.pending, {}
+        for table, (columns, buffer) in pending.items():
+            start = time.perf_counter()
+            count = self._load(table, columns, buffer)
+            self._record(table, count, time.perf_counter() - start)
+
+    def _record(self, table, rows, seconds):
+        entry = self.stats.setdefault(table, [0, 0.0])
+        entry[0] += rows
+        entry[1] += seconds
+
+    def close(self):
+        self.pending = {}
+        self.cursor.close()
+
+    # 하위 클래스 구현부
+    def _new_buffer(self):
+        raise NotImplementedError
+
+    def _append(self, buffer, rows):
+        raise NotImplementedError
+
+    def _load(self, table, columns, buffer):
+        raise NotImplementedError
+
+class ExecuteManySink(BaseSink):
+    """기존 executemany 경로 (fallback)"""
+
+    def _new_buffer(self):
+        return []
+
+    def _append(self, buffer, rows):
+        buffer.extend(rows)
+
+    def _load(self, table, columns, buffer):
+        placeholders = ', '.join(['%s'] * len(columns))
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        self.cursor.executemany(sql, buffer)
+        return len(buffer)
+
+class _TextBufferSink(BaseSink):
+    """TSV 텍스트 버퍼를 쓰는 sink 공통부 (버퍼 = [파일 객체, 행 수])"""
+
+    def _append(self, buffer, rows):
+        buffer[0].write(encode_rows(rows))
+        buffer[1] += len(rows)
+
+    def write_columns(self, table, columns, arrays):
+        # 행 튜플을 거치지 않고 배열에서 바로 TSV로 씁니다.
+        count = len(arrays[0]) if len(arrays) else 0
+        if not count:
+            return
+        buffer = self._buffer_for(table, columns)
+        buffer[0].write(encode_columns(arrays))
+        buffer[1] += count
+
+    def close(self):
+        for _, buffer in self.pending.values():
+            self._discard(buffer)
+        super().close()
+
+    def _discard(self, buffer):
+        buffer[0].close()
+
+class MySQLLoadDataSink(_TextBufferSink):
+    """
+    LOAD DATA LOCAL INFILE 적재.
+    pymysql은 LOCAL INFILE을 '파일 경로'로만 읽을 수 있어서
+    메모리 버퍼 대신 이름 있는 임시 파일에 씁니다.
+    """
+
+    def _new_buffer(self):
+        f = tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='', suffix='.tsv', delete=False)
+        return [f, 0]
+
+    def _load(self, table, columns, buffer):
+        f, count = buffer
+        f.close()
+        try:
+            path = f.name.replace('\\', '/')
+            self.cursor.execute(
+                f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {table} "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                "LINES TERMINATED BY '\\n' "
+                f"({', '.join(columns)})"
+            )
+        finally:
+            os.unlink(f.name)
+        return count
+
+    def _discard(self, buffer):
+        buffer[0].close()
+        if os.path.exists(buffer[0].name):
+            os.unlink(buffer[0].name)
+
+class PostgresCopySink(_TextBufferSink):
+    """COPY FROM STDIN 적재 (SPOOL_MAX_BYTES 까지는 메모리, 넘으면 임시 파일)"""
+
+    def _new_buffer(self):
+        f = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode='w+', encoding='utf-8', newline='')
+        return [f, 0]
+
+    def _load(self, table, columns, buffer):
+        f, count = buffer
+        try:
+            f.seek(0)
+            self.cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", f)
+        finally:
+            f.close()
+        return count
+
+SINKS = {
+    'executemany': ExecuteManySink,
+    'load_data': MySQLLoadDataSink,
+    'copy': PostgresCopySink,
+}
+
+def make_sink(sink_name, conn):
+    if sink_name not in SINKS:
+        raise ValueError(f"알 수 없는 sink: {sink_name} (선택: {', '.join(SINK_CHOICES)})")
+    return SINKS[sink_name](conn)
+
+def merge_stats(total, stats):
+    """워커별 stats를 하나로 합침"""
+    for table, (rows, seconds) in stats.items():
+        entry = total.setdefault(table, [0, 0.0])
+        entry[0] += rows
+        entry[1] += seconds
+    return total
+
+def print_report(sink_name, stats, elapsed=None):
+    """테이블별 rows/sec 리포트 출력"""
+    print("-" * 60)
+    print(f"📊 적재 리포트 (sink: {sink_name})")
+    for table, (rows, seconds) in stats.items():
+        rate = rows / seconds if seconds > 0 else 0
+        print(f"   - {table:<18}: {rows:>10,}행 / {seconds:8.2f}초 → {rate:>12,.0f} rows/sec")
+    if elapsed:
+        total_rows = sum(rows for rows, _ in stats.values())
+        print(f"   - 전체 경과 시간     : {elapsed:.2f}초 ({total_rows / elapsed:,.0f} rows/sec)")
+    print("-" * 60)
@@ -1,10 +1,12 @@
-import pymysql
 import time
 import threading
 import queue
 import random
 from datetime import datetime
 
+from benchmark.db import ConnectionPool
+from benchmark.drivers import MySQLDriver
+
 # ==========================================
 # 1. 환경 설정 (DB 접속 정보)
 # ==========================================
@@ -17,25 +19,359 @@ db_config = {
     'autocommit': True
 }
 
+# 공유 커넥션 풀 크기 (ConsistencyBenchmark 인스턴스 + 비동기 워커 + 관찰자가 커넥션 1개씩 빌림)
+DB_POOL_SIZE = 256
+
 # 테스트할 횟수 (각 전략당)
 TEST_ITERATIONS = 100 
 
+# 비동기 워커(Strategy C) 배치 설정
+ASYNC_BATCH_SIZE = 200      # 한 트랜잭션에 반영할 최대 메시지 수
+ASYNC_LINGER = 0.02         # 첫 메시지를 받은 뒤 배치를 더 모으는 최대 대기 시간(초)
+ASYNC_APPLY_DELAY = 0.05    # 🔥[부하 주입] 반영 트랜잭션 1회당 DB 지연(초)
+
+# 수렴 지연(convergence lag) 측정 설정
+CONVERGENCE_RATE = 50        # 지속 부하: 초당 쓰기 수
+CONVERGENCE_DURATION = 10.0  # 지속 부하 유지 시간(초)
+CONVERGENCE_POLL = 0.005     # 관찰자가 shipments 를 다시 읽는 간격(초) = 측정 해상도
+CONVERGENCE_TIMEOUT = 60.0   # 부하 종료 후 모든 쓰기가 보일 때까지 기다리는 한도(초)
+CONVERGENCE_SLA = 1.0        # 쓰기 후 이 시간(초) 안에 조회에 보여야 한다는 목표
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def db_pool():
+    """db_config 로 만든 프로세스 공용 커넥션 풀 (benchmark.db.ConnectionPool)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(MySQLDriver(db_config), size=DB_POOL_SIZE)
+        return _pool
+
+# ==========================================
+# 2. 비동기 반영(projection) 공통 함수
+# ==========================================
+# 큐 메시지 = (shipment_id, status, enqueue 시각, 버전). None 은 워커 종료 신호입니다.
+# 버전 = 원본 shipment_updates 행의 (timestamp, update_id). shipments.(last_updated_at, last_update_id) 보다
+# 새로운 버전일 때만 반영하므로, 여러 워커/재시도로 메시지 순서가 뒤바뀌어도 오래된 상태가 덮어쓰지 않습니다.
+# ConsistencyBenchmark 의 단일 워커와 projection.py 의 파티션 워커가 같이 사용합니다.
+
+# 화물별 진짜 최신 이력 행 (timestamp 가 같으면 update_id 가 큰 것)
+LATEST_UPDATE_SQL = """
+    SELECT shipment_id, status_code, timestamp, update_id
+    FROM (
+        SELECT shipment_id, status_code, timestamp, update_id,
+               ROW_NUMBER() OVER (PARTITION BY shipment_id ORDER BY timestamp DESC, update_id DESC) AS rn
+        FROM shipment_updates
+    ) ranked
+    WHERE rn = 1
+"""
+
+# 새 버전일 때만 반영하는 조건 (shipments 별칭 s, 새 값 별칭 v)
+NEWER_VERSION_CONDITION = "(s.last_update_id IS NULL OR (v.timestamp, v.update_id) > (s.last_updated_at, s.last_update_id))"
+
+# Strategy A 상태 동기화 (prepared statement 'sync_status'): 새 버전일 때만 반영 + 🔥[부하 주입] SLEEP(0.05)
+SYNC_STATUS_SQL = f"""
+    UPDATE shipments s
+    JOIN (SELECT %s AS timestamp, %s AS update_id) v
+    SET s.current_status = %s, s.last_updated_at = v.timestamp, s.last_update_id = v.update_id
+    WHERE s.shipment_id = %s
+      AND {NEWER_VERSION_CONDITION}
+      AND SLEEP(0.05) = 0
+"""
+
+def ensure_projection_version(cursor):
+    """shipments.last_update_id 컬럼이 없으면 추가하고, 기존 최신 이력으로 상태/버전을 채움"""
+    cursor.execute(
+        """
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'shipments' AND COLUMN_NAME = 'last_update_id'
+        """
+    )
+    if cursor.fetchone()[0]:
+        return
+    cursor.execute("ALTER TABLE shipments ADD COLUMN last_update_id INT NULL")
+    cursor.execute(
+        f"""
+        UPDATE shipments s
+        JOIN ({LATEST_UPDATE_SQL}) latest ON latest.shipment_id = s.shipment_id
+        SET s.current_status = latest.status_code,
+            s.last_updated_at = latest.timestamp,
+            s.last_update_id = latest.update_id
+        """
+    )
+    print("✅ [Setup] shipments.last_update_id (프로젝션 버전) 컬럼 추가 및 채움 완료")
+
+def verify_projection(cursor, sample=5):
+    """테이블 전체에서 shipments.current_status 가 진짜 최신 이력 행과 일치하는지 검사"""
+    cursor.execute(
+        f"""
+        SELECT s.shipment_id, s.current_status, latest.status_code, s.last_update_id, latest.update_id
+        FROM shipments s
+        JOIN ({LATEST_UPDATE_SQL}) latest ON latest.shipment_id = s.shipment_id
+        WHERE NOT (s.current_status <=> latest.status_code)
+           OR NOT (s.last_update_id <=> latest.update_id)
+        """
+    )
+    rows = cursor.fetchall()
+    cursor.execute("SELECT COUNT(DISTINCT shipment_id) FROM shipment_updates")
+    checked = cursor.fetchone()[0]
+    status_mismatch = [r for r in rows if r[1] != r[2]]
+    version_mismatch = len(rows) - len(status_mismatch)     # 상태값은 같지만 가리키는 이력 행이 다름
+    return {
+        'checked': checked,
+        'status_mismatch': len(status_mismatch),
+        'version_mismatch': version_mismatch,
+        'samples': [
+            {'shipment_id': r[0], 'current_status': r[1], 'latest_status': r[2],
+             'last_update_id': r[3], 'latest_update_id': r[4]}
+            for r in status_mismatch[:sample]
+        ],
+    }
+
+def print_verification(result):
+    print(f"🔎 프로젝션 전체 검증: 이력이 있는 화물 {result['checked']}건 중 "
+          f"상태 불일치 {result['status_mismatch']}건 / 버전만 다름 {result['version_mismatch']}건")
+    for r in result['samples']:
+        print(f"   - shipment_id={r['shipment_id']}: current_status={r['current_status']} "
+              f"(update_id {r['last_update_id']}) / 최신 이력={r['latest_status']} (update_id {r['latest_update_id']})")
+
+def new_async_metrics():
+    return {'batches': 0, 'received': 0, 'applied': 0, 'stale': 0, 'queue_depth': [], 'apply_lag': []}
+
+def drain_batch(msg_queue, batch_size, linger, timeout=None):
+    """첫 메시지를 기다린 뒤 linger 동안(또는 batch_size 까지) 큐에 쌓인 메시지를 한꺼번에 꺼냄 (종료 신호에서 멈춤)"""
+    try:
+        batch = [msg_queue.get(timeout=timeout)]
+    except queue.Empty:
+        return []
+    deadline = time.perf_counter() + linger
+    while len(batch) < batch_size and batch[-1] is not None:
+        remaining = deadline - time.perf_counter()
+        try:
+            batch.append(msg_queue.get(timeout=remaining) if remaining > 0 else msg_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+def apply_status_batch(cursor, latest):
+    """
+    화물별 (상태, 버전)을 조건부 UPDATE 한 문장으로 반영하고 실제 반영된 행 수를 반환.
+    shipments 행은 항상 있으므로 upsert 대신 "더 새로운 버전일 때만 UPDATE" 로 같은 효과를 냅니다.
+    """
+    rows = " UNION ALL ".join(
+        ["SELECT %s AS shipment_id, %s AS status_code, %s AS timestamp, %s AS update_id"] * len(latest)
+    )
+    params = [value for s_id, (status, (ts, update_id)) in latest.items() for value in (s_id, status, ts, update_id)]
+    return cursor.execute(
+        f"""
+        UPDATE shipments s
+        JOIN ({rows}) v ON v.shipment_id = s.shipment_id
+        SET s.current_status = v.status_code,
+            s.last_updated_at = v.timestamp,
+            s.last_update_id = v.update_id
+        WHERE {NEWER_VERSION_CONDITION}
+        """,
+        params
+    )
+
+def coalesce_latest(batch):
+    """같은 화물에 대한 메시지는 버전이 가장 새로운 것만 남김 (큐에 들어온 순서와 무관)"""
+    latest = {}
+    for s_id, status, _, version in batch:
+        if s_id not in latest or version > latest[s_id][1]:
+            latest[s_id] = (status, version)
+    return latest
+
+def record_batch_metrics(metrics, batch, latest, applied):
+    applied_at = time.perf_counter()
+    metrics['batches'] += 1
+    metrics['received'] += len(batch)
+    metrics['applied'] += applied
+    metrics['stale'] += len(latest) - applied       # 이미 더 새로운 버전이 반영되어 있던 화물
+    metrics['apply_lag'].extend(applied_at - enqueued_at for _, _, enqueued_at, _ in batch)
+
+def project_batch(conn, cursor, batch, metrics, apply_delay=ASYNC_APPLY_DELAY):
+    """메시지 묶음을 화물별 최신 버전으로 병합(coalesce)해 트랜잭션 1회로 반영하고 지표를 기록"""
+    latest = coalesce_latest(batch)
+    try:
+        conn.begin()
+        # 🔥[부하 주입] 워커는 느리게 처리함 (사용자와 무관) - 메시지 1건이 아니라 트랜잭션 1회당
+        cursor.execute("DO SLEEP(%s)", (apply_delay,))
+        applied = apply_status_batch(cursor, latest)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"Worker Error: {e}")
+        return
+    record_batch_metrics(metrics, batch, latest, applied)
+
+def merge_async_metrics(metrics_list):
+    merged = new_async_metrics()
+    for m in metrics_list:
+        for key, value in m.items():
+            merged[key] += value
+    return merged
+
+def print_async_metrics(metrics, title):
+    """비동기 워커 지표: 배치 크기, 병합(coalesce) 비율, 큐 깊이, 반영 지연(enqueue -> commit)"""
+    from benchmark.stats import summarize
+
+    if not metrics['batches']:
+        return
+    depth = metrics['queue_depth']
+    lag = summarize([int(seconds * 1e9) for seconds in metrics['apply_lag']])
+    print(f"📮 비동기 워커 지표 ({title})")
+    print(f"   - 트랜잭션 {metrics['batches']}회 / 메시지 {metrics['received']}건 -> 반영 행 {metrics['applied']}건 "
+          f"(평균 배치 {metrics['received'] / metrics['batches']:.1f}건, "
+          f"병합으로 {metrics['received'] - metrics['applied'] - metrics['stale']}건 생략, "
+          f"오래된 버전이라 무시 {metrics['stale']}건)")
+    if depth:
+        print(f"   - 큐 깊이(배치 시작 시점): 평균 {sum(depth) / len(depth):.1f}건 / 최대 {max(depth)}건")
+    print(f"   - 반영 지연(apply lag): p50 {lag['p50_ms']:.1f} ms / p99 {lag['p99_ms']:.1f} ms / max {lag['max_ms']:.1f} ms")
+
+# ==========================================
+# 3. Transactional Outbox (Strategy D)
+# ==========================================
+# 이력 INSERT 와 outbox INSERT 를 한 트랜잭션으로 커밋하므로, 앱 프로세스가 죽어도 반영할 일이 DB에 남습니다.
+# 반영은 별도 poller(outbox_poller.py)가 outbox 를 배치로 가져가(FOR UPDATE SKIP LOCKED) 처리합니다.
+OUTBOX_DDL = """
+    CREATE TABLE IF NOT EXISTS shipment_status_outbox (
+        outbox_id BIGINT PRIMARY KEY AUTO_INCREMENT,
+        shipment_id INT NOT NULL,
+        status_code VARCHAR(50) NOT NULL,
+        update_id INT NOT NULL,
+        update_timestamp DATETIME NOT NULL,
+        created_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+        processed_at DATETIME(6) NULL,
+        INDEX idx_outbox_pending (processed_at, outbox_id)
+    )
+"""
+
+# Strategy D outbox 기록 (prepared statement 'insert_outbox')
+INSERT_OUTBOX_SQL = """
+    INSERT INTO shipment_status_outbox (shipment_id, status_code, update_id, update_timestamp)
+    VALUES (%s, %s, %s, %s)
+"""
+
+def ensure_outbox(cursor):
+    cursor.execute(OUTBOX_DDL)
+
+def pending_outbox(cursor):
+    cursor.execute("SELECT COUNT(*) FROM shipment_status_outbox WHERE processed_at IS NULL")
+    return cursor.fetchone()[0]
+
+class ConvergenceProbe:
+    """
+    쓰기마다 (버전, 쓰기 응답 시각)을 기록하고, 별도 커넥션으로 shipments 를 주기적으로 읽어
+    그 버전(또는 더 새로운 버전)이 처음 보인 시각까지를 수렴 지연으로 잽니다.
+    """
+    def __init__(self, poll=CONVERGENCE_POLL):
+        self.poll = poll
+        self.db = db_pool().acquire()
+        self.cursor = self.db.cursor
+        self.lock = threading.Lock()
+        self.pending = {}     # shipment_id -> [(버전, 쓰기 응답 시각)]
+        self.lags = []        # 수렴 지연(초)
+        self.last_converged_at = None
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def record(self, s_id, version, written_at):
+        with self.lock:
+            self.pending.setdefault(s_id, []).append((version, written_at))
+
+    def pending_count(self):
+        with self.lock:
+            return sum(len(v) for v in self.pending.values())
+
+    def _poll_once(self):
+        with self.lock:
+            ids = list(self.pending)
+        if not ids:
+            return
+        placeholders = ", ".join(["%s"] * len(ids))
+        self.cursor.execute(
+            f"SELECT shipment_id, last_updated_at, last_update_id FROM shipments WHERE shipment_id IN ({placeholders})",
+            ids
+        )
+        rows = self.cursor.fetchall()
+        seen_at = time.perf_counter()
+        with self.lock:
+            for s_id, ts, update_id in rows:
+                if update_id is None:
+                    continue
+                visible = (ts, update_id)
+                waiting = []
+                for version, written_at in self.pending.get(s_id, ()):
+                    if version <= visible:
+                        self.lags.append(max(seen_at - written_at, 0.0))
+                        self.last_converged_at = seen_at
+                    else:
+                        waiting.append((version, written_at))
+                if waiting:
+                    self.pending[s_id] = waiting
+                else:
+                    self.pending.pop(s_id, None)
+
+    def _run(self):
+        while self.running:
+            try:
+                self._poll_once()
+            except Exception as e:
+                print(f"Probe Error: {e}")
+            time.sleep(self.poll)
+
+    def wait_converged(self, timeout):
+        """남은 쓰기가 모두 보일 때까지 대기. 성공하면 True"""
+        deadline = time.perf_counter() + timeout
+        while self.pending_count() and time.perf_counter() < deadline:
+            time.sleep(self.poll)
+        return not self.pending_count()
+
+    def close(self):
+        self.running = False
+        if self.thread:
+            self.thread.join()
+        db_pool().release(self.db)
+
 class ConsistencyBenchmark:
-    def __init__(self):
-        self.conn = pymysql.connect(**db_config)
-        self.cursor = self.conn.cursor()
-        self.shipment_ids = self._fetch_shipment_ids()
+    def __init__(self, msg_queue=None, start_worker=True, shipment_ids=None,
+                 batch_size=ASYNC_BATCH_SIZE, linger=ASYNC_LINGER):
+        """
+        msg_queue / start_worker / shipment_ids 는 여러 스레드가 각자 인스턴스(전용 커넥션)를 만들되
+        비동기 큐와 워커 1개, 대상 화물 ID를 공유할 때 사용합니다. (mixed_workload.py)
+        batch_size / linger 는 비동기 워커가 한 트랜잭션에 모아 반영할 메시지 수와 대기 시간입니다.
+        """
+        self.pool = db_pool()
+        self.db = self.pool.acquire()       # 인스턴스 수명 동안 빌려 쓰는 커넥션 (재사용 커서 + prepared statement)
+        self.conn = self.db.conn
+        self.cursor = self.db.cursor
+        self.shipment_ids = shipment_ids or self._fetch_shipment_ids()
+        self.last_version = None      # 마지막 쓰기의 (timestamp, update_id) - 수렴 지연 측정용
+        ensure_projection_version(self.cursor)
         
         # 비동기 처리를 위한 큐와 워커 스레드 설정
-        self.msg_queue = queue.Queue()
-        self.worker_running = True
-        self.worker_thread = threading.Thread(target=self._async_worker)
-        self.worker_thread.daemon = True
-        self.worker_thread.start()
+        self.batch_size = batch_size
+        self.linger = linger
+        self.async_metrics = new_async_metrics()
+        self.msg_queue = msg_queue if msg_queue is not None else queue.Queue()
+        self.worker_running = start_worker
+        self.worker_thread = None
+        if start_worker:
+            self.worker_thread = threading.Thread(target=self._async_worker)
+            self.worker_thread.daemon = True
+            self.worker_thread.start()
 
     def _fetch_shipment_ids(self, limit=100):
         """테스트에 사용할 존재하는 화물 ID 목록 가져오기"""
-        self.cursor.execute(f"SELECT shipment_id FROM shipments LIMIT {limit}")
+        self.cursor.execute("SELECT shipment_id FROM shipments LIMIT %s", (limit,))
         return [row[0] for row in self.cursor.fetchall()]
 
     def _get_random_target(self):
@@ -44,6 +380,13 @@ class ConsistencyBenchmark:
         new_status = random.choice(['집화완료', '터미널입고', '배송출발', '배송완료', '수취확인'])
         return s_id, new_status
 
+    def _insert_update(self, s_id, status, notes):
+        """이력 행을 적재하고 프로젝션 버전 (timestamp, update_id) 반환"""
+        ts = datetime.now().replace(microsecond=0)     # DATETIME 컬럼 정밀도(초)에 맞춤
+        update_id = self.db.insert('insert_update', (s_id, status, notes, ts))
+        self.last_version = (ts, update_id)
+        return self.last_version
+
     # ---------------------------------------------------------
     # 전략 1: 동기적 애플리케이션 트랜잭션 (Sync Transaction)
     # ---------------------------------------------------------
@@ -55,27 +398,16 @@ class ConsistencyBenchmark:
             self.conn.begin()
             
             # 1. 로그 적재
-            self.cursor.execute(
-                "INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, NOW())",
-                (s_id, status, "Sync Update")
-            )
+            ts, update_id = self._insert_update(s_id, status, "Sync Update")
             
-            # 2. 상태 동기화 + 🔥[부하 주입] 0.05초 강제 지연 (DB Lock 시뮬레이션)
+            # 2. 상태 동기화 (더 새로운 버전일 때만) + 🔥[부하 주입] 0.05초 강제 지연 (DB Lock 시뮬레이션)
             # 실제로는 복잡한 연산이나 Lock 대기 시간이 발생한다고 가정
-            self.cursor.execute(
-                """
-                UPDATE shipments 
-                SET current_status = %s, last_updated_at = NOW() 
-                WHERE shipment_id = %s 
-                AND SLEEP(0.05) = 0 
-                """,
-                (status, s_id)
-            )
+            self.db.execute('sync_status', (ts, update_id, status, s_id), SYNC_STATUS_SQL)
             
             self.conn.commit()
-        except Exception as e:
+        except Exception:
             self.conn.rollback()
-            print(f"Error: {e}")
+            raise       # 실패는 호출자가 오류로 집계 (성공한 쓰기로 세지 않도록)
 
         latency = time.time() - start_time
         return latency, s_id, status
@@ -90,9 +422,11 @@ class ConsistencyBenchmark:
         AFTER INSERT ON shipment_updates 
         FOR EACH ROW 
         BEGIN
+            -- 더 새로운 (timestamp, update_id) 일 때만 반영 (과거 시각으로 늦게 들어온 이력이 덮어쓰지 않도록)
             UPDATE shipments 
-            SET current_status = NEW.status_code, last_updated_at = NEW.timestamp
-            WHERE shipment_id = NEW.shipment_id;
+            SET current_status = NEW.status_code, last_updated_at = NEW.timestamp, last_update_id = NEW.update_id
+            WHERE shipment_id = NEW.shipment_id
+              AND (last_update_id IS NULL OR (NEW.timestamp, NEW.update_id) > (last_updated_at, last_update_id));
             
             -- 트리거가 실행될 때 DB가 바빠서 0.05초 걸린다고 가정
             DO SLEEP(0.05);
@@ -118,10 +452,7 @@ class ConsistencyBenchmark:
         start_time = time.time()
         
         # 앱에서는 INSERT만 수행 (UPDATE는 트리거가 함)
-        self.cursor.execute(
-            "INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, NOW())",
-            (s_id, status, "Trigger Update")
-        )
+        self._insert_update(s_id, status, "Trigger Update")
         # 커밋은 autocommit=True라 생략 혹은 명시
         
         latency = time.time() - start_time
@@ -131,56 +462,66 @@ class ConsistencyBenchmark:
     # 전략 3: 비동기 메시지 큐 (Async Queue)
     # ---------------------------------------------------------
     def _async_worker(self):
-        worker_conn = pymysql.connect(**db_config)
-        worker_cursor = worker_conn.cursor()
-        
-        while self.worker_running:
-            try:
-                task = self.msg_queue.get(timeout=1)
-                if task:
-                    s_id, status = task
-                    
-                    # 🔥[부하 주입] 워커 스레드는 느리게 처리함 (사용자와 무관)
-                    worker_cursor.execute(
-                        """
-                        UPDATE shipments 
-                        SET current_status = %s, last_updated_at = NOW() 
-                        WHERE shipment_id = %s 
-                        AND SLEEP(0.05) = 0
-                        """,
-                        (status, s_id)
-                    )
-                    worker_conn.commit()
-                    self.msg_queue.task_done()
-            except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"Worker Error: {e}")
+        with self.pool.session() as worker:
+            while self.worker_running:
+                batch = drain_batch(self.msg_queue, self.batch_size, self.linger, timeout=1)
+                if not batch:
+                    continue
+                self.async_metrics['queue_depth'].append(len(batch) + self.msg_queue.qsize())
+                try:
+                    project_batch(worker.conn, worker.cursor, batch, self.async_metrics)
+                finally:
+                    for _ in batch:
+                        self.msg_queue.task_done()
+
+    def report_async_metrics(self):
+        print_async_metrics(self.async_metrics, f"batch_size={self.batch_size}, linger={self.linger}s")
 
     def strategy_async_queue(self):
         s_id, status = self._get_random_target()
         start_time = time.time()
         
         # 1. 로그 적재
-        self.cursor.execute(
-            "INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, NOW())",
-            (s_id, status, "Async Update")
-        )
+        version = self._insert_update(s_id, status, "Async Update")
         
-        # 2. 큐에 던지기 (Fire & Forget)
-        self.msg_queue.put((s_id, status))
+        # 2. 큐에 던지기 (Fire & Forget) - 반영 지연 측정용 enqueue 시각 + 순서 역전 방지용 버전을 함께 전달
+        self.msg_queue.put((s_id, status, time.perf_counter(), version))
         
         # 사용자는 여기서 해방됨 (매우 빠름)
         latency = time.time() - start_time
         return latency, s_id, status
 
+    # ---------------------------------------------------------
+    # 전략 4: Transactional Outbox + Poller
+    # ---------------------------------------------------------
+    def setup_outbox(self):
+        ensure_outbox(self.cursor)
+        print("✅ [Setup] outbox 테이블 준비 완료 (반영은 outbox_poller.py 가 담당)")
+
+    def strategy_outbox(self):
+        s_id, status = self._get_random_target()
+        start_time = time.time()
+
+        try:
+            self.conn.begin()
+            # 1. 로그 적재 + 2. 같은 트랜잭션에서 outbox 기록 (둘 다 커밋되거나 둘 다 안 되거나)
+            ts, update_id = self._insert_update(s_id, status, "Outbox Update")
+            self.db.execute('insert_outbox', (s_id, status, update_id, ts), INSERT_OUTBOX_SQL)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        # shipments 반영은 poller 몫 -> 사용자는 커밋 1회 후 해방
+        latency = time.time() - start_time
+        return latency, s_id, status
+
     # ---------------------------------------------------------
     # 공통: 정합성 검증 (Verification)
     # ---------------------------------------------------------
     def check_consistency(self, s_id, expected_status):
         """DB를 조회해서 현재 상태가 기대값과 일치하는지 확인"""
-        self.cursor.execute(f"SELECT current_status FROM shipments WHERE shipment_id = {s_id}")
-        actual_status = self.cursor.fetchone()[0]
+        actual_status = self.db.execute('read_status', (s_id,)).fetchone()[0]
         return actual_status == expected_status
 
     # ---------------------------------------------------------
@@ -193,13 +534,22 @@ class ConsistencyBenchmark:
         
         latencies = []
         consistency_fails = 0
+        errors = 0
         
         # 워밍업
-        strategy_func()
+        try:
+            strategy_func()
+        except Exception as e:
+            print(f"Warmup Error: {e}")
         
         for _ in range(TEST_ITERATIONS):
-            # 전략 실행
-            latency, s_id, expected = strategy_func()
+            # 전략 실행 (실패한 쓰기는 지연/일관성 집계에서 빼고 오류로만 셈)
+            try:
+                latency, s_id, expected = strategy_func()
+            except Exception as e:
+                errors += 1
+                print(f"Error: {e}")
+                continue
             latencies.append(latency)
             
             # 즉시 일관성 확인 (Write 직후 Read)
@@ -209,19 +559,93 @@ class ConsistencyBenchmark:
                 
         if teardown_func: teardown_func()
         
-        avg_latency = sum(latencies) / len(latencies)
         print(f"📊 결과 리포트 ({strategy_name})")
+        if not latencies:
+            print(f"   ❌ 성공한 쓰기 없음 (오류 {errors}건)")
+            return
+        avg_latency = sum(latencies) / len(latencies)
         print(f"   - 평균 소요 시간 (Latency): {avg_latency:.5f} 초")
-        print(f"   - 쓰기 직후 데이터 불일치 횟수: {consistency_fails} / {TEST_ITERATIONS} 건")
+        print(f"   - 쓰기 직후 데이터 불일치 횟수: {consistency_fails} / {len(latencies)} 건")
+        if errors:
+            print(f"   - 쓰기 실패 (롤백): {errors} / {TEST_ITERATIONS} 건")
         
         if consistency_fails > 0:
             print("   👉 해석: '최종 일관성(Eventual Consistency)' 모델이므로 직후 조회 시 불일치는 정상입니다.")
         else:
             print("   👉 해석: '강한 일관성(Strong Consistency)'이 보장됩니다.")
 
+    def run_convergence(self, strategy_name, strategy_func, rate=CONVERGENCE_RATE, duration=CONVERGENCE_DURATION,
+                        setup_func=None, teardown_func=None, backlog_func=None):
+        """
+        초당 rate 건의 지속 부하를 duration 초 동안 걸면서, 쓰기마다 조회에 보이기까지의 수렴 지연을 재고
+        부하가 끝난 뒤 밀린 반영이 모두 보일 때까지의 시간(time-to-drain)을 잽니다.
+        backlog_func 는 부하 종료 시점의 미반영 잔량 (기본: 비동기 큐 크기, Strategy D 는 미처리 outbox 건수)
+        """
+        from benchmark.stats import summarize
+
+        print(f"\n⏱️ [Convergence: {strategy_name}] 초당 {rate}건 x {duration}초 지속 부하...")
+        if setup_func: setup_func()
+
+        probe = ConvergenceProbe().start()
+        interval = 1.0 / rate
+        started = next_at = time.perf_counter()
+        writes = errors = 0
+        try:
+            while True:
+                now = time.perf_counter()
+                if now >= started + duration:
+                    break
+                if now < next_at:
+                    time.sleep(min(next_at - now, 0.01))
+                    continue
+                next_at += interval
+                try:
+                    _, s_id, _ = strategy_func()
+                except Exception:
+                    errors += 1         # 롤백된 쓰기는 수렴 대상이 아님
+                    continue
+                probe.record(s_id, self.last_version, time.perf_counter())
+                writes += 1
+
+            load_end = time.perf_counter()
+            backlog = backlog_func() if backlog_func else self.msg_queue.qsize()
+            converged = probe.wait_converged(CONVERGENCE_TIMEOUT)
+        finally:
+            probe.close()
+            if teardown_func: teardown_func()
+
+        drain = max(probe.last_converged_at - load_end, 0.0) if converged and probe.last_converged_at else None
+        lag = summarize([int(seconds * 1e9) for seconds in probe.lags])
+        within_sla = sum(1 for seconds in probe.lags if seconds <= CONVERGENCE_SLA)
+        print(f"📊 수렴 지연 리포트 ({strategy_name})")
+        print(f"   - 쓰기 {writes}건 (달성 {writes / duration:.1f}건/초), 부하 종료 시 미반영 잔량 {backlog}건")
+        if errors:
+            print(f"   - 쓰기 실패 (롤백): {errors}건")
+        if lag['n']:
+            print(f"   - 수렴 지연: p50 {lag['p50_ms']:.1f} ms / p99 {lag['p99_ms']:.1f} ms / max {lag['max_ms']:.1f} ms "
+                  f"(측정 해상도 {CONVERGENCE_POLL * 1000:.0f} ms)")
+            print(f"   - SLA {CONVERGENCE_SLA}초 이내 수렴: {within_sla}/{writes}건 ({within_sla / writes:.1%})")
+        if drain is not None:
+            print(f"   - time-to-drain (부하 종료 -> 마지막 쓰기까지 보임): {drain:.3f} 초")
+        else:
+            print(f"   - {CONVERGENCE_TIMEOUT}초 안에 수렴하지 못한 쓰기: {probe.pending_count()}건")
+        return {
+            'strategy': strategy_name,
+            'writes': writes,
+            'errors': errors,
+            'rate': rate,
+            'duration': duration,
+            'backlog_at_load_end': backlog,
+            'lag': lag,
+            'within_sla': within_sla,
+            'time_to_drain': drain,
+            'unconverged': probe.pending_count(),
+        }
+
     def close(self):
+        """빌린 커넥션을 풀에 반납 (비동기 워커는 다음 대기(최대 1초)가 끝나면 스스로 반납)"""
         self.worker_running = False
-        self.conn.close()
+        self.pool.release(self.db)
 
 # ==========================================
 # 실행부 (Main)
@@ -250,9 +674,41 @@ if __name__ == "__main__":
             benchmark.strategy_async_queue
         )
 
+        # 이 시점에 프로세스가 죽으면 메모리 큐에 있던 반영은 사라짐
+        print(f"⚠️ Strategy C: 지금 프로세스가 죽으면 잃는 반영 = 메모리 큐 잔량 {benchmark.msg_queue.qsize()}건")
+
         # 비동기 작업이 다 끝날 때까지 잠시 대기 (큐 비우기)
         print("\n⏳ 비동기 잔여 작업 처리 대기 중...")
         benchmark.msg_queue.join()
+        benchmark.report_async_metrics()
+
+        # 4. 지속 부하에서 비동기 큐의 수렴 지연 (얼마나 오래 stale 한가)
+        benchmark.run_convergence(
+            "Strategy C: 비동기 큐 (Async)",
+            benchmark.strategy_async_queue
+        )
+
+        # 5. Transactional Outbox + Poller (운영에서는 python outbox_poller.py 를 별도 프로세스로 실행)
+        from outbox_poller import OutboxPoller
+
+        benchmark.setup_outbox()
+        poller = OutboxPoller().start()
+        try:
+            benchmark.run_benchmark(
+                "Strategy D: Outbox + Poller",
+                benchmark.strategy_outbox
+            )
+            print(f"💾 Strategy D: 지금 프로세스가 죽어도 outbox 에 남는 반영 = {pending_outbox(benchmark.cursor)}건 (유실 0건)")
+            poller.wait_idle()
+            benchmark.run_convergence(
+                "Strategy D: Outbox + Poller",
+                benchmark.strategy_outbox,
+                backlog_func=lambda: pending_outbox(benchmark.cursor)
+            )
+        finally:
+            poller.stop()
+            poller.report()
+        print_verification(verify_projection(benchmark.cursor))
         print("✅ 모든 테스트 완료.")
         
     finally:
@@ -1,8 +1,13 @@
-import pymysql
 from faker import Faker
 import random
+import time
+import argparse
 from datetime import datetime, timedelta
 
+import bulk_sink
+from status_model import StatusModel
+from benchmark.db import Session
+
 # ==========================================
 # 1. DB 연결 설정 (요청하신 정보 반영 완료)
 # ==========================================
@@ -26,9 +31,13 @@ def get_existing_ids(cursor, table_name, id_column):
     ids = [row[0] for row in cursor.fetchall()]
     return ids
 
-def generate_data():
-    conn = pymysql.connect(**db_config)
+def generate_data(sink_name=bulk_sink.DEFAULT_SINK):
+    conn = bulk_sink.connect(sink_name, db_config)
     cursor = conn.cursor()
+    # 화물은 lastrowid 확보를 위해 1건씩 INSERT (prepared statement 재사용), 상품/이력은 sink로 대량 적재
+    session = Session(conn, 'mysql')
+    sink = bulk_sink.make_sink(sink_name, conn)
+    started = time.perf_counter()
     
     try:
         print("🚀 데이터 생성을 시작합니다...")
@@ -81,6 +90,8 @@ def generate_data():
         BATCH_SIZE = 100        # 한 번에 DB에 넣을 개수 (속도 최적화)
         
         STATUS_FLOW = ['주문접수', '집화완료', '터미널간이동', '배송중', '배송완료']
+        # 항상 처음부터 순서대로 걷는 대신 상태 전이 모델로 이력 생성 (반복/배송 중/long tail 포함)
+        status_model = StatusModel.from_flow(STATUS_FLOW)
 
         # 배치 저장을 위한 리스트
         update_data_list = []
@@ -97,14 +108,8 @@ def generate_data():
             
             created_at = fake.date_time_between(start_date='-1y', end_date='now')
 
-            # 화물 넣기
-            cursor.execute("""
-                INSERT INTO shipments (company_id, origin_warehouse_id, destination_warehouse_id, created_at)
-                VALUES (%s, %s, %s, %s)
-            """, (comp_id, origin_id, dest_id, created_at))
-            
-            # 방금 생성된 화물의 ID 가져오기 (AUTO_INCREMENT)
-            current_shipment_id = cursor.lastrowid
+            # 화물 넣기 + 방금 생성된 화물의 ID 가져오기 (AUTO_INCREMENT)
+            current_shipment_id = session.insert('insert_shipment', (comp_id, origin_id, dest_id, created_at))
 
             # (2) 화물-상품 연결 (Items) 데이터 준비
             num_items = random.randint(1, 3)
@@ -114,19 +119,18 @@ def generate_data():
                 item_data_list.append((current_shipment_id, pid, qty))
 
             # (3) 배송 이력 (Updates) 데이터 준비
-            num_updates = random.randint(1, 5) # 진행 단계 랜덤
             current_time = created_at
             
-            for step in range(num_updates):
-                status = STATUS_FLOW[step]
-                current_time += timedelta(hours=random.randint(2, 24))
+            for status, gap_seconds in status_model.sample_history(random):
+                current_time += timedelta(seconds=gap_seconds)
                 note = f"{status} 처리 (담당자: {fake.last_name()}{fake.first_name()})"
                 update_data_list.append((current_shipment_id, status, note, current_time))
 
             # (4) 일정량 쌓이면 DB에 저장 (Batch Insert)
             if len(item_data_list) >= BATCH_SIZE:
-                cursor.executemany("INSERT INTO shipment_items (shipment_id, product_id, quantity) VALUES (%s, %s, %s)", item_data_list)
-                cursor.executemany("INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, %s)", update_data_list)
+                sink.write_rows("shipment_items", ("shipment_id", "product_id", "quantity"), item_data_list)
+                sink.write_rows("shipment_updates", ("shipment_id", "status_code", "notes", "timestamp"), update_data_list)
+                sink.flush()
                 conn.commit()
                 
                 # 리스트 초기화
@@ -136,18 +140,26 @@ def generate_data():
 
         # 남은 데이터 저장
         if item_data_list:
-            cursor.executemany("INSERT INTO shipment_items (shipment_id, product_id, quantity) VALUES (%s, %s, %s)", item_data_list)
-            cursor.executemany("INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, %s)", update_data_list)
+            sink.write_rows("shipment_items", ("shipment_id", "product_id", "quantity"), item_data_list)
+            sink.write_rows("shipment_updates", ("shipment_id", "status_code", "notes", "timestamp"), update_data_list)
+            sink.flush()
             conn.commit()
 
         print("\n✅ 모든 데이터 생성이 성공적으로 완료되었습니다!")
+        bulk_sink.print_report(sink_name, sink.stats, time.perf_counter() - started)
 
     except Exception as e:
         conn.rollback()
         print(f"❌ 오류 발생: {e}")
         print("💡 힌트: DB 비밀번호나 DB 이름('shipment')이 맞는지 다시 확인해주세요.")
     finally:
+        sink.close()
         conn.close()
 
 if __name__ == "__main__":
-    generate_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Logis-Flow 3000건 더미 데이터 생성기")
+    # 화물 ID를 lastrowid로 받는 구조라 MySQL 전용 sink만 지원합니다.
+    parser.add_argument("--sink", choices=("executemany", "load_data"), default=bulk_sink.DEFAULT_SINK,
+                        help="상품/이력 적재 방식 (executemany / load_data: MySQL LOAD DATA)")
+    args = parser.parse_args()
+    generate_data(args.sink)
\ No newline at end of file
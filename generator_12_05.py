@@ -1,9 +1,15 @@
-import pymysql
 from faker import Faker
 import random
+import time
+import argparse
+import multiprocessing as mp
 from datetime import datetime, timedelta
 from tqdm import tqdm
 
+import bulk_sink
+import batch_synth
+from status_model import StatusModel, DEFAULT_LONG_TAIL_SHARE
+
 # ==========================================
 # 1. DB 연결 설정
 # ==========================================
@@ -15,104 +21,282 @@ db_config = {
     'charset': 'utf8mb4'
 }
 
+# --sink copy 사용 시 PostgreSQL 접속 정보
+pg_db_config = {
+    'host': 'localhost',
+    'user': 'postgres',
+    'password': '',  # ★ 비밀번호 입력 ★
+    'dbname': 'shipment',
+}
+
 fake = Faker('ko_KR')
 
 # ==========================================
 # 2. 설정값
 # ==========================================
-TARGET_SHIPMENTS = 50000      
-BATCH_SIZE = 5000             
+TARGET_SHIPMENTS = 50000
+BATCH_SIZE = 5000
+DEFAULT_WORKERS = 1           # 1이면 기존 단일 프로세스 방식
+DEFAULT_SEED = 1205           # 같은 시드 + 같은 워커 수 + 같은 기간 = 같은 데이터
+DEFAULT_WINDOW_END = datetime(2025, 12, 5)   # 생성일 기간의 끝 (실행 날짜와 무관하게 고정해야 재현됨)
+WINDOW_DAYS = 730             # 기간 끝에서 거슬러 올라가는 일수 (2년)
+ENGINE_CHOICES = ('numpy', 'python')
+DEFAULT_ENGINE = 'numpy'      # numpy: 배치 단위 배열 합성 / python: 화물 1건씩 생성
+
+SHIPMENT_COLUMNS = ('shipment_id', 'company_id', 'origin_warehouse_id', 'destination_warehouse_id', 'created_at')
+ITEM_COLUMNS = ('shipment_id', 'product_id', 'quantity')
+UPDATE_COLUMNS = ('shipment_id', 'status_code', 'notes', 'timestamp')
 
 def get_ids(cursor, table, col):
     cursor.execute(f"SELECT {col} FROM {table}")
     return [row[0] for row in cursor.fetchall()]
 
-def generate_bulk_data():
-    conn = pymysql.connect(**db_config)
+def insert_base_data(conn, cursor, only_if_empty=False):
+    """
+    회사/창고/상품 기초 데이터 보강 후 ID 목록 반환.
+    only_if_empty=True 면 기초 테이블이 비어 있을 때만 넣습니다. (반복 재생성 시 기초 행이 매번 늘어나지 않도록)
+    """
+    if only_if_empty:
+        existing = [get_ids(cursor, table, col) for table, col in
+                    (("companies", "company_id"), ("warehouses", "warehouse_id"), ("products", "product_id"))]
+        if all(existing):
+            return tuple(existing)
+
+    pools = batch_synth.build_text_pools(fake)
+
+    cursor.executemany("INSERT INTO companies (company_name) VALUES (%s)", pools['companies'])
+    cursor.executemany("INSERT INTO warehouses (warehouse_name, address) VALUES (%s, %s)", pools['warehouses'])
+    cursor.executemany("INSERT INTO products (product_name) VALUES (%s)", pools['products'])
+    conn.commit()
+
+    company_ids = get_ids(cursor, "companies", "company_id")
+    warehouse_ids = get_ids(cursor, "warehouses", "warehouse_id")
+    product_ids = get_ids(cursor, "products", "product_id")
+    return company_ids, warehouse_ids, product_ids
+
+def reserve_shipment_ids(conn, cursor, count, dialect='mysql'):
+    """
+    shipments의 AUTO_INCREMENT(PostgreSQL은 시퀀스) 구간을 미리 예약합니다.
+    시작 값은 현재 카운터와 MAX(shipment_id)+1 중 큰 값이라 (행 삭제 / 채우지 않은 이전 예약으로 카운터가 앞서 있어도)
+    카운터를 되감지 않으므로, 구간 [first_id, first_id + count) 은 이미 나간 ID와도 다른 세션과도 겹치지 않습니다.
+    워커들은 이 구간의 명시적인 shipment_id로 안전하게 INSERT 할 수 있습니다.
+    """
+    if dialect == 'postgres':
+        # 트랜잭션 종료(commit) 시 락이 풀립니다.
+        cursor.execute("LOCK TABLE shipments IN EXCLUSIVE MODE")
+        # nextval 로 받은 값은 되돌려지지 않으므로 그대로 구간의 후보 시작 값으로 씀
+        cursor.execute(
+            "SELECT GREATEST(nextval(pg_get_serial_sequence('shipments', 'shipment_id')), "
+            "(SELECT COALESCE(MAX(shipment_id), 0) + 1 FROM shipments))"
+        )
+        first_id = cursor.fetchone()[0]
+        cursor.execute(
+            "SELECT setval(pg_get_serial_sequence('shipments', 'shipment_id'), %s)",
+            (first_id + count - 1,)
+        )
+        conn.commit()
+        return first_id
+
+    # 8.0 은 information_schema.TABLES.AUTO_INCREMENT 를 캐시하므로 이 세션에서는 항상 최신 값을 읽게 함 (5.7 은 변수 없음)
+    try:
+        cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+    except Exception:
+        pass
+    cursor.execute("LOCK TABLES shipments WRITE")
+    try:
+        cursor.execute(
+            "SELECT GREATEST(COALESCE(t.AUTO_INCREMENT, 1), (SELECT COALESCE(MAX(shipment_id), 0) + 1 FROM shipments)) "
+            "FROM information_schema.TABLES t WHERE t.TABLE_SCHEMA = DATABASE() AND t.TABLE_NAME = 'shipments'"
+        )
+        first_id = cursor.fetchone()[0]
+        cursor.execute(f"ALTER TABLE shipments AUTO_INCREMENT = {first_id + count}")
+    finally:
+        cursor.execute("UNLOCK TABLES")
+    conn.commit()
+    return first_id
+
+def split_range(first_id, total, workers):
+    """[first_id, first_id + total) 구간을 워커 수만큼 연속 구간으로 분할"""
+    base, extra = divmod(total, workers)
+    ranges = []
+    start = first_id
+    for w in range(workers):
+        count = base + (1 if w < extra else 0)
+        if count:
+            ranges.append((w, start, count))
+        start += count
+    return ranges
+
+# ==========================================
+# 3. 병렬 워커 (프로세스 1개 = RNG 1개 + 커넥션 1개)
+# ==========================================
+def _build_batch_python(rng, batch_start, batch_end, base_ids, window, status_model):
+    """화물 1건씩 random / timedelta 로 생성하는 기존 방식 (--engine python)"""
+    company_ids, warehouse_ids, product_ids = base_ids
+    window_start, window_seconds = window
+
+    shipment_buffer = []
+    item_buffer = []
+    update_buffer = []
+
+    for s_id in range(batch_start, batch_end):
+        comp_id = rng.choice(company_ids)
+        origin, dest = rng.sample(warehouse_ids, 2)
+        created_at = window_start + timedelta(seconds=rng.randint(0, window_seconds))
+        shipment_buffer.append((s_id, comp_id, origin, dest, created_at))
+
+        num_items = rng.randint(1, 5)
+        for pid in rng.sample(product_ids, num_items):
+            item_buffer.append((s_id, pid, rng.randint(1, 100)))
+
+        current_time = created_at
+        for status, gap_seconds in status_model.sample_history(rng):
+            current_time += timedelta(seconds=gap_seconds)
+            update_buffer.append((s_id, status, "시스템 자동 업데이트", current_time))
+
+    return shipment_buffer, item_buffer, update_buffer
+
+def _generate_range(task, progress=None):
+    """
+    워커 프로세스 진입점.
+    자기 몫의 shipment_id 구간만 생성하므로 다른 워커와 ID가 겹치지 않고,
+    (seed, worker_idx)로 시드된 전용 RNG를 쓰므로 실행 결과가 재현됩니다.
+    """
+    worker_idx, first_id, count, seed, base_ids, window, sink_name, engine, status_model = task
+
+    conn = bulk_sink.connect(sink_name, db_config, pg_db_config)
+    sink = bulk_sink.make_sink(sink_name, conn)
+    if engine == 'numpy':
+        np_rng = batch_synth.make_rng(seed, worker_idx)
+    else:
+        rng = random.Random(seed * 1_000_003 + worker_idx)
+
+    try:
+        for batch_start in range(first_id, first_id + count, BATCH_SIZE):
+            batch_end = min(batch_start + BATCH_SIZE, first_id + count)
+
+            if engine == 'numpy':
+                # 배치 전체를 배열로 한 번에 합성해서 sink에 그대로 넘깁니다.
+                batch = batch_synth.synthesize_batch(
+                    np_rng, batch_start, batch_end - batch_start, base_ids, window, status_model
+                )
+                sink.write_columns('shipments', SHIPMENT_COLUMNS, batch['shipments'])
+                sink.write_columns('shipment_items', ITEM_COLUMNS, batch['shipment_items'])
+                sink.write_columns('shipment_updates', UPDATE_COLUMNS, batch['shipment_updates'])
+            else:
+                shipment_buffer, item_buffer, update_buffer = _build_batch_python(
+                    rng, batch_start, batch_end, base_ids, window, status_model
+                )
+                sink.write_rows('shipments', SHIPMENT_COLUMNS, shipment_buffer)
+                sink.write_rows('shipment_items', ITEM_COLUMNS, item_buffer)
+                sink.write_rows('shipment_updates', UPDATE_COLUMNS, update_buffer)
+
+            sink.flush()
+            conn.commit()
+            if progress:
+                progress(batch_end - batch_start)
+
+        return worker_idx, count, sink.stats
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        sink.close()
+        conn.close()
+
+def generate_bulk_data(total=TARGET_SHIPMENTS, workers=DEFAULT_WORKERS, seed=DEFAULT_SEED,
+                       sink_name=bulk_sink.DEFAULT_SINK, engine=DEFAULT_ENGINE, status_model=None, seed_base=True,
+                       window_end=DEFAULT_WINDOW_END):
+    """
+    화물 total 건 생성. 실패하면 예외를 그대로 올려 호출자(스크립트 종료 코드)가 알 수 있게 합니다.
+    seed_base=False 면 기초 데이터가 이미 있을 때 새로 넣지 않고 재사용합니다. (benchmark.sweep 반복 재생성)
+    생성일은 window_end 이전 WINDOW_DAYS 일 사이에서 뽑습니다.
+    """
+    if total <= 0:
+        print("ℹ️ 생성할 화물이 없습니다. (--shipments 0)")
+        return
+    status_model = status_model or StatusModel()
+    conn = bulk_sink.connect(sink_name, db_config, pg_db_config)
     cursor = conn.cursor()
-    
+
     try:
-        print(f"🚀 [Logis-Flow] 데이터 생성을 시작합니다. 목표 화물 수: {TARGET_SHIPMENTS}건")
+        print(f"🚀 [Logis-Flow] 데이터 생성을 시작합니다. 목표 화물 수: {total}건 / 워커: {workers}개 / 시드: {seed} / sink: {sink_name} / 엔진: {engine}")
 
         # 기초 데이터 보강
         print("📦 기초 데이터 보강 중...")
-        companies = [(fake.company(),) for _ in range(50)]
-        warehouses = [(f"{fake.city()} 센터 {i}", fake.address()) for i in range(50)]
-        products = [(f"Logis 상품 {i}",) for i in range(100)]
-        
-        cursor.executemany("INSERT INTO companies (company_name) VALUES (%s)", companies)
-        cursor.executemany("INSERT INTO warehouses (warehouse_name, address) VALUES (%s, %s)", warehouses)
-        cursor.executemany("INSERT INTO products (product_name) VALUES (%s)", products)
-        conn.commit()
-
-        company_ids = get_ids(cursor, "companies", "company_id")
-        warehouse_ids = get_ids(cursor, "warehouses", "warehouse_id")
-        product_ids = get_ids(cursor, "products", "product_id")
+        Faker.seed(seed)
+        company_ids, warehouse_ids, product_ids = insert_base_data(conn, cursor, only_if_empty=not seed_base)
 
         if not company_ids:
-            print("❌ 기초 데이터가 없습니다.")
-            return
-
-        print("🚚 화물 및 로그 대량 생성 시작...")
-
-        shipment_buffer = []
-        item_buffer = []
-        update_buffer = []
-
-        for i in tqdm(range(TARGET_SHIPMENTS), desc="데이터 생성 중"):
-            comp_id = random.choice(company_ids)
-            origin, dest = random.sample(warehouse_ids, 2)
-            created_at = fake.date_time_between(start_date='-2y', end_date='now')
-            
-            shipment_buffer.append((comp_id, origin, dest, created_at))
-
-            # 배치 저장
-            if len(shipment_buffer) >= BATCH_SIZE:
-                cursor.executemany("""
-                    INSERT INTO shipments (company_id, origin_warehouse_id, destination_warehouse_id, created_at)
-                    VALUES (%s, %s, %s, %s)
-                """, shipment_buffer)
-                conn.commit()
-                
-                # 방금 저장된 ID 대역 조회
-                cursor.execute(f"SELECT shipment_id, created_at FROM shipments ORDER BY shipment_id DESC LIMIT {BATCH_SIZE}")
-                recent_shipments = cursor.fetchall()
-                
-                shipment_buffer = []
-
-                for s_id, s_date in recent_shipments:
-                    # [수정된 부분] 중복 없는 상품 뽑기 (random.sample 사용)
-                    num_items = random.randint(1, 5)
-                    # 전체 상품 목록에서 num_items 만큼 중복 없이 뽑음
-                    selected_products = random.sample(product_ids, num_items)
-                    
-                    for pid in selected_products:
-                        item_buffer.append((s_id, pid, random.randint(1, 100)))
-                    
-                    # Updates 생성
-                    status_list = ['주문접수', '집화처리', '간선상차', '간선하차', '터미널입고', '터미널출고', '배송출발', '배송완료']
-                    history_count = random.randint(3, 15)
-                    current_time = s_date
-                    
-                    for _ in range(history_count):
-                        status = random.choice(status_list)
-                        current_time += timedelta(hours=random.randint(1, 48))
-                        update_buffer.append((s_id, status, "시스템 자동 업데이트", current_time))
-
-                cursor.executemany("INSERT INTO shipment_items (shipment_id, product_id, quantity) VALUES (%s, %s, %s)", item_buffer)
-                cursor.executemany("INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, %s)", update_buffer)
-                
-                conn.commit()
-                item_buffer = []
-                update_buffer = []
-
-        print("\n✅ 데이터 생성이 완료되었습니다!")
+            raise RuntimeError("기초 데이터(companies)가 없습니다.")
 
+        # 배치마다 "ORDER BY shipment_id DESC LIMIT N" 으로 ID를 되읽지 않도록
+        # 필요한 ID 구간을 한 번에 예약하고 명시적인 ID로 INSERT 합니다.
+        first_id = reserve_shipment_ids(conn, cursor, total, bulk_sink.dialect_of(sink_name))
+        print(f"🔒 shipment_id 구간 예약 완료: {first_id} ~ {first_id + total - 1}")
     except Exception as e:
         conn.rollback()
         print(f"❌ 오류 발생: {e}")
+        raise
     finally:
         conn.close()
 
+    # 모든 워커가 같은 기간(window_end 이전 2년)에서 생성일을 뽑습니다.
+    window_start = window_end - timedelta(days=WINDOW_DAYS)
+    window = (window_start, int((window_end - window_start).total_seconds()))
+    base_ids = (company_ids, warehouse_ids, product_ids)
+
+    tasks = [
+        (w, start, count, seed, base_ids, window, sink_name, engine, status_model)
+        for w, start, count in split_range(first_id, total, workers)
+    ]
+
+    print("🚚 화물 및 로그 대량 생성 시작...")
+    stats = {}
+    started = time.perf_counter()
+    try:
+        with tqdm(total=total, desc="데이터 생성 중") as pbar:
+            if len(tasks) == 1:
+                # 단일 프로세스: 풀 없이 현재 프로세스에서 바로 실행
+                _, _, worker_stats = _generate_range(tasks[0], progress=pbar.update)
+                bulk_sink.merge_stats(stats, worker_stats)
+            else:
+                # fork 대신 spawn: 부모의 커넥션/RNG 상태를 물려받지 않도록 합니다.
+                ctx = mp.get_context("spawn")
+                with ctx.Pool(processes=len(tasks)) as pool:
+                    for _, done, worker_stats in pool.imap_unordered(_generate_range, tasks):
+                        bulk_sink.merge_stats(stats, worker_stats)
+                        pbar.update(done)
+    except Exception as e:
+        # 일부 구간만 적재된 상태일 수 있으므로 성공으로 끝내지 않음 (종료 코드 != 0)
+        print(f"❌ 오류 발생: {e} (완료된 구간은 이미 커밋됨)")
+        raise
+
+    print("\n✅ 데이터 생성이 완료되었습니다!")
+    bulk_sink.print_report(sink_name, stats, time.perf_counter() - started)
+
 if __name__ == "__main__":
-    generate_bulk_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Logis-Flow 대량 더미 데이터 생성기")
+    parser.add_argument("--shipments", type=int, default=TARGET_SHIPMENTS, help="생성할 화물 수")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="생성 프로세스 수 (1이면 단일 프로세스)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="재현용 난수 시드")
+    parser.add_argument("--sink", choices=bulk_sink.SINK_CHOICES, default=bulk_sink.DEFAULT_SINK,
+                        help="적재 방식 (executemany / load_data: MySQL LOAD DATA / copy: PostgreSQL COPY)")
+    parser.add_argument("--engine", choices=ENGINE_CHOICES, default=DEFAULT_ENGINE,
+                        help="행 합성 방식 (numpy: 배치 배열 합성 / python: 화물 1건씩 생성)")
+    parser.add_argument("--status-config", help="상태 전이/체류 시간 JSON 설정 파일 (status_model.StatusModel.from_json)")
+    parser.add_argument("--long-tail-share", type=float, default=DEFAULT_LONG_TAIL_SHARE,
+                        help="이력 50건 이상인 long tail 화물 비율 (--status-config 미사용 시)")
+    parser.add_argument("--window-end", type=datetime.fromisoformat, default=DEFAULT_WINDOW_END,
+                        help=f"생성일 기간의 끝 (YYYY-MM-DD, 기본 {DEFAULT_WINDOW_END:%Y-%m-%d}, 이전 {WINDOW_DAYS}일)")
+    args = parser.parse_args()
+    if args.shipments < 0 or args.workers < 1:
+        parser.error("--shipments 는 0 이상, --workers 는 1 이상이어야 합니다.")
+
+    if args.status_config:
+        model = StatusModel.from_json(args.status_config)
+    else:
+        model = StatusModel(long_tail_share=args.long_tail_share)
+
+    generate_bulk_data(args.shipments, args.workers, args.seed, args.sink, args.engine, model,
+                       window_end=args.window_end)
\ No newline at end of file
@@ -0,0 +1,258 @@
+import time
+import uuid
+import queue
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import Future
+
+from consistency_test import (
+    db_pool, ConsistencyBenchmark, drain_batch, coalesce_latest, apply_status_batch,
+    verify_projection, print_verification,
+)
+from benchmark.stats import summarize
+
+# ==========================================
+# Group Commit 쓰기 경로
+# ==========================================
+# 전략 A~D 는 상태 이벤트 1건마다 INSERT (+UPDATE) + 커밋 1회라, 스캐너가 몰리는 피크에는 커밋(fsync) 횟수가 한계입니다.
+# GroupCommitWriter 는 이벤트를 window 초(또는 max_events 건)만큼 모아
+#   - shipment_updates 다중 행 INSERT 1문장
+#   - 화물별 최신 버전만 남긴 조건부 UPDATE 1문장 (consistency_test.apply_status_batch)
+# 을 한 트랜잭션으로 커밋합니다. 호출자는 이벤트마다 Future 를 받아 커밋되면 (timestamp, update_id) 로 응답받습니다.
+#
+#   python group_commit.py --threads 16 --duration 10 --window 0.01 --max-events 200
+
+DEFAULT_WINDOW = 0.01        # 첫 이벤트 이후 더 모으는 최대 시간(초)
+DEFAULT_MAX_EVENTS = 200     # 한 커밋에 묶을 최대 이벤트 수
+COMMIT_DELAY = 0.05          # 🔥[부하 주입] 커밋(트랜잭션) 1회당 지연 - Strategy A 의 SLEEP(0.05) 와 같은 조건
+DEFAULT_THREADS = 16
+DEFAULT_DURATION = 10.0
+
+def autoinc_lock_mode(cursor):
+    """@@innodb_autoinc_lock_mode (InnoDB 가 아니거나 읽지 못하면 None)"""
+    try:
+        cursor.execute("SELECT @@innodb_autoinc_lock_mode")
+        return int(cursor.fetchone()[0])
+    except Exception:
+        return None
+
+class GroupCommitWriter:
+    def __init__(self, window=DEFAULT_WINDOW, max_events=DEFAULT_MAX_EVENTS, commit_delay=COMMIT_DELAY):
+        self.window = window
+        self.max_events = max_events
+        self.commit_delay = commit_delay
+        self.pending = queue.Queue()
+        self.commit_latencies = []   # 트랜잭션 시작 -> 커밋 완료(ns)
+        self.group_sizes = []
+        self.consecutive_ids = True  # _run 에서 서버 innodb_autoinc_lock_mode 로 확인
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="group-commit")
+        self.thread.start()
+        return self
+
+    def submit(self, s_id, status, notes=None, ts=None):
+        """상태 이벤트 1건을 맡기고 Future 반환 (커밋되면 (timestamp, update_id), 실패하면 예외)"""
+        future = Future()
+        ts = ts or datetime.now().replace(microsecond=0)
+        self.pending.put((s_id, status, notes, ts, future))
+        return future
+
+    def write_many(self, records):
+        """(shipment_id, status, notes, ts) 레코드 스트림 -> Future 목록"""
+        return [self.submit(*record) for record in records]
+
+    def close(self):
+        """남은 이벤트까지 커밋한 뒤 종료"""
+        self.pending.put(None)
+        self.thread.join()
+
+    def _run(self):
+        with db_pool().session() as db:
+            conn, cursor = db.conn, db.cursor
+            self.consecutive_ids = autoinc_lock_mode(cursor) in (0, 1, 2)
+            while True:
+                batch = drain_batch(self.pending, self.max_events, self.window)
+                stop = batch[-1] is None
+                events = [event for event in batch if event is not None]
+                if events:
+                    self._commit(conn, cursor, events)
+                if stop:
+                    return
+
+    def _insert_updates(self, cursor, events):
+        """
+        이력 다중 행 INSERT 1문장 -> 이벤트 순서대로 update_id 목록.
+        행 수가 정해진 simple insert 는 innodb_autoinc_lock_mode 0/1/2 모두 AUTO_INCREMENT 값을 한 번에 연속으로 받으므로
+        lastrowid(첫 값) + i 로 계산합니다. (값이 섞일 수 있는 건 INSERT ... SELECT / LOAD DATA 같은 bulk insert 뿐)
+        모드를 확인하지 못한 서버에서만 행마다 배치 표시를 달아 실제 값을 다시 읽는 느린 경로를 씁니다.
+        """
+        rows = ", ".join(["(%s, %s, %s, %s)"] * len(events))
+        sql = f"INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES {rows}"
+        if self.consecutive_ids:
+            cursor.execute(sql, [value for s_id, status, notes, ts, _ in events for value in (s_id, status, notes, ts)])
+            return [cursor.lastrowid + i for i in range(len(events))]
+
+        # 느린 경로: notes 에 "<tag>:<순번>" 을 넣어 적재 -> 실제 update_id 를 읽고 원래 notes 로 되돌림 (같은 트랜잭션이라 밖에는 안 보임)
+        tag = f"Group Commit {uuid.uuid4().hex}"
+        cursor.execute(sql, [value for i, (s_id, status, _, ts, _) in enumerate(events)
+                             for value in (s_id, status, f"{tag}:{i}", ts)])
+        cursor.execute(
+            "SELECT update_id, notes FROM shipment_updates WHERE update_id >= %s AND notes LIKE %s",
+            (cursor.lastrowid, f"{tag}:%")
+        )
+        found = {int(note.rsplit(':', 1)[1]): update_id for update_id, note in cursor.fetchall()}
+        if len(found) != len(events):
+            raise RuntimeError(f"방금 넣은 이력 {len(events)}건 중 {len(found)}건만 다시 읽음")
+        ids = [found[i] for i in range(len(events))]
+        cursor.execute(
+            f"UPDATE shipment_updates SET notes = CASE update_id {' '.join(['WHEN %s THEN %s'] * len(events))} END "
+            f"WHERE update_id IN ({', '.join(['%s'] * len(events))})",
+            [value for update_id, (_, _, notes, _, _) in zip(ids, events) for value in (update_id, notes)] + ids
+        )
+        return ids
+
+    def _commit(self, conn, cursor, events):
+        t0 = time.perf_counter_ns()
+        try:
+            conn.begin()
+            # 1. 이력 다중 행 INSERT 1문장
+            ids = self._insert_updates(cursor, events)
+            versions = [(ts, update_id) for (_, _, _, ts, _), update_id in zip(events, ids)]
+
+            # 2. 화물별 최신 버전만 set-based 조건부 UPDATE 1문장
+            latest = coalesce_latest([(s_id, status, None, version)
+                                      for (s_id, status, _, _, _), version in zip(events, versions)])
+            cursor.execute("DO SLEEP(%s)", (self.commit_delay,))
+            apply_status_batch(cursor, latest)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            for *_, future in events:
+                future.set_exception(e)
+            return
+
+        self.commit_latencies.append(time.perf_counter_ns() - t0)
+        self.group_sizes.append(len(events))
+        for (*_, future), version in zip(events, versions):
+            future.set_result(version)
+
+def _closed_loop(threads, duration, work):
+    """스레드 threads 개가 duration 초 동안 work() 를 반복. work() 는 (지연 ns, 성공 여부) 반환"""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def loop(idx):
+        local = []
+        while not stop.is_set():
+            latency, ok = work(idx)
+            if ok:
+                local.append(latency)
+            else:
+                with lock:
+                    errors[0] += 1
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=loop, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for t in workers:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in workers:
+        t.join()
+    return latencies, errors[0], time.perf_counter() - started
+
+def run_group_commit(main, args):
+    writer = GroupCommitWriter(args.window, args.max_events, args.commit_delay).start()
+
+    def work(_):
+        s_id, status = main._get_random_target()
+        t0 = time.perf_counter_ns()
+        try:
+            writer.submit(s_id, status, "Group Commit Update").result()
+        except Exception:
+            return 0, False
+        return time.perf_counter_ns() - t0, True
+
+    try:
+        acks, errors, elapsed = _closed_loop(args.threads, args.duration, work)
+    finally:
+        writer.close()
+    return {
+        'mode': f"group commit (window={args.window}s, max={args.max_events})",
+        'events': len(acks),
+        'elapsed': elapsed,
+        'errors': errors,
+        'ack': summarize(acks),
+        'commit': summarize(writer.commit_latencies),
+        'commits': len(writer.group_sizes),
+    }
+
+def run_per_event(main, args):
+    """비교 기준: 스레드마다 전용 커넥션으로 Strategy A (이벤트 1건 = 트랜잭션 1회)"""
+    benches = [ConsistencyBenchmark(start_worker=False, shipment_ids=main.shipment_ids) for _ in range(args.threads)]
+
+    def work(idx):
+        t0 = time.perf_counter_ns()
+        try:
+            benches[idx].strategy_sync_transaction()
+        except Exception:
+            return 0, False
+        return time.perf_counter_ns() - t0, True
+
+    try:
+        acks, errors, elapsed = _closed_loop(args.threads, args.duration, work)
+    finally:
+        for bench in benches:
+            bench.close()
+    commit = summarize(acks)
+    return {
+        'mode': "per-event (Strategy A)",
+        'events': len(acks),
+        'elapsed': elapsed,
+        'errors': errors,
+        'ack': commit,
+        'commit': commit,
+        'commits': len(acks),
+    }
+
+def print_results(results, threads):
+    print(f"\n📊 쓰기 경로 비교 (스레드 {threads}개, 지연 단위 ms)")
+    print(f"{'mode':<42} {'events/s':>9} {'ack p50':>8} {'ack p99':>8} {'commit p50':>11} {'commit p99':>11} "
+          f"{'commits':>8} {'avg group':>10}")
+    for r in results:
+        ack, commit = r['ack'], r['commit']
+        if not ack['n']:
+            print(f"{r['mode']:<42} {0:>9.1f}  (완료된 이벤트 없음, 오류 {r['errors']}건)")
+            continue
+        avg_group = r['events'] / r['commits'] if r['commits'] else 0
+        print(f"{r['mode']:<42} {r['events'] / r['elapsed']:>9.1f} {ack['p50_ms']:>8.1f} {ack['p99_ms']:>8.1f} "
+              f"{commit['p50_ms']:>11.1f} {commit['p99_ms']:>11.1f} {r['commits']:>8} {avg_group:>10.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상태 이벤트 group commit 쓰기 경로 vs 이벤트별 커밋 비교")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS, help="동시에 이벤트를 쓰는 스레드 수 (스캐너)")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="모드별 실행 시간(초)")
+    parser.add_argument("--window", type=float, default=DEFAULT_WINDOW, help="group commit 모음 시간(초)")
+    parser.add_argument("--max-events", type=int, default=DEFAULT_MAX_EVENTS, help="커밋 1회당 최대 이벤트 수")
+    parser.add_argument("--commit-delay", type=float, default=COMMIT_DELAY, help="커밋 1회당 주입 지연(초)")
+    parser.add_argument("--skip-baseline", action='store_true', help="이벤트별 커밋(Strategy A) 비교 생략")
+    args = parser.parse_args()
+
+    main = ConsistencyBenchmark(start_worker=False)
+    try:
+        results = []
+        if not args.skip_baseline:
+            print(f"🚦 이벤트별 커밋 (Strategy A) {args.duration}초 ...")
+            results.append(run_per_event(main, args))
+        print(f"🚦 group commit {args.duration}초 ...")
+        results.append(run_group_commit(main, args))
+        print_results(results, args.threads)
+        print_verification(verify_projection(main.cursor))
+    finally:
+        main.close()
@@ -0,0 +1,246 @@
+import time
+import random
+import argparse
+import threading
+
+import pymysql
+
+from consistency_test import ConsistencyBenchmark, verify_projection, print_verification, pending_outbox
+from benchmark.stats import summarize
+
+# ==========================================
+# 읽기/쓰기 혼합 부하 (Mixed Workload)
+# ==========================================
+# ConsistencyBenchmark 는 쓰기 지연만, benchmark 패키지는 읽기만 따로 잽니다.
+# 비정규화의 진짜 비용은 UPDATE shipments SET current_status 가
+# 조회(SELECT)와 INSERT INTO shipment_updates 와 같은 화물 행에서 부딪힐 때 드러나므로,
+# 소수의 "핫" 화물 ID에 쓰기(전략 A/B/C/D 중 하나)와 읽기를 동시에 겁니다.
+#
+#   python mixed_workload.py --strategy sync --threads 16 --write-ratio 0.2 --hot-ids 10 --duration 30
+#
+# 리포트: 작업 유형별 p50/p99, InnoDB 락 대기/데드락(서버 카운터 delta + 클라이언트 오류),
+#         읽기 staleness (이미 커밋 응답을 받은 쓰기를 못 본 읽기의 비율과 지연)
+
+STRATEGIES = {
+    'sync': ('Strategy A: 동기 트랜잭션', 'strategy_sync_transaction'),
+    'trigger': ('Strategy B: DB 트리거', 'strategy_db_trigger'),
+    'async': ('Strategy C: 비동기 큐 (Async)', 'strategy_async_queue'),
+    'outbox': ('Strategy D: Outbox + Poller', 'strategy_outbox'),
+}
+
+READ_DENORMALIZED_SQL = "SELECT current_status FROM shipments WHERE shipment_id = %s"
+READ_NORMALIZED_SQL = """
+    SELECT status_code FROM shipment_updates
+    WHERE shipment_id = %s
+    ORDER BY timestamp DESC, update_id DESC LIMIT 1
+"""
+
+# MySQL 오류 코드
+ER_LOCK_WAIT_TIMEOUT = 1205
+ER_LOCK_DEADLOCK = 1213
+
+def read_lock_counters(cursor):
+    """InnoDB 락 관련 누적 카운터 (락 대기 횟수/시간, 데드락 수)"""
+    counters = {}
+    cursor.execute("SHOW GLOBAL STATUS LIKE 'Innodb_row_lock_%'")
+    for name, value in cursor.fetchall():
+        counters[name] = int(value)
+    try:
+        cursor.execute("SELECT COUNT FROM information_schema.INNODB_METRICS WHERE NAME = 'lock_deadlocks'")
+        row = cursor.fetchone()
+        counters['lock_deadlocks'] = int(row[0]) if row else None
+    except pymysql.MySQLError:
+        counters['lock_deadlocks'] = None
+    return counters
+
+class MixedWorkload:
+    def __init__(self, strategy='sync', threads=8, write_ratio=0.2, normalized_read_ratio=0.0,
+                 hot_ids=10, duration=10.0, seed=None):
+        self.strategy = strategy
+        self.threads = threads
+        self.write_ratio = write_ratio
+        self.normalized_read_ratio = normalized_read_ratio
+        self.duration = duration
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # 메인 인스턴스: 비동기 워커 1개 + 트리거 설치/삭제 담당
+        self.main = ConsistencyBenchmark()
+        self.hot_ids = self.rng.sample(self.main.shipment_ids, min(hot_ids, len(self.main.shipment_ids)))
+
+        self.stop = threading.Event()
+        self.lock = threading.Lock()
+        self.latencies = {'write': [], 'read_denormalized': [], 'read_normalized': []}
+        self.errors = {'deadlock': 0, 'lock_wait_timeout': 0, 'other': 0}
+        self.acked = {}          # shipment_id -> (쓰기 상태값, 커밋 응답 시각)
+        self.reads = {'read_denormalized': 0, 'read_normalized': 0}
+        self.stale = {'read_denormalized': [], 'read_normalized': []}   # 놓친 쓰기 이후 경과 시간(ns)
+
+    def _count_error(self, e):
+        code = e.args[0] if e.args else None
+        with self.lock:
+            if code == ER_LOCK_DEADLOCK:
+                self.errors['deadlock'] += 1
+            elif code == ER_LOCK_WAIT_TIMEOUT:
+                self.errors['lock_wait_timeout'] += 1
+            else:
+                self.errors['other'] += 1
+
+    def _write(self, strategy_func):
+        t0 = time.perf_counter_ns()
+        try:
+            _, s_id, status = strategy_func()
+        except pymysql.MySQLError as e:
+            self._count_error(e)        # 롤백된 쓰기는 acked 에 올리지 않음 (staleness 오탐 방지)
+            return
+        t1 = time.perf_counter_ns()
+        with self.lock:
+            self.latencies['write'].append(t1 - t0)
+            self.acked[s_id] = (status, t1)
+
+    def _read(self, bench, kind, rng):
+        s_id = rng.choice(self.hot_ids)
+        with self.lock:
+            expected = self.acked.get(s_id)     # 읽기 시작 전에 이미 응답을 받은 마지막 쓰기
+        sql = READ_NORMALIZED_SQL if kind == 'read_normalized' else READ_DENORMALIZED_SQL
+        t0 = time.perf_counter_ns()
+        bench.cursor.execute(sql, (s_id,))
+        row = bench.cursor.fetchone()
+        t1 = time.perf_counter_ns()
+        with self.lock:
+            self.latencies[kind].append(t1 - t0)
+            self.reads[kind] += 1
+            # 같은 상태값이 연속으로 쓰이면 구분할 수 없으므로 staleness 는 하한값입니다.
+            if expected and (row is None or row[0] != expected[0]):
+                self.stale[kind].append(t1 - expected[1])
+
+    def _thread_main(self, thread_idx):
+        bench = ConsistencyBenchmark(msg_queue=self.main.msg_queue, start_worker=False, shipment_ids=self.hot_ids)
+        strategy_func = getattr(bench, STRATEGIES[self.strategy][1])
+        rng = random.Random(f"{self.seed}-{thread_idx}")
+        try:
+            while not self.stop.is_set():
+                try:
+                    if rng.random() < self.write_ratio:
+                        self._write(strategy_func)
+                    elif rng.random() < self.normalized_read_ratio:
+                        self._read(bench, 'read_normalized', rng)
+                    else:
+                        self._read(bench, 'read_denormalized', rng)
+                except pymysql.MySQLError as e:
+                    self._count_error(e)
+        finally:
+            bench.close()
+
+    def run(self):
+        title = STRATEGIES[self.strategy][0]
+        print(f"\n🚀 [Mixed: {title}] 스레드 {self.threads}개 / 쓰기 비율 {self.write_ratio:.0%} / "
+              f"핫 화물 {len(self.hot_ids)}개 / {self.duration}초")
+        poller = None
+        if self.strategy == 'trigger':
+            self.main.setup_trigger()
+        elif self.strategy == 'outbox':
+            from outbox_poller import OutboxPoller
+            self.main.setup_outbox()
+            poller = OutboxPoller().start()
+
+        before = read_lock_counters(self.main.cursor)
+        workers = [threading.Thread(target=self._thread_main, args=(i,), daemon=True) for i in range(self.threads)]
+        started = time.perf_counter()
+        for t in workers:
+            t.start()
+        time.sleep(self.duration)
+        self.stop.set()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - started
+        after = read_lock_counters(self.main.cursor)
+
+        if self.strategy == 'trigger':
+            self.main.teardown_trigger()
+        backlog = self.main.msg_queue.qsize()
+        if poller:
+            backlog = pending_outbox(self.main.cursor)
+            poller.wait_idle()
+            poller.stop()
+            poller.report()
+        return self._report(title, elapsed, before, after, backlog)
+
+    def _report(self, title, elapsed, before, after, backlog):
+        server = {}
+        for key in ('Innodb_row_lock_waits', 'Innodb_row_lock_time', 'lock_deadlocks'):
+            if before.get(key) is None or after.get(key) is None:
+                server[key] = None
+            else:
+                server[key] = after[key] - before[key]
+
+        print(f"📊 결과 리포트 ({title}, {elapsed:.1f}초)")
+        print(f"   {'작업':<20} {'건수':>8} {'처리량/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        summary = {}
+        for kind, values in self.latencies.items():
+            stats = summarize(values)
+            summary[kind] = stats
+            if stats['n']:
+                print(f"   {kind:<20} {stats['n']:>8} {stats['n'] / elapsed:>9.1f} {stats['p50_ms']:>9.2f} "
+                      f"{stats['p99_ms']:>9.2f} {stats['max_ms']:>9.2f}")
+
+        print(f"   - InnoDB 락 대기: {server['Innodb_row_lock_waits']}회 / 누적 {server['Innodb_row_lock_time']} ms")
+        print(f"   - 데드락: 서버 {server['lock_deadlocks'] if server['lock_deadlocks'] is not None else '-'}건 "
+              f"/ 클라이언트 오류 deadlock {self.errors['deadlock']}, lock wait timeout {self.errors['lock_wait_timeout']}, "
+              f"기타 {self.errors['other']}")
+
+        staleness = {}
+        for kind, values in self.stale.items():
+            reads = self.reads[kind]
+            if not reads:
+                continue
+            stats = summarize(values)
+            staleness[kind] = {'reads': reads, 'stale_reads': len(values), 'stale_ms': stats}
+            if values:
+                print(f"   - {kind} staleness: {len(values)}/{reads}건 ({len(values) / reads:.1%}), "
+                      f"p50 {stats['p50_ms']:.1f} ms / p99 {stats['p99_ms']:.1f} ms / max {stats['max_ms']:.1f} ms")
+            else:
+                print(f"   - {kind} staleness: 0/{reads}건 (항상 최신)")
+        if self.strategy == 'async':
+            print(f"   - 종료 시점 비동기 큐 잔량: {backlog}건")
+        elif self.strategy == 'outbox':
+            print(f"   - 종료 시점 미반영 outbox: {backlog}건")
+
+        return {
+            'strategy': self.strategy,
+            'elapsed': elapsed,
+            'latency': summary,
+            'server': server,
+            'errors': dict(self.errors),
+            'staleness': staleness,
+            'queue_backlog': backlog,
+        }
+
+    def close(self):
+        self.main.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상태 쓰기(전략 A/B/C/D) + 상태 조회 동시 혼합 부하")
+    parser.add_argument("--strategy", choices=list(STRATEGIES) + ['all'], default='all')
+    parser.add_argument("--threads", type=int, default=8, help="동시 스레드(커넥션) 수")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="작업 중 쓰기 비율 (0~1)")
+    parser.add_argument("--normalized-read-ratio", type=float, default=0.0,
+                        help="읽기 중 정규화(shipment_updates 최신 행) 조회 비율 (나머지는 current_status 조회)")
+    parser.add_argument("--hot-ids", type=int, default=10, help="경합시킬 핫 화물 ID 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="전략별 실행 시간(초)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    strategies = list(STRATEGIES) if args.strategy == 'all' else [args.strategy]
+    for name in strategies:
+        workload = MixedWorkload(name, args.threads, args.write_ratio, args.normalized_read_ratio,
+                                 args.hot_ids, args.duration, args.seed)
+        try:
+            workload.run()
+            if name == 'async':
+                print("\n⏳ 비동기 잔여 작업 처리 대기 중...")
+                workload.main.msg_queue.join()
+                workload.main.report_async_metrics()
+            print_verification(verify_projection(workload.main.cursor))
+        finally:
+            workload.close()
@@ -0,0 +1,198 @@
+import time
+import argparse
+import threading
+
+import pymysql
+
+from consistency_test import (
+    db_pool, ASYNC_BATCH_SIZE, ASYNC_APPLY_DELAY, ConsistencyBenchmark,
+    new_async_metrics, coalesce_latest, apply_status_batch, record_batch_metrics,
+    merge_async_metrics, print_async_metrics, ensure_outbox, pending_outbox,
+    ensure_projection_version, verify_projection, print_verification,
+)
+
+# ==========================================
+# Outbox Poller (Strategy D 반영 담당)
+# ==========================================
+# shipment_status_outbox 의 미처리 행을 배치로 가져가(claim) shipments 에 반영하고 처리 완료로 표시합니다.
+# claim / 반영 / 완료 표시가 한 트랜잭션이라 poller 가 중간에 죽으면 롤백되어 다음 poller 가 다시 가져갑니다.
+# FOR UPDATE SKIP LOCKED (MySQL 8.0+) 로 poller 여러 개가 서로 다른 행을 나눠 가져가며,
+# 반영 순서가 섞여도 프로젝션 버전 가드(timestamp, update_id) 때문에 오래된 상태가 덮어쓰지 않습니다.
+#
+#   python outbox_poller.py                          # 상시 실행 (Ctrl+C 로 종료)
+#   python outbox_poller.py --workers 4 --drain      # 밀린 outbox 만 처리하고 종료
+#   python outbox_poller.py --durability 500         # 앱 프로세스가 죽는 상황에서 반영이 남는지 확인
+
+DEFAULT_INTERVAL = 0.05      # 처리할 행이 없을 때 다시 조회하기까지 대기(초)
+
+CLAIM_SQL = """
+    SELECT outbox_id, shipment_id, status_code, update_timestamp, update_id,
+           TIMESTAMPDIFF(MICROSECOND, created_at, NOW(6)) AS age_us
+    FROM shipment_status_outbox
+    WHERE processed_at IS NULL
+    ORDER BY outbox_id
+    LIMIT %s
+    FOR UPDATE{skip_locked}
+"""
+
+class OutboxPoller:
+    def __init__(self, workers=1, batch_size=ASYNC_BATCH_SIZE, interval=DEFAULT_INTERVAL,
+                 apply_delay=ASYNC_APPLY_DELAY, skip_locked=True):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.interval = interval
+        self.apply_delay = apply_delay
+        self.skip_locked = skip_locked
+        self.metrics = [new_async_metrics() for _ in range(workers)]
+        self.running = False
+        self.threads = []
+        self.idle = [False] * workers
+
+    def start(self):
+        self.running = True
+        for idx in range(self.workers):
+            t = threading.Thread(target=self._worker, args=(idx,), name=f"outbox-poller-{idx}")
+            t.start()
+            self.threads.append(t)
+        return self
+
+    def stop(self):
+        self.running = False
+        for t in self.threads:
+            t.join()
+        self.threads = []
+
+    def wait_idle(self, timeout=60.0):
+        """모든 poller 가 빈 outbox 를 확인할 때까지 대기. 성공하면 True"""
+        self.idle = [False] * self.workers
+        deadline = time.perf_counter() + timeout
+        while not all(self.idle) and time.perf_counter() < deadline:
+            time.sleep(self.interval)
+        return all(self.idle)
+
+    def _claim(self, cursor):
+        sql = CLAIM_SQL.format(skip_locked=" SKIP LOCKED" if self.skip_locked else "")
+        try:
+            cursor.execute(sql, (self.batch_size,))
+        except pymysql.err.ProgrammingError:
+            if not self.skip_locked:
+                raise
+            # SKIP LOCKED 미지원 서버(MySQL 5.7 등): 일반 FOR UPDATE 로 전환 (poller 끼리는 대기하며 직렬화됨)
+            print("⚠️ SKIP LOCKED 미지원 -> FOR UPDATE 로 전환합니다.")
+            self.skip_locked = False
+            cursor.execute(CLAIM_SQL.format(skip_locked=""), (self.batch_size,))
+        return cursor.fetchall()
+
+    def poll_once(self, conn, cursor, metrics):
+        """outbox 한 배치를 claim -> 반영 -> 완료 표시. 처리한 행 수 반환"""
+        try:
+            conn.begin()
+            rows = self._claim(cursor)
+            if not rows:
+                conn.commit()
+                return 0
+            now = time.perf_counter()
+            # (shipment_id, status, enqueue 시각, 버전) 메시지 형태로 맞춤 - enqueue 시각은 outbox 적재 시각(DB 시계 기준 경과)
+            batch = [(s_id, status, now - age_us / 1e6, (ts, update_id))
+                     for _, s_id, status, ts, update_id, age_us in rows]
+            latest = coalesce_latest(batch)
+            # 🔥[부하 주입] 반영 트랜잭션 1회당 지연 (Strategy C 와 같은 조건)
+            cursor.execute("DO SLEEP(%s)", (self.apply_delay,))
+            applied = apply_status_batch(cursor, latest)
+            ids = [row[0] for row in rows]
+            cursor.execute(
+                f"UPDATE shipment_status_outbox SET processed_at = NOW(6) WHERE outbox_id IN ({', '.join(['%s'] * len(ids))})",
+                ids
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"Poller Error: {e}")
+            return 0
+        record_batch_metrics(metrics, batch, latest, applied)
+        return len(rows)
+
+    def _worker(self, idx):
+        with db_pool().session() as db:
+            conn, cursor = db.conn, db.cursor
+            while self.running:
+                if self.poll_once(conn, cursor, self.metrics[idx]):
+                    self.idle[idx] = False
+                else:
+                    self.idle[idx] = True
+                    time.sleep(self.interval)
+
+    def merged_metrics(self):
+        return merge_async_metrics(self.metrics)
+
+    def report(self, elapsed=None):
+        metrics = self.merged_metrics()
+        print_async_metrics(metrics, f"outbox poller {self.workers}개, batch_size={self.batch_size}, "
+                                     f"skip_locked={self.skip_locked}")
+        if elapsed and metrics['received']:
+            print(f"   - 반영 처리량: {metrics['received'] / elapsed:.1f} 건/초 ({elapsed:.2f}초)")
+
+def run_durability(events, args):
+    """
+    poller 없이 outbox 전략으로 events 건을 쓰고 앱 인스턴스를 닫아(프로세스 종료 흉내) 남은 반영 건수를 확인한 뒤,
+    poller 를 새로 띄워 모두 반영되는지 확인합니다. Strategy C 라면 같은 상황에서 큐에 있던 반영은 모두 사라집니다.
+    """
+    writer = ConsistencyBenchmark(start_worker=False)
+    writer.setup_outbox()
+    errors = 0
+    try:
+        for _ in range(events):
+            try:
+                writer.strategy_outbox()
+            except Exception as e:
+                errors += 1     # 롤백된 쓰기는 outbox 에도 남지 않음
+                print(f"Error: {e}")
+    finally:
+        writer.close()      # 💥 반영 전에 앱 종료
+    print(f"✍️ outbox 쓰기 커밋 {events - errors}/{events}건")
+
+    with db_pool().session() as db:
+        cursor = db.cursor
+        pending = pending_outbox(cursor)
+        print(f"💥 앱 종료 시점 미반영 outbox: {pending}건 (메모리 큐였다면 유실)")
+        poller = OutboxPoller(args.workers, args.batch_size, args.interval, args.apply_delay).start()
+        started = time.perf_counter()
+        drained = poller.wait_idle()
+        elapsed = time.perf_counter() - started
+        poller.stop()
+        poller.report(elapsed)
+        print(f"♻️ 재시작한 poller 가 {'모두 반영' if drained else '시간 안에 다 반영하지 못함'} "
+              f"(남은 outbox {pending_outbox(cursor)}건)")
+        print_verification(verify_projection(cursor))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Transactional outbox poller (Strategy D 반영 프로세스)")
+    parser.add_argument("--workers", type=int, default=1, help="poller 스레드(커넥션) 수")
+    parser.add_argument("--batch-size", type=int, default=ASYNC_BATCH_SIZE, help="한 번에 가져갈 outbox 행 수")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="빈 outbox 재조회 간격(초)")
+    parser.add_argument("--apply-delay", type=float, default=ASYNC_APPLY_DELAY, help="반영 트랜잭션당 주입 지연(초)")
+    parser.add_argument("--drain", action='store_true', help="밀린 outbox 를 모두 처리하면 종료")
+    parser.add_argument("--durability", type=int, metavar='EVENTS', help="앱 종료 후 반영 유지 확인 (쓰기 건수)")
+    args = parser.parse_args()
+
+    with db_pool().session() as db:
+        ensure_projection_version(db.cursor)
+        ensure_outbox(db.cursor)
+
+    if args.durability:
+        run_durability(args.durability, args)
+    else:
+        poller = OutboxPoller(args.workers, args.batch_size, args.interval, args.apply_delay).start()
+        started = time.perf_counter()
+        try:
+            if args.drain:
+                poller.wait_idle(timeout=float('inf'))
+            else:
+                print("📮 outbox poller 실행 중... (Ctrl+C 로 종료)")
+                while True:
+                    time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            poller.stop()
+            poller.report(time.perf_counter() - started)
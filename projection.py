@@ -0,0 +1,208 @@
+import time
+import queue
+import random
+import argparse
+import threading
+from datetime import datetime
+
+from consistency_test import (
+    db_pool, ASYNC_BATCH_SIZE, ASYNC_LINGER, ASYNC_APPLY_DELAY,
+    new_async_metrics, drain_batch, project_batch, merge_async_metrics, print_async_metrics,
+    ensure_projection_version, verify_projection, print_verification,
+)
+from benchmark.stats import summarize
+
+# ==========================================
+# 파티션 프로젝터 (Strategy C 다중 워커)
+# ==========================================
+# Strategy C 는 데몬 워커 1개 + 커넥션 1개라 current_status 반영이 코어/커넥션 수만큼 늘어나지 않습니다.
+# shipment_id 해시로 파티션을 나누고 파티션마다 전용 큐 + 워커 + 커넥션을 둡니다.
+#   - 같은 화물의 메시지는 항상 같은 큐로 가므로 화물 단위 순서가 유지됩니다.
+#   - 큐는 크기 제한이 있어 가득 차면 put() 이 기다립니다 (back-pressure, 대기 시간 집계).
+#   - close() 는 큐마다 종료 신호(None)를 넣고 남은 메시지를 모두 반영한 뒤 워커를 join 합니다.
+#
+# put() / join() / qsize() 가 queue.Queue 와 같으므로 ConsistencyBenchmark(msg_queue=projector, start_worker=False)
+# 처럼 기존 큐 자리에 그대로 넣을 수 있습니다.
+#
+# 메시지는 버전 (timestamp, update_id) 이 더 새로울 때만 반영되므로(consistency_test.project_batch),
+# 벤치마크는 실제 이력 행을 먼저 적재한 뒤 일부러 순서를 섞어 넣고, 끝나면 테이블 전체를 검증합니다.
+#
+#   python projection.py --workers 1 2 4 8 --messages 5000 --producers 4
+
+DEFAULT_WORKERS = (1, 2, 4, 8)
+DEFAULT_QUEUE_SIZE = 1000     # 파티션 큐당 최대 대기 메시지 수
+DEFAULT_MESSAGES = 5000
+DEFAULT_PRODUCERS = 4
+DEFAULT_SHIPMENTS = 1000      # 메시지를 흩뿌릴 화물 ID 수
+
+class PartitionedProjector:
+    def __init__(self, workers=4, queue_size=DEFAULT_QUEUE_SIZE, batch_size=ASYNC_BATCH_SIZE,
+                 linger=ASYNC_LINGER, apply_delay=ASYNC_APPLY_DELAY):
+        self.batch_size = batch_size
+        self.linger = linger
+        self.apply_delay = apply_delay
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in range(workers)]
+        self.metrics = [new_async_metrics() for _ in range(workers)]
+        self.threads = []
+        self.lock = threading.Lock()
+        self.blocked = 0          # 큐가 가득 차서 put() 이 기다린 횟수
+        self.blocked_seconds = 0.0
+
+    def partition(self, s_id):
+        return hash(s_id) % len(self.queues)
+
+    def start(self):
+        for idx in range(len(self.queues)):
+            t = threading.Thread(target=self._worker, args=(idx,), name=f"projector-{idx}")
+            t.start()
+            self.threads.append(t)
+        return self
+
+    def put(self, item):
+        """(shipment_id, status, enqueue 시각, 버전) 메시지를 해당 파티션 큐에 넣음. 가득 차면 빌 때까지 대기"""
+        q = self.queues[self.partition(item[0])]
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            t0 = time.perf_counter()
+            q.put(item)
+            with self.lock:
+                self.blocked += 1
+                self.blocked_seconds += time.perf_counter() - t0
+
+    def qsize(self):
+        return sum(q.qsize() for q in self.queues)
+
+    def join(self):
+        """지금까지 넣은 메시지가 모두 반영될 때까지 대기"""
+        for q in self.queues:
+            q.join()
+
+    def close(self):
+        """종료 신호를 넣고 남은 메시지 반영이 끝난 워커를 모두 join"""
+        for q in self.queues:
+            q.put(None)
+        for t in self.threads:
+            t.join()
+        self.threads = []
+
+    def _worker(self, idx):
+        q = self.queues[idx]
+        metrics = self.metrics[idx]
+        with db_pool().session() as db:
+            conn, cursor = db.conn, db.cursor
+            while True:
+                batch = drain_batch(q, self.batch_size, self.linger)
+                stop = batch[-1] is None
+                items = [item for item in batch if item is not None]
+                metrics['queue_depth'].append(len(batch) + q.qsize())
+                try:
+                    if items:
+                        project_batch(conn, cursor, items, metrics, self.apply_delay)
+                finally:
+                    for _ in batch:
+                        q.task_done()
+                if stop:
+                    return
+
+    def merged_metrics(self):
+        return merge_async_metrics(self.metrics)
+
+    def report(self):
+        print_async_metrics(self.merged_metrics(), f"워커 {len(self.queues)}개, batch_size={self.batch_size}, "
+                                                   f"linger={self.linger}s")
+        if self.blocked:
+            print(f"   - back-pressure: put() 대기 {self.blocked}회 / 누적 {self.blocked_seconds:.2f}초")
+
+def fetch_shipment_ids(cursor, limit):
+    cursor.execute("SELECT shipment_id FROM shipments LIMIT %s", (limit,))
+    return [row[0] for row in cursor.fetchall()]
+
+def seed_updates(cursor, shipment_ids, count, rng):
+    """벤치마크용 이력 행을 적재하고 (shipment_id, status, 버전) 목록을 순서를 섞어 반환"""
+    statuses = ['집화완료', '터미널입고', '배송출발', '배송완료', '수취확인']
+    ts = datetime.now().replace(microsecond=0)
+    tag = f"Projection Bench {ts:%H%M%S}-{rng.random():.6f}"      # 방금 넣은 행만 다시 읽기 위한 표시
+    cursor.executemany(
+        "INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES (%s, %s, %s, %s)",
+        [(rng.choice(shipment_ids), rng.choice(statuses), tag, ts) for _ in range(count)]
+    )
+    cursor.execute("SELECT shipment_id, status_code, timestamp, update_id FROM shipment_updates WHERE notes = %s", (tag,))
+    updates = [(s_id, status, (ts, update_id)) for s_id, status, ts, update_id in cursor.fetchall()]
+    rng.shuffle(updates)      # 같은 화물의 이력도 도착 순서가 뒤바뀌도록
+    return updates
+
+def run_throughput(workers, updates, args):
+    """워커 수 1개 설정에 대해 메시지 len(updates) 건을 넣고 모두 반영될 때까지의 처리량 측정"""
+    projector = PartitionedProjector(workers, args.queue_size, args.batch_size, args.linger, args.apply_delay).start()
+
+    def produce(chunk):
+        for s_id, status, version in chunk:
+            projector.put((s_id, status, time.perf_counter(), version))
+
+    producers = [threading.Thread(target=produce, args=(updates[i::args.producers],)) for i in range(args.producers)]
+    started = time.perf_counter()
+    try:
+        for t in producers:
+            t.start()
+        for t in producers:
+            t.join()
+        projector.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        projector.close()
+
+    metrics = projector.merged_metrics()
+    lag = summarize([int(seconds * 1e9) for seconds in metrics['apply_lag']])
+    return {
+        'workers': workers,
+        'messages': metrics['received'],
+        'applied': metrics['applied'],
+        'stale': metrics['stale'],
+        'batches': metrics['batches'],
+        'elapsed': elapsed,
+        'throughput': metrics['received'] / elapsed if elapsed else 0.0,
+        'blocked': projector.blocked,
+        'blocked_seconds': projector.blocked_seconds,
+        'lag': lag,
+    }
+
+def print_throughput(results):
+    print(f"\n📊 파티션 워커 수별 반영 처리량")
+    print(f"{'workers':>8} {'msg/s':>10} {'speedup':>8} {'txns':>7} {'avg batch':>10} {'blocked s':>10} "
+          f"{'lag p50 ms':>11} {'lag p99 ms':>11}")
+    base = results[0]['throughput'] if results else 0
+    for r in results:
+        avg_batch = r['messages'] / r['batches'] if r['batches'] else 0
+        speedup = r['throughput'] / base if base else 0
+        lag = r['lag']
+        p50 = f"{lag['p50_ms']:.1f}" if lag['n'] else '-'
+        p99 = f"{lag['p99_ms']:.1f}" if lag['n'] else '-'
+        print(f"{r['workers']:>8} {r['throughput']:>10.1f} {speedup:>7.2f}x {r['batches']:>7} {avg_batch:>10.1f} "
+              f"{r['blocked_seconds']:>10.2f} {p50:>11} {p99:>11}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="shipment_id 파티션 다중 워커 프로젝터 처리량 벤치마크")
+    parser.add_argument("--workers", type=int, nargs='+', default=list(DEFAULT_WORKERS), help="측정할 워커 수 목록")
+    parser.add_argument("--messages", type=int, default=DEFAULT_MESSAGES, help="설정마다 넣을 메시지 수")
+    parser.add_argument("--producers", type=int, default=DEFAULT_PRODUCERS, help="메시지를 넣는 스레드 수")
+    parser.add_argument("--shipments", type=int, default=DEFAULT_SHIPMENTS, help="메시지를 흩뿌릴 화물 ID 수")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE, help="파티션 큐당 최대 크기")
+    parser.add_argument("--batch-size", type=int, default=ASYNC_BATCH_SIZE)
+    parser.add_argument("--linger", type=float, default=ASYNC_LINGER)
+    parser.add_argument("--apply-delay", type=float, default=ASYNC_APPLY_DELAY, help="반영 트랜잭션당 주입 지연(초)")
+    parser.add_argument("--seed", type=int, default=1205)
+    args = parser.parse_args()
+
+    with db_pool().session() as db:
+        cursor = db.cursor
+        ensure_projection_version(cursor)
+        shipment_ids = fetch_shipment_ids(cursor, args.shipments)
+        rng = random.Random(args.seed)
+        results = []
+        for workers in args.workers:
+            updates = seed_updates(cursor, shipment_ids, args.messages, rng)
+            print(f"🚦 워커 {workers}개 ...")
+            results.append(run_throughput(workers, updates, args))
+        print_throughput(results)
+        print_verification(verify_projection(cursor))
@@ -1,70 +1,411 @@
 import re
+import os
+import sys
+import io
+import time
+import argparse
 
-# 입력 및 출력 파일명 설정
+# 입력 및 출력 파일명 설정 (기본값, CLI 인자로 변경 가능)
 input_file = '04_shipment_backup.sql'
 output_file = '04_shipment_backup_pg_fixed.sql'
 
-def convert_mysql_to_postgres(sql_content):
+# 파일 상단/하단 설정 (인코딩 오류 해결 핵심!)
+# client_encoding을 UTF8로 설정하여 psql이 파일을 올바르게 읽도록 함
+HEADER = "SET client_encoding = 'UTF8';\nSET session_replication_role = 'replica';\n\n"
+FOOTER = "\n\nSET session_replication_role = 'origin';"
+
+PROGRESS_INTERVAL_SEC = 2.0   # 진행률 출력 주기
+
+# 출력 형식
+#   insert : MySQL 다중 행 INSERT 를 그대로 유지 (기존 방식)
+#   copy   : VALUES 튜플을 파싱해 COPY ... FROM stdin 블록으로 변환하고,
+#            PRIMARY KEY / 인덱스 / 외래 키는 데이터 적재 뒤(post-data)로 미룹니다.
+FORMAT_CHOICES = ('insert', 'copy')
+DEFAULT_FORMAT = 'insert'
+
+# ==========================================
+# 변환 규칙 (정규식은 한 번만 컴파일)
+# ==========================================
+RE_MYSQL_COMMENT = re.compile(r'/\*!.*?\*/;', re.DOTALL)                                  # 2. MySQL 전용 명령어
+RE_AUTO_INCREMENT = re.compile(r'int\s+NOT\s+NULL\s+AUTO_INCREMENT', re.IGNORECASE)       # 3. AUTO_INCREMENT -> SERIAL
+RE_TABLE_OPTIONS = re.compile(r'\)\s*ENGINE=InnoDB.*?;', re.IGNORECASE | re.DOTALL)       # 4. 테이블 옵션
+RE_LOCK = re.compile(r'LOCK TABLES.*?;', re.IGNORECASE)                                   # 5. LOCK/UNLOCK
+RE_UNLOCK = re.compile(r'UNLOCK TABLES;', re.IGNORECASE)
+RE_COLLATE = re.compile(r'\s+COLLATE\s+\w+', re.IGNORECASE)                               # 6. 인코딩/COLLATE
+RE_CHARSET = re.compile(r'\s+CHARACTER SET\s+\w+', re.IGNORECASE)
+RE_DROP_TABLE = re.compile(r'DROP TABLE IF EXISTS\s+(\w+);', re.IGNORECASE)               # 7. CASCADE 추가
+RE_KEY_LINE = re.compile(r'^(\s*)(KEY .*)$', re.MULTILINE)                                # 8. KEY(인덱스) 정의
+RE_COMMA_BEFORE_COMMENT = re.compile(r',\s*--.*?\n\s*\)')                                 # 9. 콤마 정리
+RE_COMMA_BEFORE_PAREN = re.compile(r',\s*\n\s*\)')
+
+RE_VALUES = re.compile(r'\bVALUES\b', re.IGNORECASE)
+RE_ESCAPED_CHAR = re.compile(r'\\.', re.DOTALL)
+RE_STATEMENT_END = re.compile(r";\s*(?:--[^'\n]*)?$")   # '...); -- 주석' 처럼 끝에 주석이 붙은 경우 포함
+
+# COPY 모드 전용
+RE_INSERT_TARGET = re.compile(r'^\s*INSERT\s+INTO\s+(\w+)\s*(?:\(([^)]*)\))?\s*VALUES\s*$', re.IGNORECASE | re.DOTALL)
+RE_CREATE_TABLE = re.compile(r'CREATE TABLE\s+(?:IF NOT EXISTS\s+)?(\w+)', re.IGNORECASE)
+RE_SERIAL_COLUMN = re.compile(r'^\s*(\w+)\s+SERIAL\b', re.IGNORECASE | re.MULTILINE)
+RE_DEFERRED_LINE = re.compile(
+    r'^\s*(?:'
+    r'PRIMARY KEY\s*\((?P<pk>[^)]*)\)'
+    r'|(?:-- )?(?P<unique>UNIQUE )?KEY\s+(?P<idx>\w+)\s*\((?P<idx_cols>.*)\)'
+    r'|(?P<fk>CONSTRAINT\s+\w+\s+FOREIGN KEY.*?)'
+    r'),?\s*$\n?',
+    re.IGNORECASE | re.MULTILINE
+)
+RE_PREFIX_LENGTH = re.compile(r'\(\d+\)')   # MySQL 인덱스 prefix 길이 col(10) -> col
+RE_VALUE_TOKEN = re.compile(r"'((?:[^'\\]|\\.|'')*)'|(\()|(\))|--[^\n]*|([^,()'\s;]+)", re.DOTALL)
+RE_LITERAL_ESCAPE = re.compile(r"\\(.)|''|[\t\n\r]", re.DOTALL)
+
+# MySQL 문자열 이스케이프 -> COPY(text) 이스케이프
+_LITERAL_MAP = {
+    "''": "'",
+    '\t': '\\t', '\n': '\\n', '\r': '\\r',
+}
+_MYSQL_ESCAPE_MAP = {
+    '0': '',          # NUL 문자는 PostgreSQL text에 넣을 수 없으므로 제거
+    "'": "'", '"': '"',
+    'b': '\\b', 'n': '\\n', 'r': '\\r', 't': '\\t',
+    'Z': '\\x1A', '\\': '\\\\',
+    '\n': '\\n', '\t': '\\t', '\r': '\\r',
+}
+
+# ==========================================
+# 1. 구문 단위 스트리밍 분리
+# ==========================================
+def iter_statements(lines):
+    """
+    덤프를 한 줄씩 읽으면서 구문(;로 끝나는 단위) 하나씩 돌려줍니다.
+    문자열 리터럴 안의 ; 와 줄바꿈은 구문 끝으로 보지 않습니다.
+    yield: ('comment' | 'statement', 원문 텍스트)
+    """
+    buffer = []
+    in_string = False
+
+    for line in lines:
+        if not buffer and not in_string:
+            stripped = line.strip()
+            if not stripped or stripped.startswith('--'):
+                yield 'comment', line
+                continue
+
+        buffer.append(line)
+        # 이스케이프(\' 등)를 지운 뒤 작은따옴표 개수로 문자열 안/밖 상태를 추적
+        if RE_ESCAPED_CHAR.sub('', line).count("'") % 2:
+            in_string = not in_string
+        if not in_string and RE_STATEMENT_END.search(line.rstrip()):
+            yield 'statement', ''.join(buffer)
+            buffer = []
+
+    if buffer:
+        yield 'statement', ''.join(buffer)
+
+# ==========================================
+# 2. 구문 단위 변환 (모든 규칙을 한 번에)
+# ==========================================
+def _comment_key_line(match):
+    indent, body = match.groups()
+    if body.startswith('PRIMARY KEY') or body.startswith('FOREIGN KEY'):
+        return match.group(0)
+    return f"{indent}-- {body}"
+
+def convert_statement(stmt, defer_keys=False):
+    """
+    MySQL 구문 1개를 PostgreSQL 구문으로 변환. 버릴 구문이면 None
+    defer_keys=True (COPY 모드) 면 KEY 정의를 주석 처리하지 않고 남겨 split_deferred 가 CREATE INDEX 로 옮기게 합니다.
+    (주석으로 바꾸면 테이블 마지막 줄의 KEY 가 9번 콤마 정리에서 통째로 지워짐)
+    """
+    head = stmt.lstrip()[:16].upper()
+
+    # 데이터(INSERT)는 VALUES 앞부분(테이블/컬럼명)의 백틱만 제거하고 값은 그대로 둡니다.
+    if head.startswith('INSERT'):
+        match = RE_VALUES.search(stmt)
+        cut = match.end() if match else len(stmt)
+        return stmt[:cut].replace('`', '') + stmt[cut:]
+
     # 1. 백틱(`) 제거
-    sql_content = sql_content.replace('`', '')
-    
+    stmt = stmt.replace('`', '')
+
     # 2. 주석 처리된 MySQL 전용 명령어 제거
-    sql_content = re.sub(r'/\*!.*?\*/;', '', sql_content, flags=re.DOTALL)
-    
+    stmt = RE_MYSQL_COMMENT.sub('', stmt)
+
+    # 5. LOCK/UNLOCK 제거
+    stmt = RE_UNLOCK.sub('', stmt)
+    stmt = RE_LOCK.sub('', stmt)
+    if not stmt.strip():
+        return None
+
     # 3. AUTO_INCREMENT -> SERIAL 변환
-    sql_content = re.sub(r'int\s+NOT\s+NULL\s+AUTO_INCREMENT', 'SERIAL', sql_content, flags=re.IGNORECASE)
-    
+    stmt = RE_AUTO_INCREMENT.sub('SERIAL', stmt)
+
     # 4. MySQL 전용 테이블 옵션 제거
-    sql_content = re.sub(r'\)\s*ENGINE=InnoDB.*?;', ');', sql_content, flags=re.IGNORECASE)
-    
-    # 5. LOCK/UNLOCK 제거
-    sql_content = re.sub(r'LOCK TABLES.*?;', '', sql_content, flags=re.IGNORECASE)
-    sql_content = re.sub(r'UNLOCK TABLES;', '', sql_content, flags=re.IGNORECASE)
-    
+    stmt = RE_TABLE_OPTIONS.sub(');', stmt)
+
     # 6. 인코딩/COLLATE 제거
-    sql_content = re.sub(r'\s+COLLATE\s+\w+', '', sql_content, flags=re.IGNORECASE)
-    sql_content = re.sub(r'\s+CHARACTER SET\s+\w+', '', sql_content, flags=re.IGNORECASE)
-    
+    stmt = RE_COLLATE.sub('', stmt)
+    stmt = RE_CHARSET.sub('', stmt)
+
     # 7. DROP TABLE 문에 CASCADE 추가 (의존성 오류 해결 핵심!)
-    # "DROP TABLE IF EXISTS table_name;" -> "DROP TABLE IF EXISTS table_name CASCADE;"
-    sql_content = re.sub(r'DROP TABLE IF EXISTS\s+(\w+);', r'DROP TABLE IF EXISTS \1 CASCADE;', sql_content, flags=re.IGNORECASE)
+    stmt = RE_DROP_TABLE.sub(r'DROP TABLE IF EXISTS \1 CASCADE;', stmt)
 
     # 8. KEY(인덱스) 정의 주석 처리
-    lines = sql_content.split('\n')
-    pg_lines = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith('KEY ') and not stripped.startswith('PRIMARY KEY') and not stripped.startswith('FOREIGN KEY'):
-            pg_lines.append('-- ' + line) 
-        else:
-            pg_lines.append(line)
-            
-    sql_content = '\n'.join(pg_lines)
-    
+    if not defer_keys:
+        stmt = RE_KEY_LINE.sub(_comment_key_line, stmt)
+
     # 9. 콤마 정리
-    sql_content = re.sub(r',\s*--.*?\n\s*\)', '\n)', sql_content)
-    sql_content = re.sub(r',\s*\n\s*\)', '\n)', sql_content)
-
-    # 10. 파일 상단 설정 추가 (인코딩 오류 해결 핵심!)
-    # client_encoding을 UTF8로 설정하여 psql이 파일을 올바르게 읽도록 함
-    header = "SET client_encoding = 'UTF8';\nSET session_replication_role = 'replica';\n\n"
-    footer = "\n\nSET session_replication_role = 'origin';"
-    
-    return header + sql_content + footer
-
-# 파일 변환 실행
-try:
-    # utf-8로 읽어서 처리
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        
-    pg_content = convert_mysql_to_postgres(content)
-    
-    # utf-8로 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(pg_content)
-        
-    print(f"수정 완료! '{output_file}' 파일이 생성되었습니다.")
-    
-except FileNotFoundError:
-    print(f"'{input_file}' 파일을 찾을 수 없습니다.")
\ No newline at end of file
+    stmt = RE_COMMA_BEFORE_COMMENT.sub('\n)', stmt)
+    stmt = RE_COMMA_BEFORE_PAREN.sub('\n)', stmt)
+    return stmt
+
+# ==========================================
+# 3. COPY 모드: VALUES 튜플 파싱 / post-data 분리
+# ==========================================
+def _replace_escape(match):
+    ch = match.group(1)
+    if ch is None:
+        return _LITERAL_MAP[match.group(0)]
+    return _MYSQL_ESCAPE_MAP.get(ch, ch)
+
+def _literal_to_copy(body):
+    """MySQL 문자열 리터럴 내용 -> COPY text 필드"""
+    if '\\' in body or "'" in body or '\t' in body or '\n' in body or '\r' in body:
+        return RE_LITERAL_ESCAPE.sub(_replace_escape, body)
+    return body
+
+def iter_value_rows(values_text):
+    """'(1,'a',NULL),(2,'b',3)' 형태의 VALUES 본문에서 COPY 필드 리스트를 한 행씩 돌려줌"""
+    row = None
+    for literal, open_, close, bare in RE_VALUE_TOKEN.findall(values_text):
+        if open_:
+            row = []
+        elif close:
+            yield row
+            row = None
+        elif row is None:
+            continue    # 튜플 밖의 토큰 (-- 주석 등)
+        elif bare:
+            row.append('\\N' if bare.upper() == 'NULL' else bare)
+        else:
+            row.append(_literal_to_copy(literal))
+
+def split_deferred(stmt, used_index_names):
+    """
+    변환된 CREATE TABLE 에서 PRIMARY KEY / 인덱스 / 외래 키 정의를 떼어냅니다.
+    반환: (정의가 빠진 CREATE TABLE, {'pk': [...], 'index': [...], 'fk': [...], 'serial': [...]})
+    """
+    table = RE_CREATE_TABLE.search(stmt).group(1)
+    deferred = {'pk': [], 'index': [], 'fk': [], 'serial': []}
+
+    def collect(match):
+        if match.group('pk'):
+            deferred['pk'].append(f"ALTER TABLE {table} ADD PRIMARY KEY ({match.group('pk')});")
+        elif match.group('idx'):
+            # MySQL 인덱스 이름은 테이블 단위, PostgreSQL은 스키마 단위라 겹치면 테이블명을 붙입니다.
+            name = match.group('idx')
+            if name in used_index_names:
+                name = f"{table}_{name}"
+            used_index_names.add(name)
+            cols = RE_PREFIX_LENGTH.sub('', match.group('idx_cols'))
+            unique = 'UNIQUE ' if match.group('unique') else ''
+            deferred['index'].append(f"CREATE {unique}INDEX {name} ON {table} ({cols});")
+        else:
+            deferred['fk'].append(f"ALTER TABLE {table} ADD {match.group('fk')};")
+        return ''
+
+    stmt = RE_DEFERRED_LINE.sub(collect, stmt)
+    stmt = RE_COMMA_BEFORE_COMMENT.sub('\n)', stmt)
+    stmt = RE_COMMA_BEFORE_PAREN.sub('\n)', stmt)
+
+    # 명시적 ID로 적재하므로 SERIAL 시퀀스를 최댓값 뒤로 옮겨야 이후 INSERT가 충돌하지 않습니다.
+    # 빈 테이블은 is_called=false 로 두어 다음 값이 1부터 시작하게 합니다.
+    for col in RE_SERIAL_COLUMN.findall(stmt):
+        deferred['serial'].append(
+            f"SELECT setval(pg_get_serial_sequence('{table}', '{col}'), COALESCE(MAX({col}), 1), "
+            f"MAX({col}) IS NOT NULL) FROM {table};"
+        )
+    return stmt, deferred
+
+class PostgresDumpWriter:
+    """변환 결과를 dst에 순서대로 씁니다. COPY 모드에서는 연속된 같은 테이블 INSERT를 COPY 블록 하나로 합칩니다."""
+
+    def __init__(self, dst, fmt=DEFAULT_FORMAT):
+        if fmt not in FORMAT_CHOICES:
+            raise ValueError(f"알 수 없는 출력 형식: {fmt}")
+        self.dst = dst
+        self.fmt = fmt
+        self.copy_target = None     # 열려 있는 COPY 블록의 (테이블, 컬럼)
+        self.deferred = {'pk': [], 'serial': [], 'index': [], 'fk': []}
+        self.used_index_names = set()
+        self.rows = 0
+
+    def start(self):
+        self.dst.write(HEADER)
+
+    def comment(self, text):
+        self._close_copy()
+        self.dst.write(text)
+
+    def statement(self, stmt):
+        converted = convert_statement(stmt, defer_keys=self.fmt == 'copy')
+        if converted is None:
+            return
+        if self.fmt == 'copy':
+            head = converted.lstrip()[:16].upper()
+            if head.startswith('INSERT'):
+                self._copy_rows(converted)
+                return
+            if head.startswith('CREATE TABLE'):
+                converted, deferred = split_deferred(converted, self.used_index_names)
+                for key, items in deferred.items():
+                    self.deferred[key].extend(items)
+        self._close_copy()
+        self.dst.write(converted)
+
+    def finish(self):
+        self._close_copy()
+        post_data = self.deferred['pk'] + self.deferred['serial'] + self.deferred['index'] + self.deferred['fk']
+        if post_data:
+            self.dst.write("\n-- =====================================\n")
+            self.dst.write("-- post-data: 데이터 적재 후 기본 키 / 시퀀스 / 인덱스 / 외래 키 생성\n")
+            self.dst.write("-- =====================================\n")
+            self.dst.write('\n'.join(post_data) + '\n')
+        self.dst.write(FOOTER)
+
+    def _copy_rows(self, stmt):
+        match = RE_VALUES.search(stmt)
+        target = RE_INSERT_TARGET.match(stmt[:match.end()])
+        if target is None:
+            # INSERT ... SELECT 등 파싱할 수 없는 형태는 그대로 둡니다.
+            self._close_copy()
+            self.dst.write(stmt)
+            return
+        table, columns = target.groups()
+        key = (table, ' '.join(columns.split()) if columns else None)
+        if key != self.copy_target:
+            self._close_copy()
+            cols = f" ({key[1]})" if key[1] else ''
+            self.dst.write(f"COPY {table}{cols} FROM stdin;\n")
+            self.copy_target = key
+
+        write = self.dst.write
+        for row in iter_value_rows(stmt[match.end():]):
+            write('\t'.join(row) + '\n')
+            self.rows += 1
+
+    def _close_copy(self):
+        if self.copy_target is not None:
+            self.dst.write("\\.\n\n")
+            self.copy_target = None
+
+# ==========================================
+# 4. 스트리밍 변환 (메모리 사용량 = 구문 1개 크기)
+# ==========================================
+def convert_stream(src, dst, progress=None, fmt=DEFAULT_FORMAT):
+    """src(텍스트 스트림)를 읽어 변환 결과를 dst에 바로 씁니다. 반환: 처리한 구문 수"""
+    writer = PostgresDumpWriter(dst, fmt)
+    writer.start()
+    statements = 0
+    for kind, text in iter_statements(src):
+        if kind == 'comment':
+            writer.comment(text)
+            continue
+        writer.statement(text)
+        statements += 1
+        if progress:
+            progress(statements)
+    writer.finish()
+    return statements
+
+def convert_mysql_to_postgres(sql_content, fmt=DEFAULT_FORMAT):
+    """문자열 버전 (기존 호출 호환용)"""
+    out = io.StringIO()
+    convert_stream(io.StringIO(sql_content), out, fmt=fmt)
+    return out.getvalue()
+
+def convert_file(input_path, output_path, fmt=DEFAULT_FORMAT):
+    total_bytes = os.path.getsize(input_path)
+    started = time.perf_counter()
+    last_report = [started]
+
+    # utf-8로 읽고 쓰기 (줄 단위 스트리밍)
+    with open(input_path, 'r', encoding='utf-8') as src, \
+         open(output_path, 'w', encoding='utf-8') as dst:
+
+        def report(statements):
+            now = time.perf_counter()
+            if now - last_report[0] < PROGRESS_INTERVAL_SEC:
+                return
+            last_report[0] = now
+            done = src.buffer.tell()
+            elapsed = now - started
+            print(f"  -> {done / total_bytes * 100:5.1f}% | {done / 1024 / 1024:,.0f} MB | "
+                  f"{done / 1024 / 1024 / elapsed:,.1f} MB/s | {statements:,} 구문")
+
+        statements = convert_stream(src, dst, report, fmt)
+
+    elapsed = time.perf_counter() - started
+    mb = total_bytes / 1024 / 1024
+    print(f"수정 완료! '{output_path}' 파일이 생성되었습니다.")
+    print(f"  -> {mb:,.1f} MB / {statements:,} 구문 / {elapsed:.2f}초 ({mb / elapsed if elapsed else 0:,.1f} MB/s)")
+
+# ==========================================
+# 5. 변환 회귀 확인 (--self-check)
+# ==========================================
+# (이름, MySQL 입력, 출력 형식, 반드시 포함할 문자열, 포함하면 안 되는 문자열)
+SELF_CHECK_CASES = [
+    (
+        "COPY: 테이블 마지막 줄의 KEY 도 post-data 인덱스로 이동",
+        "CREATE TABLE `t` (\n  `id` int NOT NULL AUTO_INCREMENT,\n  `s` int DEFAULT NULL,\n"
+        "  PRIMARY KEY (`id`),\n  KEY `idx_s` (`s`)\n) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;\n",
+        'copy',
+        ["CREATE INDEX idx_s ON t (s);", "ALTER TABLE t ADD PRIMARY KEY (id);", "s int DEFAULT NULL\n);"],
+        ["KEY idx_s (s)\n)"],
+    ),
+    (
+        "COPY: 빈 테이블 시퀀스는 1부터 (is_called=false)",
+        "CREATE TABLE `t` (\n  `id` int NOT NULL AUTO_INCREMENT,\n  PRIMARY KEY (`id`)\n) ENGINE=InnoDB;\n",
+        'copy',
+        ["COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM t;"],
+        [],
+    ),
+    (
+        "INSERT: KEY 는 주석 처리 후 콤마 정리",
+        "CREATE TABLE `t` (\n  `id` int NOT NULL AUTO_INCREMENT,\n  PRIMARY KEY (`id`),\n  KEY `idx_s` (`id`)\n"
+        ") ENGINE=InnoDB;\n",
+        'insert',
+        ["PRIMARY KEY (id)\n);"],
+        ["PRIMARY KEY (id),"],
+    ),
+]
+
+def self_check():
+    """SELF_CHECK_CASES 를 변환해 보고 실패한 케이스 수 반환"""
+    failures = 0
+    for name, src, fmt, expected, forbidden in SELF_CHECK_CASES:
+        out = convert_mysql_to_postgres(src, fmt)
+        problems = [f"없음: {e!r}" for e in expected if e not in out] + [f"있음: {f!r}" for f in forbidden if f in out]
+        print(f"{'✅' if not problems else '❌'} {name}")
+        for problem in problems:
+            print(f"   - {problem}")
+        failures += bool(problems)
+    return failures
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MySQL 덤프 -> PostgreSQL 스트리밍 변환기")
+    parser.add_argument("input_file", nargs='?', default=input_file, help="MySQL 덤프 파일")
+    parser.add_argument("output_file", nargs='?', default=output_file, help="PostgreSQL용 출력 파일")
+    parser.add_argument("--format", choices=FORMAT_CHOICES, default=DEFAULT_FORMAT,
+                        help="insert: 다중 행 INSERT 유지 / copy: COPY 블록 + 인덱스·외래 키 후처리")
+    parser.add_argument("--self-check", action='store_true', help="변환 회귀 케이스만 확인하고 종료 (실패 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    if args.self_check:
+        sys.exit(1 if self_check() else 0)
+
+    # 파일 변환 실행
+    try:
+        convert_file(args.input_file, args.output_file, args.format)
+    except FileNotFoundError:
+        print(f"'{args.input_file}' 파일을 찾을 수 없습니다.")
+        sys.exit(1)
@@ -0,0 +1,377 @@
+import os
+import io
+import re
+import sys
+import time
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import change_pg
+
+# ==========================================
+# 병렬 복원 파이프라인 (MySQL / PostgreSQL)
+# ==========================================
+# 1. pre-data : 스키마(CREATE TABLE 등)를 커넥션 1개로 순서대로 실행
+# 2. data     : 덤프를 테이블별(큰 테이블은 청크별) 임시 파일로 나눈 뒤
+#               의존 관계 단계(wave)마다 워커 풀(워커 1개 = 커넥션 1개)로 병렬 적재
+# 3. post-data: 보조 인덱스(idx_shipment_updates_shipment_id_timestamp 등) / 외래 키 /
+#               시퀀스 재설정을 데이터 적재가 끝난 뒤에 실행
+#
+# PostgreSQL은 MySQL 원본 덤프를 change_pg.py 규칙으로 바로 변환하고, 데이터는 COPY로 넣습니다.
+
+mysql_config = {
+    'host': 'localhost',
+    'user': 'root',
+    'password': '',  # ★ 비밀번호 입력 ★
+    'db': 'shipment',
+    'charset': 'utf8mb4'
+}
+
+pg_config = {
+    'host': 'localhost',
+    'user': 'postgres',
+    'password': '',  # ★ 비밀번호 입력 ★
+    'dbname': 'shipment',
+}
+
+BACKENDS = ('mysql', 'postgres')
+
+# 외래 키 의존 순서. 같은 단계의 테이블은 동시에 적재합니다.
+TABLE_WAVES = [
+    ['companies', 'warehouses', 'products'],
+    ['shipments'],
+    ['shipment_items', 'shipment_updates'],
+]
+
+CHUNK_BYTES = 32 * 1024 * 1024     # 테이블 덤프를 이 크기 단위 청크로 나눠 병렬 적재
+COPY_BATCH_ROWS = 50000            # PostgreSQL COPY 1회당 최대 행 수
+DEFAULT_JOBS = os.cpu_count() or 4
+
+RE_INSERT_TABLE = re.compile(r'^\s*INSERT\s+(?:IGNORE\s+)?INTO\s+`?(\w+)`?', re.IGNORECASE)
+RE_CREATE_INDEX = re.compile(r'^\s*CREATE\s+(?:UNIQUE\s+)?INDEX\b', re.IGNORECASE)
+RE_SKIP_MYSQL = re.compile(r'^\s*(?:/\*!.*\*/;|(?:UN)?LOCK TABLES\b)', re.IGNORECASE | re.DOTALL)
+RE_SET = re.compile(r'^\s*SET\b', re.IGNORECASE)
+RE_CREATE_TABLE = re.compile(r'^\s*CREATE\s+TABLE\b', re.IGNORECASE)
+
+# ==========================================
+# 1. 커넥션 (워커 프로세스마다 1개씩 유지)
+# ==========================================
+_conn = None
+
+def connect(backend):
+    if backend == 'postgres':
+        import psycopg2
+        conn = psycopg2.connect(**pg_config)
+        with conn.cursor() as cur:
+            # 적재 중에는 FK 트리거를 끕니다 (change_pg.py 헤더와 동일, superuser 필요)
+            cur.execute("SET session_replication_role = 'replica'")
+        conn.commit()
+        return conn
+
+    import pymysql
+    conn = pymysql.connect(**mysql_config)
+    with conn.cursor() as cur:
+        # mysqldump 헤더와 동일하게 적재 중 검사 생략
+        cur.execute("SET FOREIGN_KEY_CHECKS = 0")
+        cur.execute("SET UNIQUE_CHECKS = 0")
+    return conn
+
+def _init_worker(backend):
+    global _conn
+    _conn = connect(backend)
+
+# ==========================================
+# 2. 덤프 분해 (pre-data / 테이블별 data / post-data)
+# ==========================================
+def split_deferred_mysql(stmt):
+    """
+    MySQL CREATE TABLE 에서 보조 인덱스(KEY / UNIQUE KEY) / 외래 키(CONSTRAINT ... FOREIGN KEY) 정의를 떼어내
+    post-data 용 ALTER TABLE 로 반환. PRIMARY KEY 는 InnoDB 클러스터 인덱스라 나중에 붙이면 테이블을 다시 만들므로 그대로 둡니다.
+    반환: (정의가 빠진 CREATE TABLE, {'index': [...], 'fk': [...]})
+    """
+    stmt = stmt.replace('`', '')
+    table = change_pg.RE_CREATE_TABLE.search(stmt).group(1)
+    deferred = {'index': [], 'fk': []}
+
+    def collect(match):
+        if match.group('pk'):
+            return match.group(0)
+        if match.group('idx'):
+            unique = 'UNIQUE ' if match.group('unique') else ''
+            deferred['index'].append(f"ALTER TABLE {table} ADD {unique}INDEX {match.group('idx')} ({match.group('idx_cols')})")
+        else:
+            deferred['fk'].append(f"ALTER TABLE {table} ADD {match.group('fk')}")
+        return ''
+
+    stmt = change_pg.RE_DEFERRED_LINE.sub(collect, stmt)
+    stmt = change_pg.RE_COMMA_BEFORE_PAREN.sub('\n)', stmt)
+    return stmt, deferred
+
+class DumpSplitter:
+    """덤프 구문을 분류해서 테이블 데이터는 청크 파일로, DDL은 메모리 리스트로 모읍니다."""
+
+    def __init__(self, backend, workdir):
+        self.backend = backend
+        self.workdir = workdir
+        self.pre = []
+        self.post = {'pk': [], 'serial': [], 'index': [], 'fk': []}
+        self.chunks = {}        # table -> [청크 파일 경로, ...]
+        self._open = {}         # table -> (파일 객체, 현재 크기)
+        self._used_index_names = set()
+
+    def add_file(self, path, native=False, errors='strict'):
+        """native=True: 이미 대상 DB 문법인 스키마 파일 (변환하지 않음)"""
+        with open(path, 'r', encoding='utf-8', errors=errors) as f:
+            for kind, text in change_pg.iter_statements(f):
+                if kind == 'statement':
+                    self._add_statement(text, native)
+
+    def _add_statement(self, stmt, native):
+        match = RE_INSERT_TABLE.match(stmt)
+        if match:
+            self._write_data(match.group(1), stmt)
+            return
+        if RE_CREATE_INDEX.match(stmt):
+            self.post['index'].append(stmt.strip())
+            return
+
+        if self.backend == 'mysql':
+            if RE_SKIP_MYSQL.match(stmt):
+                return
+            if RE_CREATE_TABLE.match(stmt):
+                stmt, deferred = split_deferred_mysql(stmt)
+                for key, items in deferred.items():
+                    self.post[key].extend(items)
+            self.pre.append(stmt)
+            return
+
+        if native:
+            self.pre.append(stmt)
+            return
+        # MySQL 덤프 -> PostgreSQL: MySQL 세션 설정(SET NAMES 등)은 버리고 DDL은 변환
+        if RE_SET.match(stmt):
+            return
+        converted = change_pg.convert_statement(stmt)
+        if converted is None:
+            return
+        if converted.lstrip()[:12].upper() == 'CREATE TABLE':
+            converted, deferred = change_pg.split_deferred(converted, self._used_index_names)
+            for key, items in deferred.items():
+                self.post[key].extend(items)
+        self.pre.append(converted)
+
+    def _write_data(self, table, stmt):
+        f, size = self._open.get(table, (None, 0))
+        if f is None or size >= CHUNK_BYTES:
+            if f is not None:
+                f.close()
+            path = os.path.join(self.workdir, f"{table}.{len(self.chunks.get(table, []))}.sql")
+            f = open(path, 'w', encoding='utf-8')
+            self.chunks.setdefault(table, []).append(path)
+            size = 0
+        f.write(stmt)
+        self._open[table] = (f, size + len(stmt))
+
+    def close(self):
+        for f, _ in self._open.values():
+            f.close()
+        self._open = {}
+
+    def waves(self):
+        """TABLE_WAVES 순서대로 실제 데이터가 있는 테이블만, 나머지 테이블은 마지막 단계로"""
+        known = set()
+        result = []
+        for wave in TABLE_WAVES:
+            known.update(wave)
+            tables = [t for t in wave if t in self.chunks]
+            if tables:
+                result.append(tables)
+        rest = [t for t in self.chunks if t not in known]
+        if rest:
+            result.append(rest)
+        return result
+
+# ==========================================
+# 3. 워커 작업 (워커 프로세스 안에서 실행)
+# ==========================================
+def _load_chunk_mysql(cur, path):
+    rows = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for _, stmt in change_pg.iter_statements(f):
+            rows += cur.execute(stmt) or 0
+    return rows
+
+def _load_chunk_postgres(cur, path):
+    """INSERT 구문의 VALUES 를 COPY text 로 바꿔 COPY_BATCH_ROWS 단위로 적재"""
+    rows = 0
+    buffer = io.StringIO()
+    buffered = 0
+    target = None
+
+    def flush():
+        nonlocal buffer, buffered
+        if buffered:
+            buffer.seek(0)
+            table, columns = target
+            cols = f" ({columns})" if columns else ''
+            cur.copy_expert(f"COPY {table}{cols} FROM STDIN", buffer)
+        buffer = io.StringIO()
+        buffered = 0
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for _, stmt in change_pg.iter_statements(f):
+            stmt = change_pg.convert_statement(stmt)
+            match = change_pg.RE_VALUES.search(stmt)
+            head = change_pg.RE_INSERT_TARGET.match(stmt[:match.end()]) if match else None
+            if head is None:
+                flush()
+                cur.execute(stmt)
+                continue
+            table, columns = head.groups()
+            key = (table, ' '.join(columns.split()) if columns else None)
+            if key != target:
+                flush()
+                target = key
+            for row in change_pg.iter_value_rows(stmt[match.end():]):
+                buffer.write('\t'.join(row) + '\n')
+                buffered += 1
+                rows += 1
+            if buffered >= COPY_BATCH_ROWS:
+                flush()
+    flush()
+    return rows
+
+def _run_task(backend, kind, table, payload):
+    """kind: 'chunk'(payload=청크 경로) | 'sql'(payload=SQL 구문)"""
+    started = time.perf_counter()
+    cur = _conn.cursor()
+    try:
+        if kind == 'chunk':
+            if backend == 'postgres':
+                rows = _load_chunk_postgres(cur, payload)
+            else:
+                rows = _load_chunk_mysql(cur, payload)
+        else:
+            cur.execute(payload)
+            rows = 0
+        _conn.commit()
+    except Exception:
+        _conn.rollback()
+        raise
+    finally:
+        cur.close()
+    return kind, table, payload, rows, started, time.perf_counter()
+
+# ==========================================
+# 4. 파이프라인
+# ==========================================
+def _run_parallel(pool, backend, tasks, timings):
+    """tasks: [(kind, table, payload), ...] 를 동시에 실행하고 테이블별 시간을 집계"""
+    futures = [pool.submit(_run_task, backend, kind, table, payload) for kind, table, payload in tasks]
+    for future in as_completed(futures):
+        kind, table, payload, rows, started, ended = future.result()
+        t = timings.setdefault(table, {'tasks': 0, 'rows': 0, 'busy': 0.0, 'start': started, 'end': ended})
+        t['tasks'] += 1
+        t['rows'] += rows
+        t['busy'] += ended - started
+        t['start'] = min(t['start'], started)
+        t['end'] = max(t['end'], ended)
+
+def _table_of(sql):
+    match = re.search(r'\bON\s+(\w+)|ALTER TABLE\s+(\w+)|FROM\s+(\w+)', sql, re.IGNORECASE)
+    return next((g for g in match.groups() if g), '?') if match else '?'
+
+def _serial_resets(cursor, tables):
+    """PostgreSQL: 명시적 ID로 적재한 테이블의 SERIAL 시퀀스를 최댓값 뒤로 이동"""
+    resets = []
+    for table in tables:
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = %s AND column_default LIKE 'nextval%%'",
+            (table,)
+        )
+        for (col,) in cursor.fetchall():
+            resets.append(
+                # 빈 테이블은 is_called=false 로 두어 다음 값이 1부터 (change_pg.split_deferred 와 동일)
+                f"SELECT setval(pg_get_serial_sequence('{table}', '{col}'), COALESCE(MAX({col}), 1), "
+                f"MAX({col}) IS NOT NULL) FROM {table}"
+            )
+    return resets
+
+def print_timings(title, timings):
+    print(f"\n📊 {title}")
+    print(f"   {'대상':<45} {'작업':>4} {'행 수':>12} {'경과(초)':>9} {'작업합(초)':>10}")
+    for name, t in timings.items():
+        print(f"   {name:<45} {t['tasks']:>4} {t['rows']:>12,} {t['end'] - t['start']:>9.2f} {t['busy']:>10.2f}")
+
+def restore(backend, schema_files, data_files, jobs=DEFAULT_JOBS):
+    total_started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='logis_restore_') as workdir:
+        # --- 덤프 분해 ---
+        print(f"🔪 [{backend}] 덤프를 테이블별로 분해 중...")
+        started = time.perf_counter()
+        splitter = DumpSplitter(backend, workdir)
+        for path in schema_files:
+            # 스키마 파일은 주석 인코딩이 깨진 경우가 있어 replace 로 읽습니다.
+            splitter.add_file(path, native=True, errors='replace')
+        for path in data_files:
+            splitter.add_file(path)
+        splitter.close()
+        chunk_count = sum(len(c) for c in splitter.chunks.values())
+        print(f"   -> {len(splitter.chunks)}개 테이블 / {chunk_count}개 청크 ({time.perf_counter() - started:.2f}초)")
+
+        # --- pre-data ---
+        conn = connect(backend)
+        cur = conn.cursor()
+        started = time.perf_counter()
+        for stmt in splitter.pre:
+            cur.execute(stmt)
+        conn.commit()
+        print(f"🏗️  pre-data {len(splitter.pre)}개 구문 실행 ({time.perf_counter() - started:.2f}초)")
+
+        data_timings = {}
+        post_timings = {}
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(backend,)) as pool:
+            # --- data: 단계별 병렬 적재 ---
+            for i, wave in enumerate(splitter.waves(), 1):
+                print(f"🚚 data 단계 {i}: {', '.join(wave)}")
+                tasks = [('chunk', table, path) for table in wave for path in splitter.chunks[table]]
+                _run_parallel(pool, backend, tasks, data_timings)
+
+            # --- post-data: 기본 키 -> 시퀀스 -> 인덱스 -> 외래 키 ---
+            post = splitter.post
+            if backend == 'postgres':
+                # 덤프/스키마 파일 어느 쪽에서 만든 테이블이든 시퀀스를 실제 컬럼 정보로 재설정
+                post['serial'] = _serial_resets(cur, list(splitter.chunks))
+            for key in ('pk', 'serial', 'index', 'fk'):
+                if post[key]:
+                    print(f"🧱 post-data: {key} {len(post[key])}개")
+                    _run_parallel(pool, backend, [('sql', f"{key}:{_table_of(sql)}", sql) for sql in post[key]], post_timings)
+
+        if backend == 'postgres':
+            conn.commit()
+            conn.autocommit = True
+            for table in splitter.chunks:
+                cur.execute(f"ANALYZE {table}")
+        conn.close()
+
+    print_timings("테이블별 데이터 적재 시간", data_timings)
+    if post_timings:
+        print_timings("post-data (인덱스/제약 조건) 시간", post_timings)
+    print(f"\n✅ 복원 완료: 총 {time.perf_counter() - total_started:.2f}초 (워커 {jobs}개)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Logis-Flow 덤프 병렬 복원 도구")
+    parser.add_argument("data_files", nargs='+', help="MySQL 형식 데이터 덤프 (02_seed_data.sql, 03_..., 04_...)")
+    parser.add_argument("--backend", choices=BACKENDS, default='mysql')
+    parser.add_argument("--schema", action='append', default=[],
+                        help="대상 DB 문법의 스키마 파일 (mysql: 01_schema_ddl.sql / postgres: post_01_schema_ddl.sql)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="동시 적재 워커(커넥션) 수")
+    args = parser.parse_args()
+
+    try:
+        restore(args.backend, args.schema, args.data_files, args.jobs)
+    except FileNotFoundError as e:
+        print(f"'{e.filename}' 파일을 찾을 수 없습니다.")
+        sys.exit(1)
@@ -0,0 +1,235 @@
+import time
+import argparse
+
+from benchmark import drivers
+from benchmark.db import Session
+from benchmark.stats import summarize
+
+# ==========================================
+# 화물 상태 목록 (keyset 페이지네이션)
+# ==========================================
+# 조회 벤치마크는 모두 LIMIT 500/1000 첫 페이지만 재지만, 대시보드는 65만 건 이상을 깊게 넘겨 봅니다.
+# OFFSET 페이지는 앞 페이지 행을 모두 읽고 버리므로 N번째 페이지 비용이 N에 비례합니다.
+# ShipmentListing 은 마지막으로 본 키 다음부터 읽는 keyset(seek) 방식으로 (shipment_id, created_at, current_status) 페이지를 돌려줍니다.
+#
+#   정렬(order)   id      : shipment_id                 (PK)
+#                 created : (created_at, shipment_id)   (idx_shipments_created_at_id, 없으면 생성)
+#   상태(mode)    denormalized : shipments.current_status 직접 조회
+#                 normalized   : 화물별 최신 shipment_updates 행 (MySQL 8.0.14+/PG: LATERAL, SQLite: 상관 서브쿼리)
+#
+#   python shipment_listing.py --backend sqlite --modes denormalized normalized --orders id created
+#   python shipment_listing.py --backend mysql --page-size 50 --depths 0 0.5 1 --repeats 10
+
+ORDERS = {
+    'id': ('shipment_id',),
+    'created': ('created_at', 'shipment_id'),
+}
+MODES = ('denormalized', 'normalized')
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_DEPTHS = (0.0, 0.1, 0.25, 0.5, 0.75, 1.0)     # 전체 페이지 중 위치 (1.0 = 마지막 페이지)
+DEFAULT_REPEATS = 5
+LISTING_INDEX = 'idx_shipments_created_at_id'
+
+# 정규화 모드: 화물별 최신 이력 1행 (timestamp 가 같으면 update_id 가 큰 것)
+LATEST_STATUS_SUBQUERY = """
+    SELECT u.status_code FROM shipment_updates u
+    WHERE u.shipment_id = s.shipment_id
+    ORDER BY u.timestamp DESC, u.update_id DESC LIMIT 1
+"""
+
+def listing_sql(dialect, mode, order, seek=False, offset=False):
+    """
+    페이지 조회 SQL (%s 자리표시자). seek=True 면 마지막 키 다음부터, offset=True 면 OFFSET 으로 건너뜀.
+    파라미터 순서: [seek 키 ...] + [page_size] + [offset]
+    """
+    join = ''
+    if mode == 'denormalized':
+        status = "s.current_status"
+    elif dialect == 'sqlite':
+        status = f"({LATEST_STATUS_SUBQUERY})"
+    else:
+        status = "latest.status_code"
+        join = f"LEFT JOIN LATERAL ({LATEST_STATUS_SUBQUERY}) latest ON TRUE"
+
+    where = ''
+    if seek:
+        if order == 'id':
+            where = "WHERE s.shipment_id > %s"
+        elif dialect == 'mysql':
+            # MySQL 은 행 생성자 비교 (a, b) > (x, y) 를 인덱스 범위로 못 쓰는 경우가 있어 풀어서 씀
+            where = "WHERE s.created_at > %s OR (s.created_at = %s AND s.shipment_id > %s)"
+        else:
+            where = "WHERE (s.created_at, s.shipment_id) > (%s, %s)"
+
+    order_by = ", ".join(f"s.{column}" for column in ORDERS[order])
+    sql = f"""
+        SELECT s.shipment_id, s.created_at, {status} AS current_status
+        FROM shipments s {join}
+        {where}
+        ORDER BY {order_by}
+        LIMIT %s
+    """
+    return sql + " OFFSET %s" if offset else sql
+
+class ShipmentListing:
+    """
+    keyset 페이지 조회. page(after) 는 (행 목록, 다음 페이지 커서) 반환 - 커서는 마지막 행의 정렬 키, 마지막 페이지면 None.
+    page_offset(page_no) 는 비교용 OFFSET 방식 (0부터 시작하는 페이지 번호).
+    """
+    def __init__(self, session, mode='denormalized', order='id', page_size=DEFAULT_PAGE_SIZE):
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 모드: {mode} (선택: {', '.join(MODES)})")
+        if order not in ORDERS:
+            raise ValueError(f"알 수 없는 정렬: {order} (선택: {', '.join(ORDERS)})")
+        self.session = session
+        self.mode = mode
+        self.order = order
+        self.page_size = page_size
+        dialect = session.dialect
+        self.first_sql = listing_sql(dialect, mode, order)
+        self.seek_sql = listing_sql(dialect, mode, order, seek=True)
+        self.offset_sql = listing_sql(dialect, mode, order, offset=True)
+
+    def cursor_of(self, row):
+        """행 -> 정렬 키 (id: shipment_id / created: (created_at, shipment_id))"""
+        return row[0] if self.order == 'id' else (row[1], row[0])
+
+    def _seek_params(self, after):
+        if self.order == 'id':
+            return [after]
+        created_at, s_id = after
+        if self.session.dialect == 'mysql':
+            return [created_at, created_at, s_id]
+        return [created_at, s_id]
+
+    def page(self, after=None):
+        if after is None:
+            rows = self.session.query(self.first_sql, (self.page_size,)).fetchall()
+        else:
+            rows = self.session.query(self.seek_sql, self._seek_params(after) + [self.page_size]).fetchall()
+        next_cursor = self.cursor_of(rows[-1]) if len(rows) == self.page_size else None
+        return rows, next_cursor
+
+    def page_offset(self, page_no):
+        return self.session.query(self.offset_sql, (self.page_size, page_no * self.page_size)).fetchall()
+
+    def iter_pages(self):
+        after = None
+        while True:
+            rows, after = self.page(after)
+            if rows:
+                yield rows
+            if after is None:
+                return
+
+def ensure_listing_index(session):
+    """(created_at, shipment_id) 정렬용 인덱스가 없으면 생성"""
+    if session.dialect == 'mysql':
+        count = session.query(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'shipments' AND index_name = %s",
+            (LISTING_INDEX,)
+        ).fetchone()[0]
+        if count:
+            return
+        session.query(f"CREATE INDEX {LISTING_INDEX} ON shipments (created_at, shipment_id)")
+    else:
+        session.query(f"CREATE INDEX IF NOT EXISTS {LISTING_INDEX} ON shipments (created_at, shipment_id)")
+    session.conn.commit()
+
+# ==========================================
+# 페이지 깊이별 keyset vs OFFSET 벤치마크
+# ==========================================
+def _timed(func, *args):
+    t0 = time.perf_counter_ns()
+    rows = func(*args)
+    return time.perf_counter_ns() - t0, rows
+
+def run_depths(listing, depths, repeats):
+    """
+    keyset 으로 끝까지 한 번 넘기며 목표 페이지 직전 커서를 모은 뒤,
+    목표 페이지마다 keyset / OFFSET 을 repeats 회씩 재고 두 결과가 같은지 확인합니다.
+    """
+    walk_started = time.perf_counter()
+    cursors = [None]          # cursors[n] = n번째 페이지를 읽을 때 넘길 커서
+    rows_total = 0
+    for rows in listing.iter_pages():
+        rows_total += len(rows)
+        cursors.append(listing.cursor_of(rows[-1]))
+    walk_seconds = time.perf_counter() - walk_started
+    pages = max((rows_total + listing.page_size - 1) // listing.page_size, 1)
+
+    targets = sorted({min(int(depth * (pages - 1)), pages - 1) for depth in depths})
+    results = []
+    for page_no in targets:
+        keyset_ns, offset_ns = [], []
+        for _ in range(repeats):
+            ns, (keyset_rows, _) = _timed(listing.page, cursors[page_no])
+            keyset_ns.append(ns)
+            ns, offset_rows = _timed(listing.page_offset, page_no)
+            offset_ns.append(ns)
+        results.append({
+            'page': page_no,
+            'row_offset': page_no * listing.page_size,
+            'keyset': summarize(keyset_ns),
+            'offset': summarize(offset_ns),
+            'same_rows': list(keyset_rows) == list(offset_rows),
+        })
+    listing.session.conn.rollback()
+    return {
+        'mode': listing.mode,
+        'order': listing.order,
+        'rows': rows_total,
+        'pages': pages,
+        'walk_seconds': walk_seconds,
+        'depths': results,
+    }
+
+def print_depths(result, page_size):
+    print(f"\n📊 [{result['mode']} / order={result['order']}] 화물 {result['rows']:,}건 = {result['pages']:,}페이지 "
+          f"(페이지당 {page_size}건, 지연 p50 ms)")
+    pages_per_sec = result['pages'] / result['walk_seconds'] if result['walk_seconds'] else 0.0
+    print(f"   keyset 으로 처음부터 끝까지 넘기기: {result['walk_seconds']:.2f}초 ({pages_per_sec:.0f} 페이지/초)")
+    print(f"{'page':>9} {'row offset':>11} {'keyset':>9} {'OFFSET':>9} {'배율':>8} {'결과 일치':>9}")
+    for d in result['depths']:
+        keyset, offset = d['keyset']['p50_ms'], d['offset']['p50_ms']
+        ratio = f"{offset / keyset:.1f}x" if keyset > 0 else '-'
+        print(f"{d['page']:>9,} {d['row_offset']:>11,} {keyset:>9.2f} {offset:>9.2f} {ratio:>8} "
+              f"{'✅' if d['same_rows'] else '❌':>8}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="화물 상태 목록 keyset 페이지네이션 vs OFFSET 깊이별 비교")
+    parser.add_argument("--backend", choices=list(drivers.DRIVERS), default='mysql')
+    parser.add_argument("--modes", nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument("--orders", nargs='+', choices=list(ORDERS), default=list(ORDERS))
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--depths", type=float, nargs='+', default=list(DEFAULT_DEPTHS),
+                        help="측정할 페이지 위치 (0 = 첫 페이지, 1 = 마지막 페이지)")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="페이지마다 측정 반복 횟수")
+    parser.add_argument("--sqlite-path", default=drivers.DEFAULT_SQLITE_PATH)
+    parser.add_argument("--sqlite-shipments", type=int, default=drivers.DEFAULT_SQLITE_SHIPMENTS,
+                        help="SQLite 데이터셋이 없을 때 생성할 화물 수")
+    args = parser.parse_args()
+    if args.page_size < 1 or args.repeats < 1:
+        parser.error("--page-size / --repeats 는 1 이상이어야 합니다.")
+    if any(not 0 <= depth <= 1 for depth in args.depths):
+        parser.error("--depths 는 0 ~ 1 사이여야 합니다.")
+
+    if args.backend == 'sqlite':
+        driver = drivers.get_driver('sqlite', path=args.sqlite_path, shipments=args.sqlite_shipments)
+    else:
+        driver = drivers.get_driver(args.backend)
+    driver.prepare()
+    print(f"🔌 백엔드: {driver.describe()}")
+
+    session = Session(driver.connect(), driver.dialect)
+    try:
+        if 'created' in args.orders:
+            ensure_listing_index(session)
+        for mode in args.modes:
+            for order in args.orders:
+                print(f"🚦 {mode} / order={order} ...")
+                listing = ShipmentListing(session, mode, order, args.page_size)
+                print_depths(run_depths(listing, args.depths, args.repeats), args.page_size)
+    finally:
+        session.close()
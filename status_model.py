@@ -0,0 +1,190 @@
+import json
+import math
+import numpy as np
+
+# ==========================================
+# 배송 상태 전이 모델 (Markov chain)
+# ==========================================
+# 실제 운영 데이터처럼 "대부분 앞으로만 진행하고, 가끔 재시도/환적/반송으로 되돌아가는"
+# 이력을 만듭니다. 상태마다 체류 시간(dwell) 분포가 다르고,
+# 일부 화물(long tail)은 50건 이상의 긴 이력을 가집니다.
+#
+# 최신 상태 서브쿼리의 비용은 화물당 이력 수(fan-out)와 인덱스 깊이에 좌우되므로
+# 균등 랜덤 상태 대신 이 모델로 생성해야 벤치마크 결과가 운영과 비슷해집니다.
+
+# 상태 -> {다음 상태: 확률}. 비어 있으면 종료 상태
+DEFAULT_TRANSITIONS = {
+    '주문접수':   {'집화처리': 0.97, '주문접수': 0.03},
+    '집화처리':   {'간선상차': 0.96, '집화처리': 0.04},
+    '간선상차':   {'간선하차': 0.98, '간선상차': 0.02},
+    '간선하차':   {'터미널입고': 0.97, '간선상차': 0.03},                    # 환적
+    '터미널입고': {'터미널출고': 0.96, '터미널입고': 0.04},
+    '터미널출고': {'배송출발': 0.85, '간선상차': 0.15},                      # 다음 허브로 이동
+    '배송출발':   {'배송완료': 0.90, '배송출발': 0.07, '터미널입고': 0.03},  # 재배송 / 반송
+    '배송완료':   {},
+}
+
+# 상태별 체류 시간 분포: 로그정규 (중앙값 시간, sigma)
+DEFAULT_DWELL_HOURS = {
+    '주문접수':   (2.0, 0.8),
+    '집화처리':   (6.0, 0.7),
+    '간선상차':   (1.5, 0.5),
+    '간선하차':   (8.0, 0.6),
+    '터미널입고': (1.0, 0.6),
+    '터미널출고': (3.0, 0.7),
+    '배송출발':   (10.0, 0.5),
+    '배송완료':   (4.0, 0.6),
+}
+
+DEFAULT_LONG_TAIL_SHARE = 0.01        # 이력 50건 이상인 화물 비율
+DEFAULT_LONG_TAIL_RANGE = (50, 120)   # long tail 화물의 이력 건수 범위
+DEFAULT_MAX_UPDATES = 40              # 일반 화물 이력 상한 (순환 방지)
+DEFAULT_IN_TRANSIT_SHARE = 0.10       # 아직 배송 중(중간에서 끊긴) 화물 비율
+MIN_GAP_SECONDS = 60                  # 이력 간 최소 간격 (타임스탬프 단조 증가 보장)
+
+class StatusModel:
+    def __init__(self, transitions=None, dwell_hours=None, initial=None,
+                 long_tail_share=DEFAULT_LONG_TAIL_SHARE, long_tail_range=DEFAULT_LONG_TAIL_RANGE,
+                 max_updates=DEFAULT_MAX_UPDATES, in_transit_share=DEFAULT_IN_TRANSIT_SHARE):
+        transitions = transitions or DEFAULT_TRANSITIONS
+        dwell_hours = dwell_hours or DEFAULT_DWELL_HOURS
+
+        self.statuses = list(transitions)
+        self.index = {s: i for i, s in enumerate(self.statuses)}
+        self.initial = self.index[initial or self.statuses[0]]
+        self.long_tail_share = long_tail_share
+        self.long_tail_range = tuple(long_tail_range)
+        self.max_updates = max_updates
+        self.in_transit_share = in_transit_share
+
+        n = len(self.statuses)
+        matrix = np.zeros((n, n))
+        for src, targets in transitions.items():
+            total = sum(targets.values())
+            for dst, p in targets.items():
+                if dst not in self.index:
+                    raise ValueError(f"정의되지 않은 상태로의 전이: {src} -> {dst}")
+                matrix[self.index[src], self.index[dst]] = p / total
+        self.terminal = matrix.sum(axis=1) == 0
+        if not self.terminal.any():
+            raise ValueError("종료 상태(전이가 없는 상태)가 최소 1개 필요합니다.")
+        # 누적 확률의 마지막 값을 정확히 1.0으로 맞춰 부동소수 오차로 확률 0인 상태가 뽑히지 않게 합니다.
+        cumulative = np.cumsum(matrix, axis=1)
+        live = ~self.terminal
+        cumulative[live] = np.minimum(cumulative[live] / cumulative[live, -1:], 1.0)
+        self.cumulative = cumulative
+
+        # long tail 화물이 종료 상태를 만나면 되돌아갈 상태 (종료 상태로 가장 많이 들어오는 상태)
+        into_terminal = matrix[:, self.terminal].sum(axis=1)
+        into_terminal[self.terminal] = -1
+        self.retry_state = int(np.argmax(into_terminal))
+
+        mu_sigma = [dwell_hours.get(s, (1.0, 0.5)) for s in self.statuses]
+        self.dwell_mu = np.array([math.log(m) for m, _ in mu_sigma])
+        self.dwell_sigma = np.array([sig for _, sig in mu_sigma])
+
+    @classmethod
+    def from_flow(cls, flow, advance=0.95, **kwargs):
+        """단순 진행 순서(STATUS_FLOW)로 모델 생성: 다음 단계 advance, 나머지는 현 단계 반복"""
+        transitions = {}
+        for i, status in enumerate(flow):
+            if i == len(flow) - 1:
+                transitions[status] = {}
+            else:
+                transitions[status] = {flow[i + 1]: advance, status: 1 - advance}
+        return cls(transitions=transitions, dwell_hours={s: (6.0, 0.7) for s in flow}, **kwargs)
+
+    @classmethod
+    def from_json(cls, path):
+        """
+        JSON 설정 파일로 모델 생성. 예)
+        {"transitions": {...}, "dwell_hours": {"주문접수": [2.0, 0.8], ...},
+         "long_tail_share": 0.02, "long_tail_range": [50, 200]}
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if 'dwell_hours' in config:
+            config['dwell_hours'] = {k: tuple(v) for k, v in config['dwell_hours'].items()}
+        return cls(**config)
+
+    # ------------------------------------------
+    # 화물 1건 (--engine python)
+    # ------------------------------------------
+    def sample_history(self, rng):
+        """random.Random으로 화물 1건의 [(상태, 직전 이력과의 간격(초)), ...] 생성"""
+        long_tail = rng.random() < self.long_tail_share
+        if long_tail:
+            target = rng.randint(*self.long_tail_range)
+        else:
+            target = self.max_updates
+        in_transit = not long_tail and rng.random() < self.in_transit_share
+
+        history = []
+        state = self.initial
+        while True:
+            gap = rng.lognormvariate(self.dwell_mu[state], self.dwell_sigma[state]) * 3600
+            history.append((self.statuses[state], max(int(gap), MIN_GAP_SECONDS)))
+            if len(history) >= target or (self.terminal[state] and not long_tail):
+                break
+            if self.terminal[state]:
+                state = self.retry_state
+                continue
+            state = int(np.searchsorted(self.cumulative[state], rng.random(), side='right'))
+            state = min(state, len(self.statuses) - 1)
+
+        if in_transit and len(history) > 1:
+            history = history[:rng.randint(1, len(history) - 1)]
+        return history
+
+    # ------------------------------------------
+    # 배치 단위 (--engine numpy)
+    # ------------------------------------------
+    def sample_batch(self, rng, n):
+        """
+        n개 화물의 이력을 한 번에 생성합니다. (모든 체인을 한 단계씩 동시에 진행)
+        반환값: (화물별 이력 수, 상태 인덱스 배열, 간격(초) 배열) - 화물 순서대로 평탄화
+        """
+        long_tail = rng.random(n) < self.long_tail_share
+        targets = np.full(n, self.max_updates)
+        lo, hi = self.long_tail_range
+        targets[long_tail] = rng.integers(lo, hi + 1, int(long_tail.sum()))
+        steps = int(targets.max()) if n else 0
+
+        states = np.full(n, self.initial)
+        active = np.ones(n, dtype=bool)
+        recorded = np.full((steps, n), -1, dtype=np.int64)
+
+        for step in range(steps):
+            idx = np.flatnonzero(active)
+            if not len(idx):
+                break
+            cur = states[idx]
+            recorded[step, idx] = cur
+
+            # 종료 상태 도달 또는 목표 건수 도달 시 체인 종료 (long tail은 종료 상태에서 재시도)
+            done = (step + 1 >= targets[idx]) | (self.terminal[cur] & ~long_tail[idx])
+            active[idx[done]] = False
+
+            go = idx[~done]
+            if not len(go):
+                continue
+            cur = states[go]
+            u = rng.random(len(go))
+            nxt = (u[:, None] >= self.cumulative[cur]).sum(axis=1)
+            nxt = np.minimum(nxt, len(self.statuses) - 1)
+            nxt[self.terminal[cur]] = self.retry_state
+            states[go] = nxt
+
+        mask = recorded.T >= 0
+        counts = mask.sum(axis=1)
+
+        # 배송 중 화물: 이력을 앞에서부터 일부만 남김
+        in_transit = (rng.random(n) < self.in_transit_share) & ~long_tail & (counts > 1)
+        cut = np.maximum(1, (rng.random(n) * (counts - 1)).astype(np.int64))
+        counts = np.where(in_transit, cut, counts)
+        mask &= np.arange(steps)[None, :] < counts[:, None]
+
+        status_idx = recorded.T[mask]
+        gap = np.exp(self.dwell_mu[status_idx] + self.dwell_sigma[status_idx] * rng.standard_normal(len(status_idx)))
+        gap_seconds = np.maximum((gap * 3600).astype(np.int64), MIN_GAP_SECONDS)
+        return counts, status_idx, gap_seconds
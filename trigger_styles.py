@@ -0,0 +1,309 @@
+import time
+import random
+import argparse
+from datetime import datetime
+
+from benchmark import drivers
+from consistency_test import ensure_projection_version
+
+# ==========================================
+# 트리거 방식별 대량 INSERT 비교
+# ==========================================
+# consistency_test.setup_trigger 는 행 단위(FOR EACH ROW) 트리거라, 이력 N건을 한 문장으로 넣어도
+# shipments 단건 UPDATE 가 N번 실행됩니다. 대량 적재(스캐너 일괄 업로드, 마이그레이션)에서 트리거 방식별 비용을 비교합니다.
+#
+#   none      : 트리거 없음 (적재 비용 기준선, 프로젝션은 반영되지 않음)
+#   row       : 행 단위 트리거 - 이력 1행마다 shipments UPDATE 1회 (기존 Strategy B, 부하 주입 SLEEP 제외)
+#   statement : [PostgreSQL] 문장 단위 트리거 + transition table
+#               - INSERT 문장 1개당 1회, 새 행들(new_rows) 중 화물별 최신 행으로 UPDATE 1문장
+#   deferred  : [MySQL] 트리거는 dirty 테이블에 화물 ID만 기록하고,
+#               배치 프로시저(project_dirty_shipments)가 dirty 화물을 한 번에 최신 이력으로 갱신
+#
+# 모든 방식은 (timestamp, update_id) 버전 가드를 거치므로 늦게 들어온 과거 이력이 최신 상태를 덮어쓰지 않습니다.
+#
+#   python trigger_styles.py --backend mysql --rows 1000 --statements 20
+#   python trigger_styles.py --backend postgres --styles row statement
+
+STYLES = {
+    'mysql': ('none', 'row', 'deferred'),
+    'postgres': ('none', 'row', 'statement'),
+}
+
+DEFAULT_ROWS = 1000          # INSERT 문장 1개당 이력 행 수
+DEFAULT_STATEMENTS = 20      # 방식별 INSERT 문장 수
+DEFAULT_SHIPMENTS = 1000     # 이력을 흩뿌릴 화물 수 (작을수록 같은 화물에 이력이 몰림)
+
+TRIGGER_NAMES = ('trg_projection_row', 'trg_projection_statement', 'trg_projection_dirty', 'after_shipment_update')
+
+# ---------------------------------------------------------
+# MySQL
+# ---------------------------------------------------------
+MYSQL_ROW_TRIGGER = """
+    CREATE TRIGGER trg_projection_row
+    AFTER INSERT ON shipment_updates
+    FOR EACH ROW
+    UPDATE shipments
+    SET current_status = NEW.status_code, last_updated_at = NEW.timestamp, last_update_id = NEW.update_id
+    WHERE shipment_id = NEW.shipment_id
+      AND (last_update_id IS NULL OR (NEW.timestamp, NEW.update_id) > (last_updated_at, last_update_id))
+"""
+
+MYSQL_DIRTY_TABLE = """
+    CREATE TABLE IF NOT EXISTS shipment_status_dirty (
+        shipment_id INT PRIMARY KEY
+    )
+"""
+
+MYSQL_DIRTY_TRIGGER = """
+    CREATE TRIGGER trg_projection_dirty
+    AFTER INSERT ON shipment_updates
+    FOR EACH ROW
+    INSERT IGNORE INTO shipment_status_dirty (shipment_id) VALUES (NEW.shipment_id)
+"""
+
+MYSQL_DIRTY_PROCEDURE = """
+    CREATE PROCEDURE project_dirty_shipments()
+    BEGIN
+        DECLARE v_dirty INT DEFAULT 0;
+        START TRANSACTION;
+        -- dirty 행 전체 + 빈 구간을 잠가 처리 중 새 dirty 등록은 커밋 뒤로 미룸 (DELETE 로 놓치는 화물 없음)
+        SELECT COUNT(*) INTO v_dirty FROM shipment_status_dirty FOR UPDATE;
+
+        UPDATE shipments s
+        JOIN (
+            SELECT shipment_id, status_code, timestamp, update_id
+            FROM (
+                SELECT u.shipment_id, u.status_code, u.timestamp, u.update_id,
+                       ROW_NUMBER() OVER (PARTITION BY u.shipment_id ORDER BY u.timestamp DESC, u.update_id DESC) AS rn
+                FROM shipment_updates u
+                JOIN shipment_status_dirty d ON d.shipment_id = u.shipment_id
+            ) ranked
+            WHERE rn = 1
+        ) v ON v.shipment_id = s.shipment_id
+        SET s.current_status = v.status_code,
+            s.last_updated_at = v.timestamp,
+            s.last_update_id = v.update_id
+        WHERE s.last_update_id IS NULL OR (v.timestamp, v.update_id) > (s.last_updated_at, s.last_update_id);
+
+        DELETE FROM shipment_status_dirty;
+        COMMIT;
+        SELECT v_dirty;
+    END
+"""
+
+# ---------------------------------------------------------
+# PostgreSQL
+# ---------------------------------------------------------
+PG_ADD_VERSION = "ALTER TABLE shipments ADD COLUMN last_update_id INT"
+
+PG_BACKFILL_VERSION = """
+    UPDATE shipments s
+    SET current_status = v.status_code, last_updated_at = v.timestamp, last_update_id = v.update_id
+    FROM (
+        SELECT DISTINCT ON (shipment_id) shipment_id, status_code, timestamp, update_id
+        FROM shipment_updates
+        ORDER BY shipment_id, timestamp DESC, update_id DESC
+    ) v
+    WHERE s.shipment_id = v.shipment_id
+"""
+
+PG_ROW_FUNCTION = """
+    CREATE OR REPLACE FUNCTION project_status_row() RETURNS trigger AS $$
+    BEGIN
+        UPDATE shipments
+        SET current_status = NEW.status_code, last_updated_at = NEW.timestamp, last_update_id = NEW.update_id
+        WHERE shipment_id = NEW.shipment_id
+          AND (last_update_id IS NULL OR (NEW.timestamp, NEW.update_id) > (last_updated_at, last_update_id));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+PG_ROW_TRIGGER = """
+    CREATE TRIGGER trg_projection_row
+    AFTER INSERT ON shipment_updates
+    FOR EACH ROW EXECUTE FUNCTION project_status_row()
+"""
+
+PG_STATEMENT_FUNCTION = """
+    CREATE OR REPLACE FUNCTION project_status_statement() RETURNS trigger AS $$
+    BEGIN
+        UPDATE shipments s
+        SET current_status = v.status_code, last_updated_at = v.timestamp, last_update_id = v.update_id
+        FROM (
+            SELECT DISTINCT ON (shipment_id) shipment_id, status_code, timestamp, update_id
+            FROM new_rows
+            ORDER BY shipment_id, timestamp DESC, update_id DESC
+        ) v
+        WHERE s.shipment_id = v.shipment_id
+          AND (s.last_update_id IS NULL OR (v.timestamp, v.update_id) > (s.last_updated_at, s.last_update_id));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+PG_STATEMENT_TRIGGER = """
+    CREATE TRIGGER trg_projection_statement
+    AFTER INSERT ON shipment_updates
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_status_statement()
+"""
+
+# 방식별 설치 SQL (none 은 정리만)
+INSTALL_SQL = {
+    ('mysql', 'none'): (),
+    ('mysql', 'row'): (MYSQL_ROW_TRIGGER,),
+    ('mysql', 'deferred'): (MYSQL_DIRTY_TABLE, "DELETE FROM shipment_status_dirty",
+                            "DROP PROCEDURE IF EXISTS project_dirty_shipments", MYSQL_DIRTY_PROCEDURE,
+                            MYSQL_DIRTY_TRIGGER),
+    ('postgres', 'none'): (),
+    ('postgres', 'row'): (PG_ROW_FUNCTION, PG_ROW_TRIGGER),
+    ('postgres', 'statement'): (PG_STATEMENT_FUNCTION, PG_STATEMENT_TRIGGER),
+}
+
+# 진짜 최신 이력과 프로젝션 버전이 다른 화물 수 (지정한 화물만)
+MISMATCH_SQL = """
+    SELECT COUNT(*)
+    FROM shipments s
+    JOIN (
+        SELECT shipment_id, update_id
+        FROM (
+            SELECT shipment_id, update_id,
+                   ROW_NUMBER() OVER (PARTITION BY shipment_id ORDER BY timestamp DESC, update_id DESC) AS rn
+            FROM shipment_updates
+            WHERE shipment_id IN ({ids})
+        ) ranked
+        WHERE rn = 1
+    ) latest ON latest.shipment_id = s.shipment_id
+    WHERE s.last_update_id IS NULL OR s.last_update_id <> latest.update_id
+"""
+
+def ensure_version(driver, conn):
+    cursor = conn.cursor()
+    if driver.dialect == 'mysql':
+        ensure_projection_version(cursor)
+    else:
+        cursor.execute(
+            """
+            SELECT COUNT(*) FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = 'shipments' AND column_name = 'last_update_id'
+            """
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(PG_ADD_VERSION)
+            cursor.execute(PG_BACKFILL_VERSION)
+            print("✅ [Setup] shipments.last_update_id (프로젝션 버전) 컬럼 추가 및 채움 완료")
+    conn.commit()
+
+def drop_triggers(driver, conn):
+    cursor = conn.cursor()
+    for name in TRIGGER_NAMES:
+        if driver.dialect == 'mysql':
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        else:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name} ON shipment_updates")
+    conn.commit()
+
+def install(driver, conn, style):
+    drop_triggers(driver, conn)
+    cursor = conn.cursor()
+    for sql in INSTALL_SQL[(driver.dialect, style)]:
+        cursor.execute(sql)
+    conn.commit()
+
+def run_style(driver, conn, style, shipment_ids, args):
+    """방식 1개: INSERT 문장 statements 개(각 rows 행)를 넣고 적재/반영 시간을 잼"""
+    install(driver, conn, style)
+    rng = random.Random(f"{args.seed}-{style}")
+    cursor = conn.cursor()
+    statuses = ['집화완료', '터미널입고', '배송출발', '배송완료', '수취확인']
+    values = ", ".join(["(%s, %s, %s, %s)"] * args.rows)
+    sql = f"INSERT INTO shipment_updates (shipment_id, status_code, notes, timestamp) VALUES {values}"
+
+    touched = set()
+    statement_ns = []
+    try:
+        for _ in range(args.statements):
+            ts = datetime.now().replace(microsecond=0)
+            params = []
+            for _ in range(args.rows):
+                s_id = rng.choice(shipment_ids)
+                touched.add(s_id)
+                params.extend((s_id, rng.choice(statuses), f"Trigger Style {style}", ts))
+            t0 = time.perf_counter_ns()
+            cursor.execute(sql, params)
+            conn.commit()
+            statement_ns.append(time.perf_counter_ns() - t0)
+
+        # deferred: 적재가 끝난 뒤 배치 프로시저로 한 번에 반영
+        project_ns = 0
+        if style == 'deferred':
+            t0 = time.perf_counter_ns()
+            cursor.execute("CALL project_dirty_shipments()")
+            cursor.fetchall()
+            while cursor.nextset():
+                pass
+            conn.commit()
+            project_ns = time.perf_counter_ns() - t0
+
+        placeholders = ", ".join(str(int(s_id)) for s_id in touched)
+        cursor.execute(MISMATCH_SQL.format(ids=placeholders))
+        mismatches = cursor.fetchone()[0]
+        conn.commit()
+    finally:
+        conn.rollback()     # 실패한 트랜잭션이 남아 있으면 정리 (PostgreSQL 은 오류 뒤 롤백 전까지 명령 거부)
+        drop_triggers(driver, conn)
+
+    insert_seconds = sum(statement_ns) / 1e9
+    total_seconds = insert_seconds + project_ns / 1e9
+    rows = args.rows * args.statements
+    return {
+        'style': style,
+        'rows': rows,
+        'insert_seconds': insert_seconds,
+        'project_seconds': project_ns / 1e9,
+        'rows_per_sec': rows / total_seconds if total_seconds else 0.0,
+        'statement_ms_p50': sorted(statement_ns)[len(statement_ns) // 2] / 1e6,
+        'touched': len(touched),
+        'mismatches': mismatches,
+    }
+
+def print_results(results, args):
+    print(f"\n📊 트리거 방식별 대량 INSERT ({args.statements}문장 x {args.rows}행, 화물 {args.shipments}개)")
+    print(f"{'style':<10} {'적재(s)':>9} {'반영(s)':>9} {'rows/s':>10} {'문장 p50 ms':>12} {'불일치 화물':>12}")
+    for r in results:
+        print(f"{r['style']:<10} {r['insert_seconds']:>9.2f} {r['project_seconds']:>9.2f} {r['rows_per_sec']:>10.0f} "
+              f"{r['statement_ms_p50']:>12.1f} {r['mismatches']:>7}/{r['touched']:<4}")
+    print("   (none 은 프로젝션을 반영하지 않으므로 불일치가 정상입니다.)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="행 단위 / 문장 단위 / 지연(배치) 트리거 대량 INSERT 비교")
+    parser.add_argument("--backend", choices=list(STYLES), default='mysql')
+    parser.add_argument("--styles", nargs='+', help="비교할 방식 (기본: 백엔드에서 가능한 전부)")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="INSERT 문장 1개당 행 수")
+    parser.add_argument("--statements", type=int, default=DEFAULT_STATEMENTS, help="방식별 INSERT 문장 수")
+    parser.add_argument("--shipments", type=int, default=DEFAULT_SHIPMENTS, help="이력을 흩뿌릴 화물 수")
+    parser.add_argument("--seed", type=int, default=1205)
+    args = parser.parse_args()
+
+    styles = args.styles or list(STYLES[args.backend])
+    unknown = [s for s in styles if s not in STYLES[args.backend]]
+    if unknown:
+        parser.error(f"{args.backend} 에서 지원하지 않는 방식: {', '.join(unknown)} (선택: {', '.join(STYLES[args.backend])})")
+
+    driver = drivers.get_driver(args.backend)
+    conn = driver.connect()
+    try:
+        ensure_version(driver, conn)
+        cursor = conn.cursor()
+        cursor.execute("SELECT shipment_id FROM shipments ORDER BY shipment_id LIMIT %s", (args.shipments,))
+        shipment_ids = [row[0] for row in cursor.fetchall()]
+        conn.commit()
+
+        results = []
+        for style in styles:
+            print(f"🚦 [{style}] 적재 중...")
+            results.append(run_style(driver, conn, style, shipment_ids, args))
+        print_results(results, args)
+    finally:
+        conn.close()